@@ -0,0 +1,391 @@
+"""
+bench.py
+
+Benchmarking t_games.
+
+Every registered game is played headless for a number of seeded rounds. Games
+with bots are played by their bots, with another bot taking the human's seat.
+Games without bots are played by an AutoBot following a script. Most of those
+scripts just answer any set up questions and quit, timing the set up of the
+game, and those runs get a status of 'quit' instead of 'ok'. Recorded games
+(see replay.py) can also be benchmarked, replaying the recorded inputs.
+
+The results can be saved as JSON, and compared to a previous run to flag any
+games that got slower.
+
+Copyright (C) 2018-2020 by Craig O'Brien and the t_games contributors.
+See the top level __init__.py file for details on the t_games license.
+
+Constants:
+DEFAULT_SCRIPT: The AutoBot replies for games without bots. (list of str)
+OPTION_SCRIPTS: AutoBot replies to option questions for specific games. (dict)
+QUIT_SCRIPTS: AutoBot replies to set up and then quit specific games. (dict)
+SCRIPTS: AutoBot replies to play specific games. (dict of str: list of str)
+
+Classes:
+BenchTimeout: A game took longer than allowed to benchmark. (Exception)
+
+Functions:
+bench: Benchmark the games. (dict)
+bench_game: Benchmark one game. (dict)
+bench_replay: Benchmark replaying a recorded game. (dict)
+compare: Find games that have gotten slower. (list of str)
+peak_memory: Get the peak memory used by this process in KB. (int)
+percentile: Get a percentile of some numbers. (float)
+report: Make a text summary of a benchmark. (str)
+set_up_players: Set up a game to be played without a human. (str)
+summarize: Add the timing statistics to a game's benchmark. (None)
+"""
+
+
+from __future__ import print_function
+
+import getopt
+import json
+import os
+import random
+import signal
+import sys
+from timeit import default_timer
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    # Standard imports.
+    from . import game
+    from . import interface
+    from . import replay
+    from .t_tests import unitility
+except (ValueError, ImportError):
+    try:
+        # Imports for running bench.py independently.
+        from t_games import game
+        from t_games import interface
+        from t_games import replay
+        from t_games.t_tests import unitility
+    except ImportError:
+        # Imports for running bench.py from the t_games folder in 2.7.
+        here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        sys.path.insert(0, here)
+        from t_games import game
+        from t_games import interface
+        from t_games import replay
+        from t_games.t_tests import unitility
+
+
+# The AutoBot replies for games without bots.
+DEFAULT_SCRIPT = ['quit'] + ['yes'] * 5
+
+# AutoBot replies to option questions for specific games.
+OPTION_SCRIPTS = {'Calvin Cards': ['yes']}
+
+# AutoBot replies to set up and then quit specific games.
+QUIT_SCRIPTS = {'Global Thermonuclear War': ['no', '1', 'cmd:quit'] + ['yes'] * 5,
+    'Oregon Trail': [200, 0, 0, 0, 0] + DEFAULT_SCRIPT, 'Slot Machines': [1] + DEFAULT_SCRIPT}
+
+# AutoBot replies to play specific games.
+SCRIPTS = {'Hamurabi': ['feed 2000', 'plant 400', 'next'] * 10 + DEFAULT_SCRIPT}
+
+
+class BenchTimeout(Exception):
+    """A game took longer than allowed to benchmark. (Exception)"""
+    pass
+
+
+def bench(rounds = 10, seed = 0, game_names = None, timeout = 30, replay_files = ()):
+    """
+    Benchmark the games. (dict)
+
+    Parameters:
+    rounds: The number of games to play of each game. (int)
+    seed: The base random seed. (int)
+    game_names: The names of the games to benchmark, defaults to all. (list of str)
+    timeout: The maximum seconds to spend on one game, if it can be enforced. (int)
+    replay_files: Recorded games to benchmark replaying. (list of str)
+    """
+    # Get the games to benchmark.
+    games, categories = game.load_games()
+    game_classes = {}
+    for game_class in games.values():
+        if game_class.categories[0] != 'Test Games':
+            game_classes[game_class.name] = game_class
+    if game_names is not None:
+        game_names = [name.lower() for name in game_names]
+        game_classes = {games[name].name: games[name] for name in game_names if name in games}
+    # Benchmark the games.
+    start = default_timer()
+    game_data = [bench_game(game_classes[name], rounds, seed, timeout) for name in sorted(game_classes)]
+    game_data.extend([bench_replay(file_name, games, rounds) for file_name in replay_files])
+    seconds = default_timer() - start
+    # Add up the results (not counting games that just quit).
+    played = [data for data in game_data if data['games'] and data['status'] != 'quit']
+    total_games = sum(data['games'] for data in played)
+    total_turns = sum(data['turns'] for data in played)
+    total_seconds = sum(data['seconds'] for data in played)
+    totals = {'games': total_games, 'turns': total_turns, 'seconds': total_seconds,
+        'games_per_sec': total_games / total_seconds if total_seconds else 0.0,
+        'turns_per_sec': total_turns / total_seconds if total_seconds else 0.0,
+        'wall_seconds': seconds}
+    return {'games': game_data, 'peak_memory_kb': peak_memory(), 'python': sys.version.split()[0],
+        'rounds': rounds, 'seed': seed, 'totals': totals}
+
+
+def bench_game(game_class, rounds, seed, timeout = 30):
+    """
+    Benchmark one game. (dict)
+
+    Parameters:
+    game_class: The game to benchmark. (game.Game)
+    rounds: The number of games to play. (int)
+    seed: The base random seed. (int)
+    timeout: The maximum seconds to spend on the game, if it can be enforced. (int)
+    """
+    data = {'name': game_class.name, 'mode': '', 'status': 'ok', 'error': '', 'games': 0, 'turns': 0,
+        'seconds': 0.0, 'games_per_sec': 0.0, 'turns_per_sec': 0.0, 'p50': 0.0, 'p95': 0.0}
+    latencies = []
+    # Mute the output.
+    save_stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    # Set up a time limit, if possible.
+    use_alarm = timeout and hasattr(signal, 'SIGALRM')
+    if use_alarm:
+        def alarm(signal_number, frame):
+            raise BenchTimeout()
+        old_handler = signal.signal(signal.SIGALRM, alarm)
+        signal.alarm(timeout)
+    try:
+        # Set up the game.
+        random.seed(seed)
+        human = unitility.AutoBot(OPTION_SCRIPTS.get(game_class.name, [])[:])
+        benched = game_class(human, 'none', interface.Interface(human))
+        data['mode'] = set_up_players(benched, human)
+        if game_class.name in SCRIPTS:
+            script = SCRIPTS[game_class.name]
+        else:
+            script = QUIT_SCRIPTS.get(game_class.name, DEFAULT_SCRIPT)
+        benched.headless = True
+        # Play the games.
+        for round_index in range(rounds):
+            human.replies = script[:]
+            human.info, human.errors = [], []
+            random.seed(seed + round_index)
+            start = default_timer()
+            benched.play()
+            latencies.append(default_timer() - start)
+            data['turns'] += benched.turns
+        # Flag script games that just quit.
+        if data['mode'] == 'script' and game_class.name not in SCRIPTS:
+            data['status'] = 'quit'
+    except BenchTimeout:
+        data['status'] = 'timeout'
+    except Exception as err:
+        data['status'] = 'error'
+        data['error'] = '{}: {}'.format(err.__class__.__name__, err)
+    finally:
+        # Clean up.
+        if use_alarm:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, old_handler)
+        sys.stdout.close()
+        sys.stdout = save_stdout
+    summarize(data, latencies)
+    return data
+
+
+def bench_replay(file_name, games, rounds):
+    """
+    Benchmark replaying a recorded game. (dict)
+
+    If the replay does not get the recorded results, the status is 'diverged'.
+
+    Parameters:
+    file_name: The input log file for the recorded game. (str)
+    games: The games by name, as from game.load_games. (dict of str: Game)
+    rounds: The number of times to replay the game. (int)
+    """
+    data = {'name': os.path.basename(file_name), 'mode': 'replay', 'status': 'ok', 'error': '', 'games': 0,
+        'turns': 0, 'seconds': 0.0, 'games_per_sec': 0.0, 'turns_per_sec': 0.0, 'p50': 0.0, 'p95': 0.0}
+    latencies = []
+    try:
+        log = replay.read_log(file_name)
+        game_class = games[log.game_name.lower()]
+        for round_index in range(rounds):
+            start = default_timer()
+            results = replay.replay(game_class, log)
+            latencies.append(default_timer() - start)
+            data['turns'] += results[4]
+            if log.results and results[:6] != log.results:
+                data['status'] = 'diverged'
+    except Exception as err:
+        data['status'] = 'error'
+        data['error'] = '{}: {}'.format(err.__class__.__name__, err)
+    summarize(data, latencies)
+    return data
+
+
+def compare(baseline, current, threshold = 0.1):
+    """
+    Find games that have gotten slower. (list of str)
+
+    Parameters:
+    baseline: The benchmark to compare against. (dict)
+    current: The new benchmark. (dict)
+    threshold: The fraction slower that counts as a regression. (float)
+    """
+    old_data = {data['name']: data for data in baseline['games']}
+    regressions = []
+    for data in current['games']:
+        old = old_data.get(data['name'])
+        if old is None or not old['games_per_sec']:
+            continue
+        if data['status'] != 'ok' and old['status'] == 'ok':
+            regressions.append('{}: status went from ok to {}'.format(data['name'], data['status']))
+        elif data['games_per_sec'] < old['games_per_sec'] * (1 - threshold):
+            change = 1 - data['games_per_sec'] / old['games_per_sec']
+            text = '{}: {:.1f}% slower ({:.2f} -> {:.2f} games/sec)'
+            regressions.append(text.format(data['name'], change * 100, old['games_per_sec'],
+                data['games_per_sec']))
+    return regressions
+
+
+def peak_memory():
+    """Get the peak memory used by this process in KB. (int)"""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Mac OS reports bytes instead of kilobytes.
+    if sys.platform == 'darwin':
+        peak //= 1024
+    return peak
+
+
+def percentile(values, percent):
+    """
+    Get a percentile of some numbers. (float)
+
+    This uses the nearest rank method.
+
+    Parameters:
+    values: The numbers to get the percentile of. (list of float)
+    percent: The percentile to get. (float)
+    """
+    values = sorted(values)
+    rank = max(1, -(-len(values) * percent // 100))
+    return values[int(rank) - 1]
+
+
+def report(results):
+    """
+    Make a text summary of a benchmark. (str)
+
+    Parameters:
+    results: The benchmark results. (dict)
+    """
+    lines = ['Game                       Mode    Status   Games/sec   Turns/sec    p50 (ms)    p95 (ms)']
+    line_format = '{:<26} {:<7} {:<7} {:>10.2f} {:>11.2f} {:>11.3f} {:>11.3f}'
+    for data in results['games']:
+        line_data = (data['name'][:26], data['mode'], data['status'], data['games_per_sec'],
+            data['turns_per_sec'], data['p50'] * 1000, data['p95'] * 1000)
+        lines.append(line_format.format(*line_data))
+    totals = results['totals']
+    lines.append('')
+    lines.append('{} games and {} turns in {:.2f} seconds of play.'.format(totals['games'], totals['turns'],
+        totals['seconds']))
+    lines.append('{:.2f} games/sec, {:.2f} turns/sec, peak memory {} KB.'.format(totals['games_per_sec'],
+        totals['turns_per_sec'], results['peak_memory_kb']))
+    return '\n'.join(lines)
+
+
+def set_up_players(bench_game, human):
+    """
+    Set up a game to be played without a human. (str)
+
+    If the game has bots, another bot takes the human's place, and the return
+    value is 'bots'. Otherwise the human is left to follow a script, and the
+    return value is 'script'.
+
+    Parameters:
+    bench_game: The game to set up. (game.Game)
+    human: The AutoBot set up as the game's human. (unitility.AutoBot)
+    """
+    bots = [player for player in bench_game.players if player is not human]
+    if not bots:
+        return 'script'
+    # Get another bot, preferably of the default type.
+    if bench_game.option_set.default_bots:
+        bot_class, params = bench_game.option_set.default_bots[0]
+    else:
+        bot_class, params = bots[0].__class__, ()
+    try:
+        new_bot = bot_class(*params, taken_names = [bot.name for bot in bots])
+    except TypeError:
+        return 'script'
+    bench_game.set_players([new_bot] + bots)
+    return 'bots'
+
+
+def summarize(data, latencies):
+    """
+    Add the timing statistics to a game's benchmark. (None)
+
+    Parameters:
+    data: The benchmark data for the game. (dict)
+    latencies: The seconds taken to play each game. (list of float)
+    """
+    if latencies:
+        data['games'] = len(latencies)
+        data['seconds'] = sum(latencies)
+        if data['seconds']:
+            data['games_per_sec'] = data['games'] / data['seconds']
+            data['turns_per_sec'] = data['turns'] / data['seconds']
+        data['p50'] = percentile(latencies, 50)
+        data['p95'] = percentile(latencies, 95)
+
+
+if __name__ == '__main__':
+    # Get any options.
+    try:
+        opts, args = getopt.getopt(sys.argv[1:], 'c:g:jn:o:r:s:t:')
+    except getopt.GetoptError as err:
+        print(err)
+        sys.exit(2)
+    settings = {'rounds': 10, 'seed': 0, 'game_names': None, 'timeout': 30, 'replay_files': []}
+    baseline_file, output_file, show_json = '', '', False
+    for option, value in opts:
+        if option == '-c':
+            baseline_file = value
+        elif option == '-g':
+            settings['game_names'] = (settings['game_names'] or []) + [value]
+        elif option == '-j':
+            show_json = True
+        elif option == '-n':
+            settings['rounds'] = int(value)
+        elif option == '-o':
+            output_file = value
+        elif option == '-r':
+            settings['replay_files'].append(value)
+        elif option == '-s':
+            settings['seed'] = int(value)
+        elif option == '-t':
+            settings['timeout'] = int(value)
+    # Run the benchmark.
+    results = bench(**settings)
+    if show_json:
+        print(json.dumps(results, indent = 2, sort_keys = True))
+    else:
+        print(report(results))
+    if output_file:
+        with open(output_file, 'w') as json_file:
+            json.dump(results, json_file, indent = 2, sort_keys = True)
+    # Check for regressions.
+    if baseline_file:
+        with open(baseline_file) as json_file:
+            baseline = json.load(json_file)
+        regressions = compare(baseline, results)
+        for regression in regressions:
+            print('REGRESSION: {}'.format(regression))
+        if regressions:
+            sys.exit(1)
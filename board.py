@@ -6,22 +6,36 @@ Boards for text games.
 Copyright (C) 2018-2020 by Craig O'Brien and the t_games contributors.
 See the top level __init__.py file for details on the t_games license.
 
+Constants:
+GEOMETRIES: The shared geometry for each size of board. (dict of tuple: Geometry)
+
 Classes:
 BoardCell: A square (or other shape) in a board that holds one piece. (object)
+ArrayCell: A board cell stored as an index into a board's piece list. (BoardCell)
 MultiCell: A position on a board that holds multiple pieces. (object)
 Coordinate: A cartesian coordinate in an n-dimensional space. (tuple)
+Geometry: The cells of a grid and the lines between them. (object)
+ArrayCells: A mapping of locations to the cells of an array board. (Mapping)
 Board: A playing board for a game. (object)
 DimBoard: A board of squares in variable dimensions. (Board)
+ArrayBoard: A board of squares stored as a flat list of pieces. (DimBoard)
 LineBoard: A board of spaces in a line. (Board)
 MultiBoard: A board with multiple pieces per cell. (Board)
+
+Functions:
+geometry: Get the shared geometry for a size of board. (Geometry)
 """
 
 
 try:
-    from collections.abc import MutableSequence
+    from collections.abc import Mapping, MutableSequence
 except ImportError:
-    from collections import MutableSequence
+    from collections import Mapping, MutableSequence
 import itertools
+import random
+
+
+GEOMETRIES = {}
 
 
 class BoardCell(object):
@@ -187,6 +201,45 @@ class BoardCell(object):
         return piece
 
 
+class ArrayCell(BoardCell):
+    """
+    A board cell stored as an index into a board's piece list. (BoardCell)
+
+    Array cells are views: they hold no piece themselves, but read and write the
+    contents list of the board they belong to.
+
+    Attributes:
+    board: The board the cell is a view of. (ArrayBoard)
+    index: The position of the cell in the board's contents. (int)
+
+    Overridden Methods:
+    __init__
+    """
+
+    def __init__(self, board, index, empty = ' '):
+        """
+        Initialize the cell. (None)
+
+        Parameters:
+        board: The board the cell is a view of. (ArrayBoard)
+        index: The position of the cell in the board's contents. (int)
+        empty: How the cell looks when empty. (str)
+        """
+        self.board = board
+        self.index = index
+        self.location = board.coordinates[index]
+        self.empty = empty
+
+    @property
+    def contents(self):
+        """The piece that is in the cell. (object)"""
+        return self.board.contents[self.index]
+
+    @contents.setter
+    def contents(self, piece):
+        self.board.put(self.index, piece)
+
+
 class MultiCell(BoardCell):
     """
     A position on a board that holds multiple pieces. (object)
@@ -590,6 +643,196 @@ class Coordinate(tuple):
             return NotImplemented
 
 
+class Geometry(object):
+    """
+    The cells of a grid and the lines between them. (object)
+
+    Each cell of the grid has an index, in the order that DimBoard creates its
+    cells. The tables of neighbors and lines are built the first time they are
+    asked for, and are lists by index. Geometries should be gotten with the
+    geometry function, so that every board of the same size shares them.
+
+    The piece keys are random 64-bit numbers for each piece in each cell, for
+    Zobrist hashing: the hash of a position is the exclusive or of the keys of
+    the pieces on the board. Keys are made the first time a piece is seen in a
+    cell, from a random number generator seeded by the dimensions.
+
+    Attributes:
+    coordinates: The location of each index. (list of Coordinate)
+    dimensions: The size of the grid, in cells. (tuple of int)
+    indexes: The index of each location. (dict of Coordinate: int)
+    key_rng: The random number generator for piece keys. (random.Random)
+    piece_keys: The Zobrist keys of the pieces in each cell. (list of dict)
+    tables: The tables built so far. (dict)
+
+    Methods:
+    neighbors: Get the cells around each cell. (list of tuple of int)
+    piece_key: Get the Zobrist key for a piece in a cell. (int)
+    rays: Get every line of cells of a given length. (list of tuple of int)
+    step: Get the cell offset from each cell. (list of int)
+
+    Overridden Methods:
+    __init__
+    __repr__
+    """
+
+    def __init__(self, dimensions):
+        """
+        Set up the locations and indexes. (None)
+
+        Parameters:
+        dimensions: The size of the grid, in cells. (tuple of int)
+        """
+        self.dimensions = tuple(dimensions)
+        locations = itertools.product(*[range(1, dimension + 1) for dimension in self.dimensions])
+        self.coordinates = [Coordinate(location) for location in locations]
+        self.indexes = {location: index for index, location in enumerate(self.coordinates)}
+        self.tables = {}
+        # Set up the hashing keys.
+        self.key_rng = random.Random(repr(self.dimensions))
+        self.piece_keys = [{} for location in self.coordinates]
+
+    def __repr__(self):
+        """Generate a debugging text representation. (str)"""
+        return 'Geometry({!r})'.format(self.dimensions)
+
+    def neighbors(self, offsets):
+        """
+        Get the cells around each cell. (list of tuple of int)
+
+        The neighbors of a cell are in the same order as the offsets, skipping any
+        that are off the grid.
+
+        Parameters:
+        offsets: The relative locations of the neighbors. (tuple of tuple of int)
+        """
+        key = ('neighbors', tuple(offsets))
+        if key not in self.tables:
+            steps = [self.step(offset) for offset in offsets]
+            table = []
+            for index in range(len(self.coordinates)):
+                table.append(tuple([step[index] for step in steps if step[index] is not None]))
+            self.tables[key] = table
+        return self.tables[key]
+
+    def piece_key(self, index, piece):
+        """
+        Get the Zobrist key for a piece in a cell. (int)
+
+        Parameters:
+        index: The index of the cell. (int)
+        piece: The piece in the cell. (hashable)
+        """
+        keys = self.piece_keys[index]
+        if piece not in keys:
+            keys[piece] = self.key_rng.getrandbits(64)
+        return keys[piece]
+
+    def rays(self, offsets, length):
+        """
+        Get every line of cells of a given length. (list of tuple of int)
+
+        Each line starts at a cell and goes in the direction of one of the offsets.
+        Lines that would go off the grid are not included.
+
+        Parameters:
+        offsets: The directions of the lines. (tuple of tuple of int)
+        length: The number of cells in each line. (int)
+        """
+        key = ('rays', tuple(offsets), length)
+        if key not in self.tables:
+            table = []
+            for index in range(len(self.coordinates)):
+                for offset in offsets:
+                    step = self.step(offset)
+                    ray = [index]
+                    while len(ray) < length and ray[-1] is not None:
+                        ray.append(step[ray[-1]])
+                    if ray[-1] is not None:
+                        table.append(tuple(ray))
+            self.tables[key] = table
+        return self.tables[key]
+
+    def step(self, offset):
+        """
+        Get the cell offset from each cell. (list of int)
+
+        The value for cells where the offset goes off the grid is None.
+
+        Parameters:
+        offset: The relative location of the target cell. (tuple of int)
+        """
+        key = tuple(offset)
+        if key not in self.tables:
+            table = []
+            for location in self.coordinates:
+                table.append(self.indexes.get(location + key))
+            self.tables[key] = table
+        return self.tables[key]
+
+
+class ArrayCells(Mapping):
+    """
+    A mapping of locations to the cells of an array board. (Mapping)
+
+    This provides the cells attribute of an ArrayBoard, so that code written for
+    a dictionary of cells works on the flat list of pieces. Cells are created as
+    they are asked for, and cells can not be added or deleted.
+
+    Attributes:
+    board: The board the cells are views of. (ArrayBoard)
+    views: The cells created so far. (dict of Coordinate: ArrayCell)
+
+    Overridden Methods:
+    __init__
+    __contains__
+    __getitem__
+    __iter__
+    __len__
+    """
+
+    def __init__(self, board):
+        """
+        Set up the mapping. (None)
+
+        Parameters:
+        board: The board the cells are views of. (ArrayBoard)
+        """
+        self.board = board
+        self.views = {}
+
+    def __contains__(self, location):
+        """
+        Check for a location being on the board. (bool)
+
+        Parameters:
+        location: Coordinates for a cell. (Coordinate)
+        """
+        return location in self.board.indexes
+
+    def __getitem__(self, location):
+        """
+        Get the cell for a location. (ArrayCell)
+
+        Parameters:
+        location: Coordinates for a cell. (Coordinate)
+        """
+        try:
+            return self.views[location]
+        except KeyError:
+            cell = ArrayCell(self.board, self.board.indexes[location])
+            self.views[location] = cell
+            return cell
+
+    def __iter__(self):
+        """Iterate over the locations in the board. (iterator)"""
+        return iter(self.board.coordinates)
+
+    def __len__(self):
+        """The number of cells on the board. (int)"""
+        return len(self.board.coordinates)
+
+
 class Board(object):
     """
     A playing board for a game. (object)
@@ -899,6 +1142,7 @@ class DimBoard(Board):
     Attributes:
     cell_class: The class defining the individual cells. (type)
     dimensions: The dimensions of the board, in cells. (tuple of int)
+    geometry: The locations and neighbors of the cells. (Geometry)
 
     Methods:
     copy: Create a copy of the board. (DimBoard)
@@ -906,6 +1150,7 @@ class DimBoard(Board):
     Overridden Methods:
     __init__
     __repr__
+    offset
     """
 
     def __init__(self, dimensions, cell_class = BoardCell):
@@ -919,11 +1164,9 @@ class DimBoard(Board):
         # Store the definition.
         self.dimensions = dimensions
         self.cell_class = cell_class
-        # Calculate the locations.
-        locations = itertools.product(*[range(1, dimension + 1) for dimension in self.dimensions])
-        locations = [Coordinate(location) for location in locations]
+        self.geometry = geometry(dimensions)
         # Set up the cells.
-        super(DimBoard, self).__init__(locations, cell_class)
+        super(DimBoard, self).__init__(self.geometry.coordinates, cell_class)
 
     def __repr__(self):
         """Create a debugging text representation. (str)"""
@@ -937,6 +1180,138 @@ class DimBoard(Board):
         clone.copy_pieces(self)
         return clone
 
+    def offset(self, cell, offset):
+        """
+        Return a cell offset from another cell (BoardCell)
+
+        Parameters:
+        cell: The location of the starting cell. (Coordinate)
+        offset: The relative location of the target cell. (Coordinate)
+        """
+        index = self.geometry.indexes.get(cell)
+        if index is None:
+            return super(DimBoard, self).offset(cell, offset)
+        target = self.geometry.step(offset)[index]
+        if target is None:
+            raise KeyError(Coordinate(cell) + offset)
+        return self.cells[self.geometry.coordinates[target]]
+
+
+class ArrayBoard(DimBoard):
+    """
+    A board of squares stored as a flat list of pieces. (DimBoard)
+
+    Each location is an index into the contents list, in the same order that
+    DimBoard creates its cells. The maps between coordinates and indexes are
+    computed once for each set of dimensions and shared by all boards with those
+    dimensions, so copying a board is a single slice of the contents. The cells
+    attribute is a view of the contents, so the Board methods still work.
+
+    The board keeps a Zobrist hash of the position up to date as pieces are put
+    on it, so pieces must be hashable. Changes to the contents should be made
+    with put (or through the cells), not by setting the list directly.
+
+    Attributes:
+    contents: The piece in each cell, None for empty. (list)
+    coordinates: The location of each index. (list of Coordinate)
+    indexes: The index of each location. (dict of Coordinate: int)
+    zobrist: The Zobrist hash of the position. (int)
+
+    Methods:
+    put: Put a piece in the cell at an index. (object)
+    rehash: Recalculate the Zobrist hash from the contents. (None)
+
+    Overridden Methods:
+    __init__
+    clear
+    copy
+    copy_pieces
+    place
+    """
+
+    def __init__(self, dimensions):
+        """
+        Set up the list of pieces. (None)
+
+        Parameters:
+        dimensions: The dimensions of the board, in cells. (tuple of int)
+        """
+        # Store the definition.
+        self.dimensions = tuple(dimensions)
+        self.cell_class = ArrayCell
+        # Get the maps between coordinates and indexes.
+        self.geometry = geometry(self.dimensions)
+        self.coordinates = self.geometry.coordinates
+        self.indexes = self.geometry.indexes
+        # Set up the cells.
+        self.contents = [None] * len(self.coordinates)
+        self.cells = ArrayCells(self)
+        self.extra_cells = []
+        self.zobrist = 0
+
+    def clear(self):
+        """Clear all pieces off the board. (None)"""
+        self.contents[:] = [None] * len(self.contents)
+        self.zobrist = 0
+
+    def copy(self, **kwargs):
+        """Create a copy of the board. (ArrayBoard)"""
+        # Copy the attributes without initializing.
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        # Copy the pieces.
+        clone.contents = self.contents[:]
+        clone.cells = ArrayCells(clone)
+        return clone
+
+    def copy_pieces(self, parent):
+        """
+        Copy all of the pieces from another board. (None)
+
+        Parameters:
+        parent: The board to copy pieces from. (Board)
+        """
+        if getattr(parent, 'indexes', None) is self.indexes:
+            self.contents[:] = parent.contents
+            self.zobrist = parent.zobrist
+        else:
+            super(ArrayBoard, self).copy_pieces(parent)
+
+    def place(self, cell, piece):
+        """
+        Place a piece in a cell. (None)
+
+        Paramters:
+        cell: The location to place the piece in. (Coordinate)
+        piece: The piece to place on the board. (object)
+        """
+        self.put(self.indexes[cell], piece)
+
+    def put(self, index, piece):
+        """
+        Put a piece in the cell at an index. (object)
+
+        The return value is the piece that was in the cell before.
+
+        Parameters:
+        index: The index of the cell. (int)
+        piece: The piece to put in the cell, None for empty. (hashable)
+        """
+        old_piece = self.contents[index]
+        if old_piece is not None:
+            self.zobrist ^= self.geometry.piece_key(index, old_piece)
+        if piece is not None:
+            self.zobrist ^= self.geometry.piece_key(index, piece)
+        self.contents[index] = piece
+        return old_piece
+
+    def rehash(self):
+        """Recalculate the Zobrist hash from the contents. (None)"""
+        self.zobrist = 0
+        for index, piece in enumerate(self.contents):
+            if piece is not None:
+                self.zobrist ^= self.geometry.piece_key(index, piece)
+
 
 class LineBoard(Board):
     """
@@ -1046,6 +1421,19 @@ class MultiBoard(DimBoard):
         self.cells[cell].piece.append(piece)
 
 
+def geometry(dimensions):
+    """
+    Get the shared geometry for a size of board. (Geometry)
+
+    Parameters:
+    dimensions: The size of the board, in cells. (tuple of int)
+    """
+    dimensions = tuple(dimensions)
+    if dimensions not in GEOMETRIES:
+        GEOMETRIES[dimensions] = Geometry(dimensions)
+    return GEOMETRIES[dimensions]
+
+
 if __name__ == '__main__':
     # Run the unit testing.
     from t_tests.board_test import *
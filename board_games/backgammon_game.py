@@ -1411,7 +1411,7 @@ class Backgammon(game.Game):
         # Set up the dice.
         self.doubling_die = 1
         self.doubling_status = ''
-        self.dice = dice.Pool()
+        self.dice = dice.Pool(rng = self.rng)
         while self.dice.values[0] == self.dice.values[1]:
             self.dice.roll()
         if self.dice.values[0] < self.dice.values[1]:
@@ -555,10 +555,9 @@ class SeaBoard(board.DimBoard):
         """
         if isinstance(square, str):
             square = self.convert(square)
-        for offset in ((0, 1), (1, 0), (0, -1), (-1, 0)):
-            adjacent = square + offset
-            if adjacent in self.cells:
-                yield adjacent
+        neighbors = self.geometry.neighbors(((0, 1), (1, 0), (0, -1), (-1, 0)))
+        for adjacent in neighbors[self.geometry.indexes[square]]:
+            yield self.geometry.coordinates[adjacent]
 
     def convert(self, square):
         """
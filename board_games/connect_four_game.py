@@ -10,13 +10,14 @@ Constants:
 CREDITS: The design and programming credits for Connect Four. (str)
 OPTIONS: The options for Connect Four. (str)
 RULES: The rules to Connect Four. (str)
+TIME_LIMITS: The default seconds per move for each bot level. (dict of str: int)
 
 Classes:
 C4BotAlphaBeta: A Connect Four bot with a tree search and alpha beta
     pruning. (player.Bot)
 C4BotGamma: An alpha-beta Connect Four bot with a better eval
     function. (C4BotAlphaBeta)
-C4Board: A board for Connect Four type games. (board.DimBoard)
+C4Board: A board for Connect Four type games. (board.ArrayBoard)
 ConnectFour: A game of connect four. (game.Game)
 """
 
@@ -29,7 +30,6 @@ import string
 from .. import board
 from .. import game
 from .. import player
-from .. import utility
 
 
 CREDITS = """
@@ -47,6 +47,10 @@ gonzo: Equivalent to 'columns = 7 rows = 18 pop'.
 pop (p): Allow pop moves, where you remove a piece of yours that is at the
     bottom of a column.
 rows: (r): How many rows the board should have (4-20, default 6).
+time-limit= (tl=): The most seconds the computer opponent may spend on a move,
+    or 0 for no limit. The default is 1 for easy, 2 for medium, and 5 for hard.
+    Replays and benchmarks ignore the limit and search to the full depth, so a
+    recorded game only replays the same way if the limit never cut a search short.
 """
 
 RULES = """
@@ -58,6 +62,10 @@ are filled, the game is a draw.
 """
 
 
+# The default seconds per move for each bot level.
+TIME_LIMITS = {'e': 1, 'm': 2, 'h': 5}
+
+
 class C4BotAlphaBeta(player.AlphaBetaBot):
     """
     A Connect Four bot with a tree search and alpha beta pruning. (player.Bot)
@@ -78,17 +86,18 @@ class C4BotAlphaBeta(player.AlphaBetaBot):
     set_up
     """
 
-    def __init__(self, depth = 6, fudge = 1, taken_names = [], initial = ''):
+    def __init__(self, depth = 6, fudge = 1, taken_names = [], initial = '', time_limit = 0):
         """
         Set up the bot. (None)
 
         Parameters:
-        depth: The depth of the search. (int)
+        depth: The maximum depth of the search. (int)
         fudge: A fudge factor to avoid early capitulation. (int or float)
         taken_names: Names already used by a player. (list of str)
         initial: The first letter of the bot's name. (str)
+        time_limit: The maximum seconds per search, or 0 for no limit. (float)
         """
-        super(C4BotAlphaBeta, self).__init__(depth, fudge, taken_names, initial)
+        super(C4BotAlphaBeta, self).__init__(depth, fudge, taken_names, initial, time_limit)
 
     def ask(self, prompt):
         """
@@ -120,8 +129,7 @@ class C4BotAlphaBeta(player.AlphaBetaBot):
         high: The highest valid input. (int)
         """
         clone = self.game.board.copy()
-        results = self.alpha_beta(clone, self.depth, -utility.MAX_INT, utility.MAX_INT, True)
-        return results[0][0]
+        return self.search(clone)[0]
 
     def eval_board(self, board):
         """
@@ -161,7 +169,7 @@ class C4BotAlphaBeta(player.AlphaBetaBot):
         # get the player's piece symbol
         piece = self.game.symbols[player_index]
         # check board value of pieces
-        locations = [location for location, cell in board.cells.items() if cell.contents == piece]
+        locations = [board.coordinates[index] for index, contents in enumerate(board.contents) if contents == piece]
         score = 0
         for column, row in locations:
             score += self.board_strength[column][row]
@@ -280,7 +288,7 @@ class C4BotGamma(C4BotAlphaBeta):
         # get the player's piece symbol.
         piece = self.game.symbols[player_index]
         # Check board value of pieces.
-        locations = [location for location, cell in board.cells.items() if cell.contents == piece]
+        locations = [board.coordinates[index] for index, contents in enumerate(board.contents) if contents == piece]
         score = 0
         for column, row in locations:
             score += self.board_strength[column][row]
@@ -291,14 +299,15 @@ class C4BotGamma(C4BotAlphaBeta):
         return score
 
 
-class C4Board(board.DimBoard):
+class C4Board(board.ArrayBoard):
     """
-    A board for Connect Four type games. (board.DimBoard)
+    A board for Connect Four type games. (board.ArrayBoard)
 
     Attributes:
     pieces: The pieces to be played. (str)
     poppable: A flag for being able to pop pieces. (bool)
     pops: How many pieces have been popped. (int)
+    win_indexes: The winning combinations as board indexes. (list of frozenset of int)
     wins: Winning four in a row combinations. (list of set of tuple)
 
     Methods:
@@ -307,12 +316,13 @@ class C4Board(board.DimBoard):
     last_piece: Get the last piece played. (str)
     make_move: Make a valid move. (None)
     pop: Remove the bottom piece of a column. (None)
+    unmake_move: Take back a move made with make_move. (None)
+    unpop: Put a popped piece back in the bottom of a column. (None)
 
     Overridden Methods:
     __init__
     __repr__
     __str__
-    copy
     get_moves
     """
 
@@ -333,28 +343,16 @@ class C4Board(board.DimBoard):
         self.poppable = poppable
         # Set the default attribute.
         self.pops = 0
-        # set up winning positions
+        # Set up the winning positions.
         self.wins = wins
         if not self.wins:
-            # Loop through all the spaces.
-            for col in range(1, dimensions[0] + 1):
-                for row in range(1, dimensions[1] + 1):
-                    # Record any win to the right.
-                    if col < dimensions[0] - 2:
-                        win = ((col, row), (col + 1, row), (col + 2, row), (col + 3, row))
-                        self.wins.append(set([board.Coordinate(xy) for xy in win]))
-                    if row < dimensions[0] - 2:
-                        # Record any win up.
-                        win = ((col, row), (col, row + 1), (col, row + 2), (col, row + 3))
-                        self.wins.append(set(set([board.Coordinate(xy) for xy in win])))
-                        if col < dimensions[0] - 2:
-                            # Record any win up to the right.
-                            win = ((col, row), (col + 1, row + 1), (col + 2, row + 2), (col + 3, row + 3))
-                            self.wins.append(set([board.Coordinate(xy) for xy in win]))
-                        if col > 3:
-                            # Record any win up to the left.
-                            win = ((col, row), (col - 1, row + 1), (col - 2, row + 2), (col - 3, row + 3))
-                            self.wins.append(set([board.Coordinate(xy) for xy in win]))
+            rays = self.geometry.rays(((1, 0), (0, 1), (1, 1), (-1, 1)), 4)
+            self.wins = [set([self.coordinates[index] for index in ray]) for ray in rays]
+        # Index the winning positions that are on the board.
+        self.win_indexes = []
+        for win in self.wins:
+            if all([location in self.indexes for location in win]):
+                self.win_indexes.append(frozenset([self.indexes[location] for location in win]))
 
     def __repr__(self):
         """Generate a debugging text representation."""
@@ -383,18 +381,16 @@ class C4Board(board.DimBoard):
 
     def check_win(self):
         """See if the game has been won. (str)"""
-        # Get the locations with each player's pieces
+        # Check each player's pieces against the winning positions.
         winners = []
         for piece in self.pieces:
-            played = set([cell.location for cell in self.cells.values() if cell.contents == piece])
-            # check against the winning positions
-            for win in self.wins:
+            played = set([index for index, contents in enumerate(self.contents) if contents == piece])
+            for win in self.win_indexes:
                 if win <= played:
                     winners.append(piece)
                     break
         # Check for a draw.
-        full = [cell for cell in self.cells.values() if cell.contents]
-        filled = len(full) == self.dimensions[0] * self.dimensions[1]
+        filled = None not in self.contents
         if filled or len(winners) == 2:
             result = 'draw'
         # Check for a win.
@@ -413,34 +409,30 @@ class C4Board(board.DimBoard):
         column: The column to check. (int)
         """
         # Check rows until you get an empty cell.
-        for row in range(1, self.dimensions[1] + 1):
-            if not self.cells[(column, row)].contents:
-                break
-        return row - 1
-
-    def copy(self):
-        """Create a copy of the board for AI searches. (Connect4Board)"""
-        clone = C4Board(self.dimensions, pieces = self.pieces, wins = self.wins, poppable = self.poppable)
-        clone.copy_pieces(self)
-        return clone
+        bottom = self.indexes[(column, 1)]
+        height = 0
+        while height < self.dimensions[1] and self.contents[bottom + height]:
+            height += 1
+        return height
 
     def get_moves(self):
         """
         Get all legal moves from the current position. (list of (int, string))
         """
         # get the current piece
-        pieces_played = len([cell for cell in self.cells.values() if cell.contents])
+        contents, indexes = self.contents, self.indexes
+        pieces_played = len(contents) - contents.count(None)
         current_piece = self.pieces[pieces_played % 2]
         # get the open columns
         columns = []
         for column in range(1, self.dimensions[0] + 1):
-            if not self.cells[(column, self.dimensions[1])]:
+            if contents[indexes[(column, self.dimensions[1])]] is None:
                 columns.append(column)
         # add the poppable columns, if popping is allowed.
         if self.poppable:
             valid_pops = []
             for column in range(1, self.dimensions[0] + 1):
-                if self.cells[(column, 1)].contents == current_piece:
+                if contents[indexes[(column, 1)]] == current_piece:
                     valid_pops.append(-column)
             columns.extend(valid_pops)
         # return the columns with the current piece.
@@ -448,7 +440,7 @@ class C4Board(board.DimBoard):
 
     def last_piece(self):
         """Get the last piece played. (str)"""
-        pieces_played = len([cell for cell in self.cells.values() if cell.contents])
+        pieces_played = len(self.contents) - self.contents.count(None)
         return self.pieces[1 - pieces_played % 2]
 
     def make_move(self, move):
@@ -466,7 +458,7 @@ class C4Board(board.DimBoard):
         else:
             # Check the validity of the move.
             height = self.column_height(column)
-            if height <= self.dimensions[1]:
+            if height < self.dimensions[1]:
                 self.place((column, height + 1), piece)
             else:
                 raise ValueError('Invalid move: column {} is full'.format(column))
@@ -482,17 +474,59 @@ class C4Board(board.DimBoard):
         # Convert the column.
         column = abs(column)
         # Check for a valid move.
-        if self.cells[(column, 1)].contents == piece:
+        bottom = self.indexes[(column, 1)]
+        top = bottom + self.dimensions[1]
+        if self.contents[bottom] == piece:
             # Move the pieces down.
-            for row in range(2, self.dimensions[1] + 1):
-                self.cells[(column, row - 1)].contents = self.cells[(column, row)].contents
-            self.cells[(column, self.dimensions[1])].contents = None
+            for index in range(bottom, top - 1):
+                self.put(index, self.contents[index + 1])
+            self.put(top - 1, None)
             # Record the pop.
             self.pops += 1
         else:
             # Warn on invalid pops.
             raise ValueError('Invalid pop: column {} does not start with {!r}.'.format(column, piece))
 
+    def unmake_move(self, move):
+        """
+        Take back a move made with make_move. (None)
+
+        Parameters:
+        move: A column and the piece dropped in it. (tuple of int, string)
+        """
+        # get the details of the move
+        column, piece = move
+        # Check for a pop move.
+        if column < 0 and self.poppable:
+            self.unpop(column, piece)
+        else:
+            # Check that the piece is on top of the column.
+            height = self.column_height(column)
+            top = self.indexes[(column, 1)] + height - 1
+            if height and self.contents[top] == piece:
+                self.put(top, None)
+            else:
+                raise ValueError('Invalid unmove: column {} does not end with {!r}.'.format(column, piece))
+
+    def unpop(self, column, piece):
+        """
+        Put a popped piece back in the bottom of a column. (None)
+
+        Parameters:
+        column: The negative (one indexed) column that was popped. (int)
+        piece: The piece that was popped. (str)
+        """
+        # Convert the column.
+        column = abs(column)
+        # Move the pieces up.
+        bottom = self.indexes[(column, 1)]
+        top = bottom + self.dimensions[1]
+        for index in range(top - 1, bottom, -1):
+            self.put(index, self.contents[index - 1])
+        self.put(bottom, piece)
+        # Remove the pop.
+        self.pops -= 1
+
 
 class ConnectFour(game.Game):
     """
@@ -510,6 +544,7 @@ class ConnectFour(game.Game):
     poppable: A flag for being able to pop a piece from a column. (bool)
     rows: The height of the board. (int)
     symbols: The symbols for the players pieces. (list of str)
+    time_limit: The maximum seconds for the bot's moves when not headless. (float)
 
     Overridden methods:
     __str__
@@ -526,7 +561,7 @@ class ConnectFour(game.Game):
     categories = ['Board Games']
     credits = CREDITS
     name = 'Connect Four'
-    num_options = 4
+    num_options = 5
     options = OPTIONS
     rules = RULES
 
@@ -599,12 +634,14 @@ class ConnectFour(game.Game):
         """Determine and handle the options for the game. (None)"""
         super(ConnectFour, self).handle_options()
         # Set the bot.
+        if self.time_limit is None:
+            self.time_limit = TIME_LIMITS[self.bot_level[0]]
         if self.bot_level.startswith('e'):
-            self.bot = C4BotAlphaBeta(taken_names = [self.human.name])
+            self.bot = C4BotAlphaBeta(taken_names = [self.human.name], time_limit = self.time_limit)
         elif self.bot_level.startswith('m'):
-            self.bot = C4BotGamma(taken_names = [self.human.name])
+            self.bot = C4BotGamma(taken_names = [self.human.name], time_limit = self.time_limit)
         else:
-            self.bot = C4BotGamma(depth = 8, taken_names = [self.human.name])
+            self.bot = C4BotGamma(depth = 8, taken_names = [self.human.name], time_limit = self.time_limit)
         self.players = [self.human, self.bot]
         self.symbols = []
 
@@ -618,10 +655,13 @@ class ConnectFour(game.Game):
         # Set the play option.
         self.option_set.add_option('pop', ['p'], target = 'poppable',
             question = 'Should you be able to pop out the bottom piece in a row? bool')
-        # Set the bot option.
+        # Set the bot options, with no time limit setting meaning the level's default.
         self.option_set.add_option('bot-level', ['b'],
             valid = ['easy', 'e', 'medium', 'm', 'hard', 'h'], default = 'medium',
             question = 'How hard of a bot do you want to play against (return for medium)? ')
+        self.time_limit = None
+        self.option_set.add_option('time-limit', ['tl'], float, None, check = lambda seconds: seconds >= 0,
+            question = 'How many seconds should the bot have to move (return for the level default)? ')
         # Set the option groups.
         self.option_set.add_group('gonzo', ['gz'], 'rows = 18 pop')
 
@@ -672,6 +712,7 @@ class ConnectFour(game.Game):
         # reset board
         self.board = C4Board((self.columns, self.rows), poppable = self.poppable)
         self.board.pieces = self.symbols
-        # reset the bot
+        # reset the bot, without a time limit if no one is waiting on it
+        self.bot.time_limit = 0 if self.headless else self.time_limit
         self.bot.set_up()
         self.bot_random = False
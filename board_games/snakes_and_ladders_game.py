@@ -103,7 +103,7 @@ class SnakeBoard(board.LineBoard):
         self.game = game
         self.exact = game.exact
         self.stomp = game.stomp
-        self.die = dice.Die()
+        self.die = dice.Die(rng = game.rng)
         # Get the piece to player mapping.
         self.piece_to_player = {piece: name for name, piece in game.pieces.items()}
         # Get the layout.
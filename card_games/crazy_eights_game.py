@@ -147,7 +147,7 @@ class Crazy8Bot(player.Bot):
             return suit
         # Avoid forced draw.
         elif prompt.endswith('(return to draw)? '):
-            card = random.choice(self.rank_matches)
+            card = self.game.rng.choice(self.rank_matches)
             self.game.human.tell('{} played the {}.'.format(self.name, card.rank + card.suit))
             return str(card)
         # Raise an error if you weren't programmed to handle the question.
@@ -220,7 +220,7 @@ class CrazySmartBot(Crazy8Bot):
             return suit
         # Avoid forced draw.
         elif prompt.endswith('(return to draw)? '):
-            card = random.choice(self.rank_matches)
+            card = self.game.rng.choice(self.rank_matches)
             self.game.human.tell('{} played the {}.'.format(self.name, card.rank + card.suit))
             return str(card)
         # Raise an error if you weren't programmed to handle the question.
@@ -771,9 +771,9 @@ class CrazyEights(game.Game):
         """Set up the game. (None)"""
         # Set up the deck.
         if len(self.players) < 6:
-            self.deck = cards.Deck(shuffle_size = -1)
+            self.deck = cards.Deck(shuffle_size = -1, rng = self.rng)
         else:
-            self.deck = cards.Deck(decks = 2, shuffle_size = -1)
+            self.deck = cards.Deck(decks = 2, shuffle_size = -1, rng = self.rng)
         self.all_ranks = self.deck.rank_set.chars
         # Perform a mental health evaluation.
         self.mental_health()
@@ -789,7 +789,7 @@ class CrazyEights(game.Game):
         self.hands = self.deck.player_hands(self.players)
         self.deal()
         # Randomize the players.
-        random.shuffle(self.players)
+        self.rng.shuffle(self.players)
 
     def validate_card(self, player, card_text):
         """
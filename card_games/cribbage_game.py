@@ -812,7 +812,7 @@ class Cribbage(game.Game):
     def set_up(self):
         """Set up the game. (None)"""
         # Set the players.
-        random.shuffle(self.players)
+        self.rng.shuffle(self.players)
         # set up the tracking variables.
         self.phase = 'deal'
         self.card_total = 0
@@ -820,7 +820,7 @@ class Cribbage(game.Game):
         self.match_scores = {player.name: 0 for player in self.players}
         self.double_pairs = False
         # Set up the deck.
-        self.deck = cards.Deck()
+        self.deck = cards.Deck(rng = self.rng)
         self.deck.shuffle()
         # Set up the hands.
         self.hands = self.deck.player_hands(self.players)
@@ -829,7 +829,7 @@ class Cribbage(game.Game):
         self.in_play['Play Sequence'] = cards.Hand(deck = self.deck)
         # Pick the dealer.
         if self.no_pick:
-            random.shuffle(self.players)
+            self.rng.shuffle(self.players)
             self.dealer_index = -1
         else:
             players = self.players[:]
@@ -958,7 +958,7 @@ class CribBot(player.Bot):
         """
         # Handle picking cards and cutting the deck.
         if prompt.strip().startswith('Enter a number'):
-            return random.randint(1, 121)
+            return self.game.rng.randint(1, 121)
         # Raise an error for anything else.
         else:
             raise player.BotError('Unexepected question to CribBot: {!r}'.format(prompt))
@@ -995,7 +995,7 @@ class CribBot(player.Bot):
         plays.sort(reverse = True)
         best_plays = [play for play in plays if play[0] == plays[0][0]]
         if plays[0][0]:
-            play = random.choice(best_plays)[1]
+            play = self.game.rng.choice(best_plays)[1]
         # Check for the running total being under 15.
         elif self.game.card_total < 15:
             # Get the resulting card total for each card.
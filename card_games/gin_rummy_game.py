@@ -410,7 +410,7 @@ class GinBot(player.Bot):
         Note that if a card is in a run and a set, this tracks the run as a meld and
         the set as a potential meld.
         """
-        my_cards = self.hand[:]
+        my_cards = self.hand.cards[:]
         # Check for runs.
         my_cards.sort()
         full_runs, part_runs = self.find_melds(my_cards, self.run_pair)
@@ -711,7 +711,7 @@ class GinRummy(game.Game):
     def deal(self):
         """Deal the cards. (None)"""
         # Rest the deck and the hands.
-        self.deck = cards.Deck(rank_set = self.rank_set)
+        self.deck = cards.Deck(rank_set = self.rank_set, rng = self.rng)
         self.hands = self.deck.player_hands(self.players)
         self.deck.shuffle()
         # Deal 10 cards to each player.
@@ -1275,10 +1275,10 @@ class GinRummy(game.Game):
         self.rank_set = cards.STANDARD_RANKS.copy()
         self.rank_set.values['A'] = self.ace_penalty
         self.card_values = self.rank_set.values
-        self.deck = cards.Deck(rank_set = self.rank_set)
+        self.deck = cards.Deck(rank_set = self.rank_set, rng = self.rng)
         self.hands = self.deck.player_hands(self.players)
-        self.dealer = random.choice(self.players)
-        self.side_deck = cards.Deck()
+        self.dealer = self.rng.choice(self.players)
+        self.side_deck = cards.Deck(rng = self.rng)
         # Set up the tracking variables.
         self.draws = 0
         self.doubler = 1
@@ -268,7 +268,7 @@ class HeartBot(player.Bot):
             losers = [card for card in playable if card.rank_num < trick_max.rank_num]
             # Play the highest possible loser, or the lowest possible card in hopes of losing.
             if self.game.random_move:
-                card = random.choice(playable)
+                card = self.game.rng.choice(playable)
             elif losers and 'QS' in losers:
                 card = self.game.deck.parse_text('QS')
             elif losers and last_player and not point_cards:
@@ -288,7 +288,7 @@ class HeartBot(player.Bot):
         else:
             # Check for random play.
             if self.game.random_move:
-                card = random.choice(self.hand.cards)
+                card = self.game.rng.choice(self.hand.cards)
             # Get rid of the queen if you can.
             elif 'QS' in self.hand:
                 card = self.game.deck.parse_text('QS')
@@ -358,7 +358,7 @@ class HeartBot(player.Bot):
     def pass_direction(self):
         """Determine which direction to pass cards with dealer's choice. (str)"""
         # Who cares, pass randomly.
-        return random.choice(('left', 'right', 'across'))
+        return self.game.rng.choice(('left', 'right', 'across'))
 
     def play(self):
         """Play a card to start or add to a trick. (card.Card)"""
@@ -935,7 +935,7 @@ class Hearts(game.Game):
             rank_set = PIP_RANKS
         elif self.heart_score[0] == 'r':
             rank_set = RANK_RANKS
-        self.deck = cards.Deck(rank_set = rank_set, suit_set = HEARTS_SUITS)
+        self.deck = cards.Deck(rank_set = rank_set, suit_set = HEARTS_SUITS, rng = self.rng)
         lady_index = self.deck.index('QS')
         self.deck[lady_index].value = self.lady_points
         self.max_score = sum(rank_set.values.values()) + self.lady_points
@@ -1256,7 +1256,7 @@ class Hearts(game.Game):
         self.taken = self.deck.player_hands(self.players)
         self.trick = cards.Hand(deck = self.deck)
         self.last_trick = cards.Hand(deck = self.deck)
-        random.shuffle(self.players)
+        self.rng.shuffle(self.players)
         # Handle the initial deal
         self.set_dealer()
         self.deal()
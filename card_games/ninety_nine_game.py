@@ -393,12 +393,12 @@ class NinetyNine(game.Game):
 
     def set_up(self):
         """Set up the game. (None)"""
-        random.shuffle(self.players)
+        self.rng.shuffle(self.players)
         self.out_of_the_game = []
         # Hand out tokens.
         self.scores = {player: 3 for player in self.players}
         # Set up deck and hands.
-        self.deck = cards.Deck(jokers = self.jokers)
+        self.deck = cards.Deck(jokers = self.jokers, rng = self.rng)
         self.hands = self.deck.player_hands(self.players)
         # Deal three cards to each player.
         self.deal()
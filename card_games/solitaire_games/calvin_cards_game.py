@@ -295,7 +295,7 @@ class CalvinCards(solitaire.Solitaire):
         # Get and process the move.
         go = super(CalvinCards, self).player_action(player)
         # If there was an actual move, check for chaos.
-        if not go:
+        if not go and self.moves and not self.force_end:
             old_loc = self.moves[-1][1]
             # Check for rules change
             self.keep_rules -= 1
@@ -953,8 +953,8 @@ class Solitaire(game.Game):
         if track:
             self.moves.append([move_stack[:], old_location, new_location, undo_ndx])
         # Move the cards.
+        cards.remove_cards(old_location, move_stack)
         for card in move_stack:
-            old_location.remove(card)
             card.up = up
         new_location.extend(move_stack)
         # Turn over any revealed cards.
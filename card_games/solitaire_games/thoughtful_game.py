@@ -19,6 +19,7 @@ Thoughtful: A game of Thoughtful Solitaire. (solitaire.Solitaire)
 import random
 
 from . import solitaire_game as solitaire
+from ... import cards
 
 
 CREDITS = """
@@ -293,8 +294,8 @@ class Thoughtful(solitaire.Solitaire):
         # Record the move.
         old_location = move_stack[0].game_location
         # Move the cards.
+        cards.remove_cards(old_location, move_stack)
         for card in move_stack:
-            old_location.remove(card)
             new_location.insert(0, card)
         # Reset location tracking.
         for card in move_stack:
@@ -7,19 +7,25 @@ Copyright (C) 2018-2020 by Craig O'Brien and the t_games contributors.
 See the top level __init__.py file for details on the t_games license.
 
 Constants:
+DEAL_CACHE: The cache of standard deck C-style deals. (DealCache)
 ONE_SUIT: A feature set with only one suit (spades). (FeatureSet)
+RANK_BITS: The card set bits for the lowest rank of each suit. (int)
 STANDARD_RANKS: The standard Western card ranks. (FeatureSet)
 STANDARD_SUITS: The standard Western card suits. (FeatureSet)
 STANDARD_WRAP_RANKS: The standard card ranks with wrapping. (FeatureSet)
+SUIT_BITS: The card set bits for the lowest suit. (int)
 TWO_SUITS: A feature set with only two suits (spades and hearts). (FeatureSet)
 
 Classes:
 CRand: Implementation of C's rand function. (object)
+DealCache: A memory mapped file of C-style deal orders. (object)
 FeatureSet: A set of valid values for a feature (rank/suit) of a Card. (object)
+CardFace: The shared, unchanging values of a card. (object)
 Card: A standard playing card, with a suit and a rank. (object)
 Pile: A sequence of cards. (MutableSequence)
 Deck: A standard deck of cards. (object)
 Hand: A hand of cards held by a player. (object)
+CardSet: A set of cards stored as the bits of an integer. (object)
 TrackingCard: A card that tracks it's location. (Card)
 TrackOneSuit: A tracking card with only one suit. (TrackingCard)
 TrackTwoSuit: A tracking card with only two suits. (TrackingCard)
@@ -27,12 +33,18 @@ TrackingDeck: A deck that keeps track of the location of its cards. (Deck)
 MultiTrackingDeck: A deck that keeps track of multiple duplicate cards. (Deck)
 
 Functions:
+bit_count: Count the bits set in an integer. (int)
 by_rank: A key function for sorting Cards by rank. (int)
 by_rank_suit: A key function for sorting Cards by rank then suit. (tuple)
 by_suit: A key function for sorting Cards by suit. (int)
 by_suit_rank: A key function for sorting Cards by suit then rank. (tuple)
 by_value: A key function for sorting Cards by value. (int)
+card_face: Get the shared face for a card. (CardFace)
+crand_order: Get the order of a C-style numbered deal. (bytes)
 parse_text: Parse text looking for a card. (Card or list of Card)
+rank_mask: Get the card set bits for all cards of a rank. (int)
+remove_cards: Remove cards from a pile, checking the top of the pile first. (None)
+suit_mask: Get the card set bits for all cards of a suit. (int)
 """
 
 
@@ -43,9 +55,17 @@ try:
     from collections.abc import MutableSequence
 except ImportError:
     from collections import MutableSequence
+import mmap
+import numbers
+import os
 import random
 import re
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from . import utility
 
 
@@ -84,6 +104,113 @@ class CRand(object):
         return 'CRand({})'.format(self.state)
 
 
+class DealCache(object):
+    """
+    A memory mapped file of C-style deal orders. (object)
+
+    The deal orders are those from crand_order, stored one after another for deal
+    numbers starting at 1. Deals that are not in the file are calculated. The file
+    is optional, it is only read if build has been used to make it.
+
+    Attributes:
+    count: The number of deals in the file. (int)
+    deal_map: The memory map of the file. (mmap.mmap)
+    file_name: The path to the cache file. (str)
+    opened: A flag for the file having been checked. (bool)
+    size: The number of cards in each deal. (int)
+
+    Methods:
+    build: Write the first so many deals to the file. (None)
+    close: Close the memory map of the file. (None)
+    deal: Get the order of a numbered deal. (bytes)
+    deals: Iterate over the orders of a range of deals. (iterator)
+    open: Memory map the file, if it exists. (None)
+
+    Overridden Methods:
+    __init__
+    __repr__
+    """
+
+    def __init__(self, file_name, size = 52):
+        """
+        Set up the cache. (None)
+
+        Parameters:
+        file_name: The path to the cache file. (str)
+        size: The number of cards in each deal. (int)
+        """
+        self.file_name = file_name
+        self.size = size
+        self.count = 0
+        self.deal_map = None
+        self.opened = False
+
+    def __repr__(self):
+        """Generate a computer readable text representation. (str)"""
+        return '<DealCache of {} {}-card deals>'.format(self.count, self.size)
+
+    def build(self, count):
+        """
+        Write the first so many deals to the file. (None)
+
+        Parameters:
+        count: The number of deals to write. (int)
+        """
+        self.close()
+        with open(self.file_name, 'wb') as deal_file:
+            for number in range(1, count + 1):
+                deal_file.write(crand_order(number, self.size))
+        self.open()
+
+    def close(self):
+        """Close the memory map of the file. (None)"""
+        if self.deal_map is not None:
+            self.deal_map.close()
+        self.deal_map = None
+        self.count = 0
+        self.opened = False
+
+    def deal(self, number, size = 52):
+        """
+        Get the order of a numbered deal. (bytes)
+
+        Parameters:
+        number: The deal number. (int)
+        size: The number of cards in the deal. (int)
+        """
+        if not self.opened:
+            self.open()
+        if size == self.size and 0 < number <= self.count:
+            start = (number - 1) * size
+            return self.deal_map[start:(start + size)]
+        else:
+            return crand_order(number, size)
+
+    def deals(self, start, stop):
+        """
+        Iterate over the orders of a range of deals. (iterator)
+
+        Parameters:
+        start: The first deal number. (int)
+        stop: The deal number after the last one. (int)
+        """
+        for number in range(start, stop):
+            yield self.deal(number, self.size)
+
+    def open(self):
+        """Memory map the file, if it exists. (None)"""
+        self.opened = True
+        try:
+            with open(self.file_name, 'rb') as deal_file:
+                self.deal_map = mmap.mmap(deal_file.fileno(), 0, access = mmap.ACCESS_READ)
+        except (IOError, OSError, ValueError):
+            # A missing or empty file is just an empty cache.
+            self.deal_map = None
+            self.count = 0
+        else:
+            self.count = len(self.deal_map) // self.size
+
+
 class FeatureSet(object):
     """
     A set of valid values for a feature (rank/suit) of a Card. (object)
@@ -92,6 +219,7 @@ class FeatureSet(object):
     an_chars: The characters for ranks using 'an' instead of 'a'. (str)
     chars: The characters for the feature values. (str)
     colors: The colors associated with the feature values. (dict of str: str)
+    faces: The card faces made with this feature set as the ranks. (dict)
     names: The names of the feature values. (dict of str: str)
     skip: The number of values to skip when iterating. (int)
     values: Numeric values associated with feature values. (dict of str: int)
@@ -147,6 +275,8 @@ class FeatureSet(object):
         self.skip = skip
         self.wrap = wrap
         self.an_chars = an_chars
+        # Set the default attributes.
+        self.faces = {}
 
     def __contains__(self, char):
         """
@@ -279,6 +409,76 @@ STANDARD_WRAP_RANKS = FeatureSet('XA23456789TJQK',
 
 TWO_SUITS = FeatureSet('HS', ['Hearts', 'Spades'], colors = 'RB')
 
+# Card sets give each suit sixteen bits, one for each rank.
+RANK_BITS = 0x0001000100010001
+
+SUIT_BITS = 0xFFFF
+
+DEAL_CACHE = DealCache(os.path.join(utility.LOC, 'crand_deals.dat'))
+
+
+class CardFace(object):
+    """
+    The shared, unchanging values of a card. (object)
+
+    Card faces are interned by the card_face function, so every card of the same
+    rank and suit from the same feature sets uses the same face, no matter how
+    many decks are made. Faces should not be changed once made.
+
+    Attributes:
+    a_text: The text for the card with an 'a' or 'an'. (str)
+    color: The color of the card. ('R' or 'B')
+    down_text: The text to display when the card is face down. (str)
+    format_types: Extra types used for the format method. (dict of str: str)
+    name: The full name of the card. (str)
+    rank: The rank of the card. (str)
+    rank_num: The index of the rank of the card. (int)
+    suit: The suit of the card. (str)
+    suit_num: The index of the suit of the card. (int)
+    up_text: The text to display when the card is face up. (str)
+    value: The score provided by the card. (int)
+
+    Overridden Methods:
+    __init__
+    __repr__
+    """
+
+    __slots__ = ('a_text', 'color', 'down_text', 'format_types', 'name', 'rank', 'rank_num', 'suit',
+        'suit_num', 'up_text', 'value')
+
+    def __init__(self, rank, suit, down_text, rank_set, suit_set):
+        """
+        Calculate the values of the card. (None)
+
+        Parameters:
+        rank: The rank of the card. (str)
+        suit: The suit of the card. (str)
+        down_text: How the card looks when face down. (str)
+        rank_set: The ranks set the card is part of. (FeatureSet)
+        suit_set: The suit set the card is part of. (FeatureSet)
+        """
+        # Set the specified paramters.
+        self.rank = rank
+        self.suit = suit
+        self.down_text = down_text
+        # Calculate the numeric values of the card.
+        self.rank_num = rank_set.index(rank)
+        self.suit_num = suit_set.index(suit)
+        self.value = rank_set.values[rank] * suit_set.values[suit]
+        self.color = suit_set.colors[suit]
+        # Calcuate the text attributes of the card.
+        self.name = '{} of {}'.format(rank_set.names[rank], suit_set.names[suit])
+        self.up_text = rank + suit
+        if rank in rank_set.an_chars:
+            self.a_text = 'an {}'.format(self.name.lower())
+        else:
+            self.a_text = 'a {}'.format(self.name.lower())
+        self.format_types = {'a': self.a_text, 'd': down_text, 'n': self.name, 'u': self.up_text}
+
+    def __repr__(self):
+        """Generate a debugging text representation. (str)"""
+        return '<CardFace {}>'.format(self.up_text)
+
 
 class Card(object):
     """
@@ -286,10 +486,15 @@ class Card(object):
 
     The color, rank, and suit attributes are length 1.
 
+    The values that never change are copied from the card's face, which is shared
+    with every other card of the same rank and suit. Only the up attribute
+    changes during play.
+
     Attributes:
     a_text: The text for the card with an 'a' or 'an'. (str)
     color: The color of the card. ('R' or 'B')
     down_text: The text to display when the card is face down. (str)
+    face: The values shared by cards of the same rank and suit. (CardFace)
     format_types: Extra types used for the format method. (dict of str: str)
     name: The full name of the card. (str)
     rank: The rank of the card. (str)
@@ -322,6 +527,9 @@ class Card(object):
     __sub__
     """
 
+    __slots__ = ('a_text', 'color', 'down_text', 'face', 'format_types', 'name', 'rank', 'rank_num',
+        'rank_set', 'suit', 'suit_num', 'suit_set', 'up', 'up_text', 'value')
+
     def __init__(self, rank, suit, down_text = '??', rank_set = STANDARD_RANKS, suit_set = STANDARD_SUITS):
         """
         Set up the card. (None)
@@ -335,24 +543,22 @@ class Card(object):
         suit_set: The suit set the card is part of. (FeatureSet)
         """
         # Set the specified paramters.
-        self.rank = rank[0]
-        self.suit = suit[0]
         self.rank_set = rank_set
         self.suit_set = suit_set
-        # Calculate the numeric values of the card.
-        self.rank_num = self.rank_set.index(self.rank)
-        self.suit_num = self.suit_set.index(self.suit)
-        self.value = self.rank_set.values[self.rank] * self.suit_set.values[self.suit]
-        self.color = self.suit_set.colors[self.suit]
-        # Calcuate the text attributes of the card.
-        self.name = '{} of {}'.format(self.rank_set.names[self.rank], self.suit_set.names[self.suit])
-        self.up_text = self.rank + self.suit
-        self.down_text = down_text
-        if self.rank in self.rank_set.an_chars:
-            a_text = 'an {}'.format(self.name.lower())
-        else:
-            a_text = 'a {}'.format(self.name.lower())
-        self.format_types = {'a': a_text, 'd': self.down_text, 'n': self.name, 'u': self.up_text}
+        # Copy the values from the face.
+        face = card_face(rank[0], suit[0], down_text, rank_set, suit_set)
+        self.face = face
+        self.rank = face.rank
+        self.suit = face.suit
+        self.rank_num = face.rank_num
+        self.suit_num = face.suit_num
+        self.value = face.value
+        self.color = face.color
+        self.name = face.name
+        self.up_text = face.up_text
+        self.down_text = face.down_text
+        self.a_text = face.a_text
+        self.format_types = face.format_types
         # Default face down.
         self.up = False
 
@@ -495,6 +701,10 @@ class Pile(MutableSequence):
     """
     A sequence of cards. (MutableSequence)
 
+    The sequence methods that MutableSequence would build out of __getitem__ and
+    insert are passed straight to the list of cards, so that looping over a pile
+    or checking for a card in it runs at list speed.
+
     Attributes:
     cards: The cards in the pile. (list of Card)
 
@@ -506,16 +716,26 @@ class Pile(MutableSequence):
     Overridden Methods:
     __init__
     __add__
+    __contains__
     __delitem__
     __eq__
     __getitem__
     __imul__
+    __iter__
     __len__
     __mul__
     __repr__
+    __reversed__
     __rmul__
     __setitem__
     __str__
+    append
+    count
+    extend
+    index
+    pop
+    remove
+    reverse
     """
 
     def __init__(self, cards = []):
@@ -539,6 +759,15 @@ class Pile(MutableSequence):
         else:
             return self._child(self.cards + other)
 
+    def __contains__(self, card):
+        """
+        Check for a card in the pile. (bool)
+
+        Parameters:
+        card: The card to check for. (Card or str)
+        """
+        return card in self.cards
+
     def __delitem__(self, key):
         """
         Delete a card. (None)
@@ -582,6 +811,10 @@ class Pile(MutableSequence):
         self.cards *= other
         return self
 
+    def __iter__(self):
+        """Iterate over the cards in the pile. (iterator)"""
+        return iter(self.cards)
+
     def __len__(self):
         """Get the number of cards in the Pile. (int)"""
         return len(self.cards)
@@ -599,6 +832,10 @@ class Pile(MutableSequence):
         """Debugging text representation."""
         return '<{} {}>'.format(self.__class__.__name__, self)
 
+    def __reversed__(self):
+        """Iterate over the cards in the pile from the top. (iterator)"""
+        return reversed(self.cards)
+
     def __rmul__(self, other):
         """
         Copy the cards in the pile. (Pile)
@@ -631,6 +868,43 @@ class Pile(MutableSequence):
         """
         return Pile(cards)
 
+    def append(self, card):
+        """
+        Add a card to the top of the pile. (None)
+
+        Parameters:
+        card: The card to add. (Card)
+        """
+        self.cards.append(card)
+
+    def count(self, card):
+        """
+        Count the matching cards in the pile. (int)
+
+        Parameters:
+        card: The card to count. (Card or str)
+        """
+        return self.cards.count(card)
+
+    def extend(self, cards):
+        """
+        Add cards to the top of the pile. (None)
+
+        Parameters:
+        cards: The cards to add. (iterable of Card)
+        """
+        self.cards.extend(cards)
+
+    def index(self, card, *bounds):
+        """
+        Find the position of a card in the pile. (int)
+
+        Parameters:
+        card: The card to find. (Card or str)
+        bounds: The start, and optionally the stop, of the search. (int)
+        """
+        return self.cards.index(card, *bounds)
+
     def insert(self, index, card):
         """
         Insert a card in the pile. (None)
@@ -641,6 +915,28 @@ class Pile(MutableSequence):
         """
         self.cards.insert(index, card)
 
+    def pop(self, index = -1):
+        """
+        Remove a card from the pile. (Card)
+
+        Parameters:
+        index: The position of the card to remove. (int)
+        """
+        return self.cards.pop(index)
+
+    def remove(self, card):
+        """
+        Remove a matching card from the pile. (None)
+
+        Parameters:
+        card: The card to remove. (Card or str)
+        """
+        self.cards.remove(card)
+
+    def reverse(self):
+        """Reverse the order of the cards in the pile. (None)"""
+        self.cards.reverse()
+
     def sort(self, key = None, reverse = False):
         """
         Sort the cards in the pile. (None)
@@ -662,12 +958,14 @@ class Deck(Pile):
     jokers: The number of jokers in the deck. (int)
     rank_set: The ranks of cards in the deck. (FeatureSet)
     ranks: The rank characters for cards in the deck. (str)
+    rng: The random number generator used for shuffling, or None for random. (Random)
     shuffle_size: The number of cards left that triggers a shuffle. (int)
     suit_set: The suits of cards in the deck. (FeatureSet)
     suits: The suits characters for cards in the deck. (str)
 
     Methods:
     _initial_cards: Add in the initial cards for the deck. (None)
+    bulk_deal: Shuffle and deal many copies of the deck at once. (array or list)
     cut: Cut the deck. (None)
     deal: Deal a card from the deck. (Card)
     deal_n_each: Deal n cards to each player. (None or list of Card)
@@ -684,10 +982,12 @@ class Deck(Pile):
     """
 
     def __init__(self, cards = None, jokers = 0, decks = 1, shuffle_size = 0, rank_set = STANDARD_RANKS,
-        suit_set = STANDARD_SUITS):
+        suit_set = STANDARD_SUITS, rng = None):
         """
         Fill the deck with a standard set of cards. (None)
 
+        If no random number generator is given, the random module is used.
+
         Parameters:
         cards: The initial cards in the deck. (list of Card)
         jokers: The number of jokers in the deck. (int)
@@ -695,12 +995,14 @@ class Deck(Pile):
         shuffle_size: The number of cards left that triggers a shuffle. (int)
         rank_set: The rank information for cards in the deck. (FeatureSet)
         suit_set: The suit information for cards in the deck. (FeatureSet)
+        rng: The random number generator used for shuffling. (random.Random)
         """
         # Set the specified attributes.
         self.shuffle_size = shuffle_size
         self.jokers = jokers
         self.rank_set = rank_set
         self.suit_set = suit_set
+        self.rng = rng
         # Extract attributes from the feature sets.
         self.ranks = self.rank_set.chars
         self.suits = self.suit_set.chars
@@ -721,7 +1023,7 @@ class Deck(Pile):
         cards: The cards to make a deck out of. (list of Card)
         """
         child = Deck(cards, jokers = self.jokers, shuffle_size = self.shuffle_size,
-            rank_set = self.rank_set, suit_set = self.suit_set)
+            rank_set = self.rank_set, suit_set = self.suit_set, rng = self.rng)
         child.discards = self.discards[:]
         return child
 
@@ -751,6 +1053,53 @@ class Deck(Pile):
                     suit = joker_suits[suit_index % len(self.suit_set)]
                     self.cards.append(Card(rank, suit))
 
+    def bulk_deal(self, count, players = 0, n = 0):
+        """
+        Shuffle and deal many copies of the deck at once. (array or list)
+
+        The cards are given as CardSet codes, without making any Card objects, and
+        the deck itself is not changed. The discards are included, as in shuffle.
+        Each deal is a row of codes in the order they would be dealt.
+
+        If players is given, each deal is split into n cards for each player, dealt
+        one at a time around the players. Then a tuple of the hands (count by
+        players by n) and the undealt stock (count by the remaining cards) is
+        returned instead.
+
+        With NumPy installed the deals are made by sorting random keys, and are NumPy
+        int8 arrays seeded from the deck's random number generator, so millions of
+        deals fit in memory. Without it they are lists of lists of int, made with the
+        random number generator directly.
+
+        Parameters:
+        count: The number of decks to shuffle. (int)
+        players: The number of players to deal hands to. (int)
+        n: The number of cards to deal to each player. (int)
+        """
+        # Get the codes of all the cards.
+        codes = [card.suit_num * 16 + card.rank_num for card in self.cards + self.discards]
+        size = players * n
+        if size > len(codes):
+            raise ValueError('Not enough cards to deal {} to {} players.'.format(n, players))
+        if numpy is not None:
+            # Shuffle by sorting random keys.
+            generator = numpy.random.RandomState((self.rng or random).getrandbits(32))
+            order = generator.random_sample((count, len(codes))).argsort(axis = 1)
+            deals = numpy.array(codes, dtype = numpy.int8)[order]
+            if not players:
+                return deals
+            # Deal around the players.
+            hands = deals[:, :size].reshape(count, n, players).transpose(0, 2, 1)
+            return hands, deals[:, size:]
+        else:
+            # Shuffle by sampling.
+            deals = [(self.rng or random).sample(codes, len(codes)) for deal in range(count)]
+            if not players:
+                return deals
+            # Deal around the players.
+            hands = [[deal[player:size:players] for player in range(players)] for deal in deals]
+            return hands, [deal[size:] for deal in deals]
+
     def cut(self, card_index):
         """
         Cut the deck. (None)
@@ -865,16 +1214,12 @@ class Deck(Pile):
         self.cards.extend(self.discards)
         if number is None:
             # Do a standard shuffle.
-            random.shuffle(self.cards)
+            (self.rng or random).shuffle(self.cards)
         else:
             # Do a C-style shuffle.
-            rand = CRand(number)
             self.cards.sort(key = by_rank_suit)
-            while self.cards:
-                swap = rand() % len(self.cards)
-                self.cards[swap], self.cards[-1] = self.cards[-1], self.cards[swap]
-                self.discards.append(self.cards.pop())
-            self.cards = self.discards[::-1]
+            order = DEAL_CACHE.deal(number, len(self.cards))
+            self.cards = [self.cards[index] for index in bytearray(order)]
         self.discards = []
 
 
@@ -882,11 +1227,22 @@ class Hand(Pile):
     """
     A hand of cards held by a player. (Pile)
 
+    The rank and suit queries and find results are cached until the cards in the
+    hand change. Games change the cards list directly, so a change is spotted by
+    comparing the cards to a copy made when the cache was made. Equal cards are
+    treated as the same card, as they are by discard and shift.
+
     Attributes:
     cards: The cards in the hand. (list of Card)
     deck: The deck the cards in the hand come from. (Deck)
+    queries: The cached query results. (dict)
+    query_cards: The cards when the queries were cached. (list of Card)
+    rank_index: The cards in the hand by rank. (dict of str: list of Card)
+    suit_index: The cards in the hand by suit. (dict of str: list of Card)
 
     Methods:
+    _queries: Get the cached queries, resetting them if the hand changed. (dict)
+    card_set: Convert the hand to a set of cards. (CardSet)
     deal: Add a card to the hand. (None)
     discard: Discard a card back to the deck. (None)
     draw: Draw a card from the deck. (None)
@@ -919,6 +1275,11 @@ class Hand(Pile):
             self.cards = []
         else:
             self.cards = cards
+        # Set the default attributes.
+        self.query_cards = None
+        self.queries = {}
+        self.rank_index = {}
+        self.suit_index = {}
 
     def __eq__(self, other):
         """
@@ -964,6 +1325,26 @@ class Hand(Pile):
         """
         return Hand(cards, self.deck)
 
+    def _queries(self):
+        """Get the cached queries, resetting them if the hand changed. (dict)"""
+        if self.cards != self.query_cards:
+            # Rebuild the indexes.
+            self.query_cards = self.cards[:]
+            self.queries = {}
+            self.rank_index = {}
+            self.suit_index = {}
+            for card in self.cards:
+                self.rank_index.setdefault(card.rank, []).append(card)
+                self.suit_index.setdefault(card.suit, []).append(card)
+        return self.queries
+
+    def card_set(self):
+        """Convert the hand to a set of cards. (CardSet)"""
+        if self.deck is None:
+            return CardSet(self.cards)
+        else:
+            return CardSet(self.cards, rank_set = self.deck.rank_set, suit_set = self.deck.suit_set)
+
     def deal(self, card):
         """
         Add a card to the hand. (None)
@@ -1018,8 +1399,18 @@ class Hand(Pile):
         not_suit: The suits to exclude from the subset. (str)
         regex: A regular expression each card's up_text must match. (str)
         """
-        # Start with the full hand.
-        cards = self.cards[:]
+        # Check for cached results.
+        queries = self._queries()
+        key = ('find', rank, suit, not_rank, not_suit, regex)
+        if key in queries:
+            return self._child(queries[key][:])
+        # Start with the full hand, or the cards of a single rank or suit.
+        if len(rank) == 1:
+            cards, rank = self.rank_index.get(rank, []), ''
+        elif len(suit) == 1:
+            cards, suit = self.suit_index.get(suit, []), ''
+        else:
+            cards = self.cards
         # Apply postive filters.
         if rank:
             cards = [card for card in cards if card.rank in rank]
@@ -1034,7 +1425,8 @@ class Hand(Pile):
         if not_suit:
             cards = [card for card in cards if card.suit not in not_suit]
         # Return the cards as a Hand.
-        return self._child(cards)
+        queries[key] = cards[:]
+        return self._child(cards[:])
 
     def parse_text(self, text):
         """
@@ -1052,12 +1444,15 @@ class Hand(Pile):
         Parameters:
         rank: the rank to check for. (str)
         """
-        rank = rank.upper()
-        return any(card.rank == rank for card in self.cards)
+        self._queries()
+        return rank.upper() in self.rank_index
 
     def ranks(self):
         """Get the ranks in the hand. (list of str)"""
-        return [card.rank for card in self.cards]
+        queries = self._queries()
+        if 'ranks' not in queries:
+            queries['ranks'] = [card.rank for card in self.cards]
+        return queries['ranks'][:]
 
     def score(self):
         """Score the hand. (int)"""
@@ -1086,12 +1481,269 @@ class Hand(Pile):
         Parameters:
         suit: the suit to check for. (str)
         """
-        suit = suit.upper()
-        return any(card.suit == suit for card in self.cards)
+        self._queries()
+        return suit.upper() in self.suit_index
 
     def suits(self):
         """Get the suits in the hand. (list of str)"""
-        return [card.suit for card in self.cards]
+        queries = self._queries()
+        if 'suits' not in queries:
+            queries['suits'] = [card.suit for card in self.cards]
+        return queries['suits'][:]
+
+
+class CardSet(object):
+    """
+    A set of cards stored as the bits of an integer. (object)
+
+    Each card is coded as an integer, sixteen times the suit index plus the rank
+    index, and is in the set if that bit is set. So four suits of up to sixteen
+    ranks fit in 64 bits. Checking for cards, ranks, or suits is done with bit
+    masks instead of looping through Card objects. Since it is a set, duplicate
+    cards are only counted once.
+
+    Iterating over a card set gives the card codes in order by suit then rank,
+    the same as sorting the Cards. Use to_cards or to_hand to get Card objects.
+
+    Attributes:
+    bits: The bits for the cards in the set. (int)
+    rank_set: The ranks the cards are from. (FeatureSet)
+    suit_set: The suits the cards are from. (FeatureSet)
+
+    Methods:
+    add: Add a card to the set. (None)
+    code: Get the integer code for a card. (int)
+    discard: Remove a card from the set, if it is there. (None)
+    of_rank: Get the cards of a given rank. (CardSet)
+    of_suit: Get the cards of a given suit. (CardSet)
+    rank_count: Count the cards of a given rank. (int)
+    rank_in: Check that a rank is in the set. (bool)
+    suit_count: Count the cards of a given suit. (int)
+    suit_in: Check that a suit is in the set. (bool)
+    to_cards: Convert the set to Card objects. (list of Card)
+    to_hand: Convert the set to a hand of cards. (Hand)
+
+    Overridden Methods:
+    __init__
+    __and__
+    __contains__
+    __eq__
+    __iter__
+    __len__
+    __ne__
+    __or__
+    __repr__
+    __sub__
+    """
+
+    # Card sets can be changed, so they can't be hashed.
+    __hash__ = None
+
+    def __init__(self, cards = (), bits = 0, rank_set = STANDARD_RANKS, suit_set = STANDARD_SUITS):
+        """
+        Set up the cards in the set. (None)
+
+        Parameters:
+        cards: The cards in the set, as Cards, text, or codes. (iterable)
+        bits: The bits for cards in the set. (int)
+        rank_set: The ranks the cards are from. (FeatureSet)
+        suit_set: The suits the cards are from. (FeatureSet)
+        """
+        self.rank_set = rank_set
+        self.suit_set = suit_set
+        if len(rank_set.chars) > 16 or len(suit_set.chars) > 4:
+            raise ValueError('Card sets can only hold four suits of up to sixteen ranks.')
+        for card in cards:
+            bits |= 1 << self.code(card)
+        self.bits = bits
+
+    def __and__(self, other):
+        """
+        Get the cards in both sets. (CardSet)
+
+        Parameters:
+        other: The other set of cards. (CardSet)
+        """
+        return CardSet(bits = self.bits & other.bits, rank_set = self.rank_set, suit_set = self.suit_set)
+
+    def __contains__(self, card):
+        """
+        Check for a card in the set. (bool)
+
+        Parameters:
+        card: The card to check for. (Card, str, or int)
+        """
+        return bool(self.bits >> self.code(card) & 1)
+
+    def __eq__(self, other):
+        """
+        Check for the same cards. (bool)
+
+        Parameters:
+        other: The set of cards to compare to. (CardSet)
+        """
+        if isinstance(other, CardSet):
+            return self.bits == other.bits
+        else:
+            return NotImplemented
+
+    def __iter__(self):
+        """Iterate over the codes of the cards in the set. (iterator)"""
+        bits = self.bits
+        while bits:
+            low_bit = bits & -bits
+            yield low_bit.bit_length() - 1
+            bits ^= low_bit
+
+    def __len__(self):
+        """Count the cards in the set. (int)"""
+        return bit_count(self.bits)
+
+    def __ne__(self, other):
+        """
+        Check for different cards. (bool)
+
+        Parameters:
+        other: The set of cards to compare to. (CardSet)
+        """
+        return not (self == other)
+
+    def __or__(self, other):
+        """
+        Get the cards in either set. (CardSet)
+
+        Parameters:
+        other: The other set of cards. (CardSet)
+        """
+        return CardSet(bits = self.bits | other.bits, rank_set = self.rank_set, suit_set = self.suit_set)
+
+    def __repr__(self):
+        """Generate a debugging text representation. (str)"""
+        return '<CardSet [{}]>'.format(', '.join(card.up_text for card in self.to_cards()))
+
+    def __sub__(self, other):
+        """
+        Get the cards not in the other set. (CardSet)
+
+        Parameters:
+        other: The other set of cards. (CardSet)
+        """
+        return CardSet(bits = self.bits & ~other.bits, rank_set = self.rank_set, suit_set = self.suit_set)
+
+    def add(self, card):
+        """
+        Add a card to the set. (None)
+
+        Parameters:
+        card: The card to add. (Card, str, or int)
+        """
+        self.bits |= 1 << self.code(card)
+
+    def code(self, card):
+        """
+        Get the integer code for a card. (int)
+
+        Parameters:
+        card: The card to code. (Card, str, or int)
+        """
+        if isinstance(card, Card):
+            return card.suit_num * 16 + card.rank_num
+        elif isinstance(card, numbers.Integral):
+            return int(card)
+        else:
+            card = card.upper()
+            return self.suit_set.index(card[1]) * 16 + self.rank_set.index(card[0])
+
+    def discard(self, card):
+        """
+        Remove a card from the set, if it is there. (None)
+
+        Parameters:
+        card: The card to remove. (Card, str, or int)
+        """
+        self.bits &= ~(1 << self.code(card))
+
+    def of_rank(self, rank):
+        """
+        Get the cards of a given rank. (CardSet)
+
+        Parameters:
+        rank: The rank to get the cards of. (str)
+        """
+        bits = self.bits & rank_mask(self.rank_set.index(rank.upper()))
+        return CardSet(bits = bits, rank_set = self.rank_set, suit_set = self.suit_set)
+
+    def of_suit(self, suit):
+        """
+        Get the cards of a given suit. (CardSet)
+
+        Parameters:
+        suit: The suit to get the cards of. (str)
+        """
+        bits = self.bits & suit_mask(self.suit_set.index(suit.upper()))
+        return CardSet(bits = bits, rank_set = self.rank_set, suit_set = self.suit_set)
+
+    def rank_count(self, rank):
+        """
+        Count the cards of a given rank. (int)
+
+        Parameters:
+        rank: The rank to count. (str)
+        """
+        return bit_count(self.bits & rank_mask(self.rank_set.index(rank.upper())))
+
+    def rank_in(self, rank):
+        """
+        Check that a rank is in the set. (bool)
+
+        Parameters:
+        rank: The rank to check for. (str)
+        """
+        return bool(self.bits & rank_mask(self.rank_set.index(rank.upper())))
+
+    def suit_count(self, suit):
+        """
+        Count the cards of a given suit. (int)
+
+        Parameters:
+        suit: The suit to count. (str)
+        """
+        return bit_count(self.bits & suit_mask(self.suit_set.index(suit.upper())))
+
+    def suit_in(self, suit):
+        """
+        Check that a suit is in the set. (bool)
+
+        Parameters:
+        suit: The suit to check for. (str)
+        """
+        return bool(self.bits & suit_mask(self.suit_set.index(suit.upper())))
+
+    def to_cards(self, up = True):
+        """
+        Convert the set to Card objects. (list of Card)
+
+        Parameters:
+        up: A flag for the cards being face up. (bool)
+        """
+        cards = []
+        for code in self:
+            suit_num, rank_num = divmod(code, 16)
+            card = Card(self.rank_set.chars[rank_num], self.suit_set.chars[suit_num],
+                rank_set = self.rank_set, suit_set = self.suit_set)
+            card.up = up
+            cards.append(card)
+        return cards
+
+    def to_hand(self, deck = None, up = True):
+        """
+        Convert the set to a hand of cards. (Hand)
+
+        Parameters:
+        deck: The deck the hand is dealt from. (Deck)
+        up: A flag for the cards being face up. (bool)
+        """
+        return Hand(self.to_cards(up), deck)
 
 
 class TrackingCard(Card):
@@ -1104,6 +1756,7 @@ class TrackingCard(Card):
     game_location: The location of the card in the game. (list of Card)
     loc_txt: The location identifier for abbreviated card text. (str)
     location_text: The location identifier for full card text. (str)
+    play_index: The position of the card in the deck's in_play list. (int)
     rank_num: The numeric rank of the card. (int)
 
     Methods:
@@ -1116,6 +1769,8 @@ class TrackingCard(Card):
     below
     """
 
+    __slots__ = ('deck', 'deck_location', 'game_location', 'loc_txt', 'location_text', 'play_index')
+
     def __init__(self, rank, suit, deck, rank_set = STANDARD_RANKS, suit_set = STANDARD_SUITS):
         """
         Set up the card. (None)
@@ -1139,6 +1794,7 @@ class TrackingCard(Card):
             self.game_location = None
         self.loc_txt = ''
         self.location_text = ''
+        self.play_index = -1
 
     def __eq__(self, other):
         """
@@ -1196,6 +1852,10 @@ class TrackingDeck(Deck):
     """
     A deck that keeps track of the location of the cards in it. (Deck)
 
+    The cards in play are not kept in any order. Each card knows its index in the
+    in_play list, so a discarded card can be swapped with the last card in play
+    and popped off, rather than searched for.
+
     Attributes:
     card_map: A map for finding cards in the deck. (dict of str: card}
     card_re: A regular expression to match a card.
@@ -1223,6 +1883,8 @@ class TrackingDeck(Deck):
         """
         Fill the deck with a standard set of cards. (None)
 
+        The deck shuffles with the game's random number generator, if it has one.
+
         Parameters:
         cards: The initial cards in the deck. (list of Card)
         game: The game the deck is for. (game.Game)
@@ -1235,7 +1897,7 @@ class TrackingDeck(Deck):
         # Set the general attributes.
         self.game = game
         super(TrackingDeck, self).__init__(cards, jokers, decks = 1, shuffle_size = 0,
-            rank_set = rank_set, suit_set = suit_set)
+            rank_set = rank_set, suit_set = suit_set, rng = getattr(game, 'rng', None))
         # Set the calcuated attribute.
         self.max_rank = self.rank_set.chars[-1]
         # Set the default attributes.
@@ -1302,6 +1964,7 @@ class TrackingDeck(Deck):
         """
         # move the card
         card = self.cards.pop(card_index)
+        card.play_index = len(self.in_play)
         self.in_play.append(card)
         game_location.append(card)
         # change the cards attributes
@@ -1319,10 +1982,18 @@ class TrackingDeck(Deck):
         card: The card to discard. (Card)
         """
         # move the card in the deck
-        self.in_play.remove(card)
+        play_index = card.play_index
+        if 0 <= play_index < len(self.in_play) and self.in_play[play_index] is card:
+            last = self.in_play.pop()
+            if last is not card:
+                self.in_play[play_index] = last
+                last.play_index = play_index
+        else:
+            self.in_play.remove(card)
+        card.play_index = -1
         self.discards.append(card)
         # remove the card from the game
-        card.game_location.remove(card)
+        remove_cards(card.game_location, [card])
         # reset the card status
         card.game_location = self.game.deck.discards
         card.deck_location = self.discards
@@ -1396,7 +2067,7 @@ class MultiTrackingDeck(TrackingDeck):
         self.game = game
         self.decks = decks
         super(TrackingDeck, self).__init__(cards, jokers, decks = self.decks, shuffle_size = 0,
-            rank_set = rank_set, suit_set = suit_set)
+            rank_set = rank_set, suit_set = suit_set, rng = getattr(game, 'rng', None))
         # Set the calcuated attribute.
         reg_text = '\\b[{}][{}](?:-[twrf]?\d*)?\\b'.format(self.rank_set.chars, self.suit_set.chars)
         self.card_re = re.compile(reg_text, re.IGNORECASE)
@@ -1517,6 +2188,16 @@ class MultiTrackingDeck(TrackingDeck):
         return location_type, location_count
 
 
+def bit_count(bits):
+    """
+    Count the bits set in an integer. (int)
+
+    Parameters:
+    bits: A non-negative integer. (int)
+    """
+    return bin(bits).count('1')
+
+
 def by_rank(card):
     """
     A key function for sorting Cards by rank. (int)
@@ -1562,6 +2243,53 @@ def by_value(card):
     """
     return card.value
 
+
+def card_face(rank, suit, down_text = '??', rank_set = STANDARD_RANKS, suit_set = STANDARD_SUITS):
+    """
+    Get the shared face for a card. (CardFace)
+
+    The faces are stored in the rank set, so they last as long as it does.
+
+    Parameters:
+    rank: The rank of the card. (str)
+    suit: The suit of the card. (str)
+    down_text: How the card looks when face down. (str)
+    rank_set: The ranks set the card is part of. (FeatureSet)
+    suit_set: The suit set the card is part of. (FeatureSet)
+    """
+    key = (rank, suit, down_text, suit_set)
+    face = rank_set.faces.get(key)
+    if face is None:
+        face = CardFace(rank, suit, down_text, rank_set, suit_set)
+        rank_set.faces[key] = face
+    return face
+
+
+def crand_order(number, size = 52):
+    """
+    Get the order of a C-style numbered deal. (bytes)
+
+    This is the shuffle used for numbered FreeCell deals. Each byte is the index,
+    in the deck sorted by rank and suit, of the card in that position in the
+    shuffled deck. The C rand function is inlined for speed.
+
+    Parameters:
+    number: The deal number, which is the seed for the shuffle. (int)
+    size: The number of cards in the deck. (int)
+    """
+    state = number
+    cards = list(range(size))
+    order = []
+    for left in range(size, 0, -1):
+        state = (214013 * state + 2531011) & 0x7FFFFFFF
+        swap = (state >> 16) % left
+        order.append(cards[swap])
+        cards[swap] = cards[left - 1]
+        cards.pop()
+    order.reverse()
+    return bytes(bytearray(order))
+
+
 def parse_text(text, deck = None):
     """
     Parse text looking for a card. (Card or list of Card)
@@ -1588,6 +2316,48 @@ def parse_text(text, deck = None):
         return cards
 
 
+def rank_mask(rank_num):
+    """
+    Get the card set bits for all cards of a rank. (int)
+
+    Parameters:
+    rank_num: The index of the rank. (int)
+    """
+    return RANK_BITS << rank_num
+
+
+def remove_cards(pile, cards):
+    """
+    Remove cards from a pile, checking the top of the pile first. (None)
+
+    Cards almost always come off the top of a pile, so if the cards are the top
+    of the pile they are removed as a slice, without searching for them.
+
+    Parameters:
+    pile: The pile to remove the cards from. (list of Card)
+    cards: The cards to remove. (list of Card)
+    """
+    count = len(cards)
+    if not count:
+        return
+    top = pile[-count:]
+    if len(top) == count and all(top_card is card for top_card, card in zip(top, cards)):
+        del pile[-count:]
+    else:
+        for card in cards:
+            pile.remove(card)
+
+
+def suit_mask(suit_num):
+    """
+    Get the card set bits for all cards of a suit. (int)
+
+    Parameters:
+    suit_num: The index of the suit. (int)
+    """
+    return SUIT_BITS << (suit_num * 16)
+
+
 if __name__ == '__main__':
     # Run the unit testing.
     from t_tests.cards_test import *
@@ -6,11 +6,19 @@ Dice objects for t_games.
 Copyright (C) 2018-2020 by Craig O'Brien and the t_games contributors.
 See the top level __init__.py file for details on the t_games license.
 
+Constants:
+SCORE_CACHE: Score distributions by dice and scoring function. (dict)
+
 Classes:
 Die: A single die. (object)
 ShuffleDie: A die that samples from the range without replacement. (Die)
 Pool: A set of dice. (object)
+ValuePool: A set of dice stored as plain values. (object)
 DominoPool: A set of dice based on dominos. (Pool)
+
+Functions:
+outcomes: Iterate over the distinct rolls of identical dice. (iterator)
+score_outcomes: Get the distribution of scores for identical dice. (dict)
 """
 
 
@@ -19,11 +27,20 @@ from __future__ import division
 import collections
 import functools
 import itertools
+import math
 import random
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from . import utility
 
 
+SCORE_CACHE = {}
+
+
 @functools.total_ordering
 class Die(object):
     """
@@ -38,6 +55,7 @@ class Die(object):
 
     Attributes:
     held: A flag for holding the die aside and not rolling it. (bool)
+    rng: The random number generator used for rolling, or None for random. (Random)
     sides: The sides of the die. (list)
     value: The current value of the die. (object)
 
@@ -80,20 +98,26 @@ class Die(object):
     __truediv__
     """
 
-    def __init__(self, sides = 6):
+    __slots__ = ('held', 'rng', 'sides', 'value')
+
+    def __init__(self, sides = 6, rng = None):
         """
         Set up the die.
 
+        If no random number generator is given, the random module is used.
+
         Parameters:
         sides: The number of sides or a list of the sides of the die. (int or list)
+        rng: The random number generator used for rolling. (random.Random)
         """
         # Set up the list of sides, 1 to n for integer input.
         if isinstance(sides, int):
             self.sides = list(range(1, sides + 1))
         else:
             self.sides = sides
-        # Set the default attribute.
+        # Set the default attributes.
         self.held = False
+        self.rng = rng
         # Get an initial value for the die.
         self.roll()
 
@@ -403,7 +427,7 @@ class Die(object):
 
     def copy(self):
         """Create an independent copy of the Die. (Die)"""
-        clone = Die(self.sides)
+        clone = Die(self.sides, self.rng)
         clone.value = self.value
         return clone
 
@@ -418,7 +442,7 @@ class Die(object):
             raise ValueError('Attempt to roll a held die.')
         else:
             # Get the new value and return it.
-            self.value = random.choice(self.sides)
+            self.value = (self.rng or random).choice(self.sides)
             return self.value
 
 
@@ -439,17 +463,18 @@ class ShuffleDie(Die):
     roll
     """
 
-    def __init__(self, sides = 6, repeats = 1):
+    def __init__(self, sides = 6, repeats = 1, rng = None):
         """
         Set up the die. (None)
 
         Parameters:
         sides: The number of sides or a list of the sides of the die. (int or list)
         repeats: The number of times the sides are repeated. (int)
+        rng: The random number generator used for shuffling. (random.Random)
         """
         # Set up the list of sides, 1 to n for integer input.
         self.population = [0, 0]  # for roll in Die.__init__
-        super(ShuffleDie, self).__init__(sides)
+        super(ShuffleDie, self).__init__(sides, rng)
         # Set up the population to sample from.
         self.repeats = repeats
         self.reset()
@@ -459,7 +484,7 @@ class ShuffleDie(Die):
     def reset(self):
         """Reset the population of future rolls. (None)"""
         self.population = self.sides * self.repeats
-        random.shuffle(self.population)
+        (self.rng or random).shuffle(self.population)
 
     def roll(self):
         """
@@ -489,6 +514,7 @@ class Pool(object):
 
     Methods:
     append: Add a new die to the end of the Pool. (None)
+    bulk_roll: Roll the pool many times at once. (array or list)
     copy: Create an independent deep copy of the Pool. (Pool)
     count: Count the number of times a particular rolls has been made. (int)
     counts: Return counts of the values in the pool. (list of int)
@@ -505,6 +531,7 @@ class Pool(object):
     reverse: Reverse the order of the dice in the pool. (None)
     roll: Roll the dice in the pool. (list)
     sort: Sort the dice in the pool in place. (list)
+    value_pool: Make a copy of the pool as plain values. (ValuePool)
 
     Overridden Methods:
     __init__
@@ -521,16 +548,17 @@ class Pool(object):
     __str__
     """
 
-    def __init__(self, dice = [6, 6], roll = True):
+    def __init__(self, dice = [6, 6], roll = True, rng = None):
         """
         Set up the dice in the pool. (None)
 
         The dice parameter can be Die instances, or values that can be used to create
-        Die instances.
+        Die instances. Dice created by the pool use the rng parameter to roll.
 
         Parameters:
         dice: A list of dice specifications. (list)
         roll: A flag for rolling the dice. (bool)
+        rng: The random number generator for new dice. (random.Random)
         """
         # Set up the dice.
         self.dice = []
@@ -538,7 +566,7 @@ class Pool(object):
             if isinstance(die, Die):
                 self.dice.append(die)
             else:
-                self.dice.append(Die(die))
+                self.dice.append(Die(die, rng))
         # Get an initial value.
         if roll:
             self.roll()
@@ -638,6 +666,51 @@ class Pool(object):
         self.dice.append(die)
         self.values.append(die.value)
 
+    def bulk_roll(self, count, rng = None):
+        """
+        Roll the pool many times at once. (array or list)
+
+        The result has a row for each roll, with the values of the dice in the pool's
+        order. Held dice keep their current value in every row. The pool itself is
+        not changed. Each die is rolled independently, so ShuffleDie populations
+        are not used.
+
+        With NumPy installed, the dice with the same sides are rolled together as one
+        array of random indexes into the sides, seeded from the random number
+        generator, and the result is a NumPy array (count by the number of dice).
+        Without it each die is rolled with the random number generator directly,
+        and the result is a list of lists.
+
+        If no random number generator is given, the first die's is used.
+
+        Parameters:
+        count: The number of times to roll the pool. (int)
+        rng: The random number generator to use. (random.Random)
+        """
+        if rng is None:
+            rng = (self.dice[0].rng if self.dice else None) or random
+        if numpy is not None:
+            # Group the free dice by their sides.
+            groups = collections.defaultdict(list)
+            for die_index, die in enumerate(self.dice):
+                if not die.held:
+                    groups[tuple(die.sides)].append(die_index)
+            # Start with the current values, for the held dice.
+            sides = [numpy.array(group_sides) for group_sides in groups]
+            values = numpy.array([die.value for die in self.dice])
+            values = values.astype(numpy.result_type(values, *sides))
+            rolls = numpy.tile(values, (count, 1))
+            # Roll each group of dice.
+            generator = numpy.random.RandomState(rng.getrandbits(32))
+            for group_sides, (group, indexes) in zip(sides, groups.items()):
+                side_indexes = generator.randint(0, len(group), (count, len(indexes)))
+                rolls[:, indexes] = group_sides[side_indexes]
+            return rolls
+        else:
+            # Roll each die for each row.
+            return [[die.value if die.held else rng.choice(die.sides) for die in self.dice]
+                for roll in range(count)]
+
     def copy(self):
         """Create an independent deep copy of the Pool. (Pool)"""
         return Pool([die.copy() for die in self.dice], roll = False)
@@ -822,6 +895,166 @@ class Pool(object):
         self.dice.sort(key = key, reverse = reverse)
         self.values = [die.value for die in self.dice]
 
+    def value_pool(self):
+        """Make a copy of the pool as plain values. (ValuePool)"""
+        held = 0
+        for die_index, die in enumerate(self.dice):
+            if die.held:
+                held |= 1 << die_index
+        rng = self.dice[0].rng if self.dice else None
+        return ValuePool(self.values[:], tuple(tuple(die.sides) for die in self.dice), held, rng)
+
+
+class ValuePool(object):
+    """
+    A set of dice stored as plain values. (object)
+
+    This is for bots looking ahead, where a pool is copied and rolled many times.
+    The values are a list, the held dice are the bits of an integer, and the sides
+    are a tuple shared by all copies. Copying and comparing are list operations,
+    with no Die objects involved. The values are the plain values of the sides,
+    so they do not have the Die arithmetic.
+
+    Attributes:
+    held: The bits of the held dice, bit n for the die at index n. (int)
+    rng: The random number generator used for rolling, or None for random. (Random)
+    sides: The sides of each die. (tuple of tuple)
+    values: The current values of the dice. (list)
+
+    Methods:
+    copy: Create an independent copy of the pool. (ValuePool)
+    counts: Return counts of the values in the pool. (list of int)
+    get_free: Return the values of the unheld dice. (list)
+    get_held: Return the values of the held dice. (list)
+    hold: Hold some of the dice from further rolling. (None)
+    release: Make all held dice available for rolling. (None)
+    roll: Roll the unheld dice. (list)
+
+    Overridden Methods:
+    __init__
+    __eq__
+    __iter__
+    __len__
+    __ne__
+    __repr__
+    """
+
+    __slots__ = ('held', 'rng', 'sides', 'values')
+
+    def __init__(self, values, sides, held = 0, rng = None):
+        """
+        Set up the values. (None)
+
+        Parameters:
+        values: The current values of the dice. (list)
+        sides: The sides of each die. (tuple of tuple)
+        held: The bits of the held dice. (int)
+        rng: The random number generator used for rolling. (random.Random)
+        """
+        self.values = values
+        self.sides = sides
+        self.held = held
+        self.rng = rng
+
+    def __eq__(self, other):
+        """
+        Equality check. (bool)
+
+        Parameters:
+        other: The item to check equality with. (object)
+        """
+        if isinstance(other, ValuePool):
+            return self.values == other.values and self.held == other.held
+        else:
+            return self.values == other
+
+    def __iter__(self):
+        """Iterate over the values. (iterator)"""
+        return iter(self.values)
+
+    def __len__(self):
+        """Return the number of dice in the pool. (int)"""
+        return len(self.values)
+
+    def __ne__(self, other):
+        """
+        Inequality check. (bool)
+
+        Parameters:
+        other: The item to check inequality with. (object)
+        """
+        return not (self == other)
+
+    def __repr__(self):
+        """Generate a debugging text representation. (str)"""
+        return '<ValuePool {} held {:b}>'.format(self.values, self.held)
+
+    def copy(self):
+        """Create an independent copy of the pool. (ValuePool)"""
+        return ValuePool(self.values[:], self.sides, self.held, self.rng)
+
+    def counts(self):
+        """
+        Return counts of the values in the pool. (list of int)
+
+        Returns a list counts such that counts[value] is the number of times value was
+        rolled, as with Pool.counts.
+        """
+        if self.values:
+            counts = [0] * (max(self.sides[0]) + 1)
+            for value in self.values:
+                counts[value] += 1
+        else:
+            counts = [0] * 7
+        return counts
+
+    def get_free(self):
+        """Return the values of the unheld dice. (list)"""
+        return [value for die_index, value in enumerate(self.values) if not self.held >> die_index & 1]
+
+    def get_held(self):
+        """Return the values of the held dice. (list)"""
+        return [value for die_index, value in enumerate(self.values) if self.held >> die_index & 1]
+
+    def hold(self, values):
+        """
+        Hold some of the dice from further rolling. (None)
+
+        Parameters:
+        values: The values of the dice to hold. (int or list of int)
+        """
+        # Check for single value.
+        try:
+            values = iter(values)
+        except TypeError:
+            values = [values]
+        # Hold the first unheld die with each value.
+        for value in values:
+            for die_index, die_value in enumerate(self.values):
+                if die_value == value and not self.held >> die_index & 1:
+                    self.held |= 1 << die_index
+                    break
+            else:
+                raise ValueError('{!r} is not an unheld value in the pool.'.format(value))
+
+    def release(self):
+        """Make all held dice available for rolling. (None)"""
+        self.held = 0
+
+    def roll(self, rng = None):
+        """
+        Roll the unheld dice. (list)
+
+        Parameters:
+        rng: The random number generator, defaults to the pool's. (random.Random)
+        """
+        if rng is None:
+            rng = self.rng or random
+        for die_index, sides in enumerate(self.sides):
+            if not self.held >> die_index & 1:
+                self.values[die_index] = rng.choice(sides)
+        return self.values
+
 
 class DominoPool(Pool):
     """
@@ -836,6 +1069,7 @@ class DominoPool(Pool):
     filler: The die used to replace blanks. (Die)
     population: The set of future values for the pool. (list of tuple of int)
     possible: The possible values for the pool. (list of tuple of int)
+    rng: The random number generator used for shuffling, or None for random. (Random)
 
     Methods:
     replace: Replace a blank with a value from the filler die. (int)
@@ -848,17 +1082,19 @@ class DominoPool(Pool):
     sort
     """
 
-    def __init__(self, dice = [6, 6], filler = Die(6)):
+    def __init__(self, dice = [6, 6], filler = Die(6), rng = None):
         """
         Set up the distribution of the roll results. (None)
 
         Parameters:
         dice: A list of dice specifications. (list of int)
         filler: The die to use to fill blanks. (Die)
+        rng: The random number generator used for shuffling. (random.Random)
         """
         ranges = [range(x + 1) for x in sorted(dice)]
         self.possible = [prod for prod in itertools.product(*ranges) if sorted(prod) == list(prod)]
         self.filler = filler
+        self.rng = rng
         self.reset()
         self.roll()
 
@@ -881,7 +1117,7 @@ class DominoPool(Pool):
     def reset(self):
         """Reset the population of dice rolls. (None)"""
         self.population = self.possible[:]
-        random.shuffle(self.population)
+        (self.rng or random).shuffle(self.population)
 
     def roll(self):
         """Roll the pool. (list)"""
@@ -902,7 +1138,63 @@ class DominoPool(Pool):
         self.values.sort(key = key, reverse = reverse)
 
 
+def outcomes(count, sides = 6):
+    """
+    Iterate over the distinct rolls of identical dice. (iterator)
+
+    Each item is a roll and its weight. The roll is a tuple of values in the order
+    of the sides, and the weight is how many ordered rolls of the faces give those
+    values. Values that are on more than one face count once for each face. So the
+    weights add up to the number of sides to the power of the count, without going
+    through every ordered roll.
+
+    Parameters:
+    count: The number of dice rolled. (int)
+    sides: The number of sides or a list of the sides of the dice. (int or list)
+    """
+    if isinstance(sides, int):
+        sides = range(1, sides + 1)
+    # Count the faces showing each value.
+    faces = collections.Counter(sides)
+    values = []
+    for side in sides:
+        if side not in values:
+            values.append(side)
+    # Weight each roll by its orderings and the faces it could be rolled on.
+    orders = math.factorial(count)
+    for roll in itertools.combinations_with_replacement(values, count):
+        weight = orders
+        for value, matches in itertools.groupby(roll):
+            times_rolled = len(list(matches))
+            weight = weight // math.factorial(times_rolled) * faces[value] ** times_rolled
+        yield roll, weight
+
+
+def score_outcomes(count, score, sides = 6, key = None):
+    """
+    Get the distribution of scores for identical dice. (dict)
+
+    The return value maps each score to how many ordered rolls give it. Results are
+    cached by the number of dice, the sides, and the scoring function. A bound
+    method would keep its object alive in the cache, so give a key to cache by
+    instead of the scoring function in that case.
+
+    Parameters:
+    count: The number of dice rolled. (int)
+    score: A function that scores a roll (tuple). (callable)
+    sides: The number of sides or a list of the sides of the dice. (int or list)
+    key: The key to cache the scoring function by. (hashable)
+    """
+    cache_key = (count, sides if isinstance(sides, int) else tuple(sides), score if key is None else key)
+    if cache_key not in SCORE_CACHE:
+        distribution = collections.defaultdict(int)
+        for roll, weight in outcomes(count, sides):
+            distribution[score(roll)] += weight
+        SCORE_CACHE[cache_key] = dict(distribution)
+    return SCORE_CACHE[cache_key]
+
+
 if __name__ == '__main__':
     # Run the unit testing.
     from t_tests.dice_test import *
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -217,7 +217,7 @@ class ABBot(player.Bot):
             possible = [score for score in possible if score > claim_score]
         # Pick something close to an improvement.
         possible.sort()
-        return random.choice(possible[:3])[1:]
+        return self.game.rng.choice(possible[:3])[1:]
 
     def make_claim(self, roll):
         """
@@ -318,16 +318,17 @@ class Challenger(ABBot):
             # Get the possible rolls.
             rolled = self.game.rerolls
             kept = old_score[1:(6 - rolled)]
-            rolls = itertools.product(range(1, 7), repeat = rolled)
-            scores = [self.game.poker_score(kept + list(roll)) for roll in rolls]
+            as_good = 0
+            for roll, weight in dice.outcomes(rolled):
+                if self.game.poker_score(kept + list(roll)) >= current_score:
+                    as_good += weight
             # Calculate the probability.
-            as_good = [score for score in scores if score >= current_score]
-            truth_chance = len(as_good) / len(scores)
+            truth_chance = as_good / 6 ** rolled
             # Decide about the risk.
             my_score = self.game.scores[self.name]
             total_score = sum(self.game.scores.values())
             try:
-                challenge_chance = random.random() < my_score / (total_score - my_score)
+                challenge_chance = self.game.rng.random() < my_score / (total_score - my_score)
             except ZeroDivisionError:
                 challenge_chance = True
             # Make determination.
@@ -364,7 +365,7 @@ class Liar(ABBot):
         # Consider lying if not already lying.
         if sorted(claim) != sorted(roll) and self.game.scores[self.name] > 1:
             score = self.game.poker_score(claim)
-            if random.random() < (1 - score[0] / 5) / 2:
+            if self.game.rng.random() < (1 - score[0] / 5) / 2:
                 claim = self.lie(score, self.game.poker_score(roll))
         return claim
 
@@ -839,11 +840,11 @@ class LiarsDice(game.Game):
     def set_up(self):
         """Set up the game. (None)"""
         # Mix up the players.
-        random.shuffle(self.players)
+        self.rng.shuffle(self.players)
         # Set up the scores.
         self.scores = {player.name: self.tokens for player in self.players}
         # Set up the dice.
-        self.dice = dice.Pool([6] * 5)
+        self.dice = dice.Pool([6] * 5, rng = self.rng)
         # Set up the tracking variables.
         self.reset()
         self.phase = 'start'
@@ -347,7 +347,7 @@ class Mate(game.Game):
         # Set up the dice.
         self.dice = {}
         for player in self.players:
-            self.dice[player] = dice.Pool([self.sides for die in range(5)])
+            self.dice[player] = dice.Pool([self.sides for die in range(5)], rng = self.rng)
         # Set up end of game tracking.
         self.skip_turns = 0
 
@@ -392,7 +392,7 @@ class MateBot(player.Bot):
 
     def choose_attacker(self):
         """Choose the column to attack with. (int)"""
-        self.attacker = random.randrange(5)
+        self.attacker = self.game.rng.randrange(5)
         return self.attacker
 
     def choose_target(self, valid):
@@ -402,7 +402,7 @@ class MateBot(player.Bot):
         Parameters:
         valid: The columns that can be attacked. (list of int)
         """
-        return random.choice(valid)
+        return self.game.rng.choice(valid)
 
 
 class MateAttackBot(MateBot):
@@ -246,7 +246,10 @@ class PigBotPenoptimal(player.Bot):
     parameters: The names of the parameters for the bot. (list of str)
 
     Attributes:
-    value: The the minimum turn score this bot will stop rolling on. (int)
+    data: The hold values by the bot's score and the best other score. (list)
+
+    Methods:
+    read_data: Read the hold values from the data file. (list of list of int)
 
     Overridden Methods:
     __init__
@@ -264,10 +267,7 @@ class PigBotPenoptimal(player.Bot):
         taken_names: Names already used by a player. (list of str)
         """
         super(PigBotPenoptimal, self).__init__(taken_names, 'o')
-        self.data = []
-        with open('{}/dice_games/penoptimus.txt'.format(utility.LOC)) as data_file:
-            for row in data_file:
-                self.data.append([int(hold) for hold in row.split(',')])
+        self.data = self.get_shared('pig-penoptimus', self.read_data)
 
     def ask(self, prompt):
         """
@@ -292,6 +292,14 @@ class PigBotPenoptimal(player.Bot):
         else:
             return 'stop'
 
+    def read_data(self):
+        """Read the hold values from the data file. (list of list of int)"""
+        data = []
+        with open('{}/dice_games/penoptimus.txt'.format(utility.LOC)) as data_file:
+            for row in data_file:
+                data.append([int(hold) for hold in row.split(',')])
+        return data
+
 
 class PigBotRolls(player.Bot):
     """
@@ -605,8 +613,9 @@ class Pig(game.Game):
         else:
             # Handle scoring.
             self.turn_score += self.die
-            message = 'You rolled a {}, your turn score is {}'
-            self.current_player.tell(message.format(self.die, self.turn_score))
+            if not self.headless:
+                message = 'You rolled a {}, your turn score is {}'
+                self.current_player.tell(message.format(self.die, self.turn_score))
             return True
 
     def do_scores(self, arguments):
@@ -657,7 +666,8 @@ class Pig(game.Game):
         go = super(Pig, self).player_action(player)
         if not go and not self.force_end:
             # Inform the player of their current total score.
-            player.tell("{}'s score is now {}.".format(player, self.scores[player]))
+            if not self.headless:
+                player.tell("{}'s score is now {}.".format(player, self.scores[player]))
             self.turn_score = 0
         return go
 
@@ -710,8 +720,8 @@ class Pig(game.Game):
         """Set up the game. (None)"""
         # Set up the die.
         if self.shuffle:
-            self.die = dice.ShuffleDie(6, self.shuffle)
+            self.die = dice.ShuffleDie(6, self.shuffle, self.rng)
         else:
-            self.die = dice.Die()
+            self.die = dice.Die(rng = self.rng)
         # Set up the tracking variable.
         self.turn_score = 0
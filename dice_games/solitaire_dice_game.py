@@ -203,7 +203,7 @@ class SolitaireDice(game.Game):
 
     def set_up(self):
         """Set up the game. (None)"""
-        self.dice = dice.Pool([6] * 5)
+        self.dice = dice.Pool([6] * 5, rng = self.rng)
         self.totals = [0] * 13
         self.discards = collections.defaultdict(int)
         self.free_free = False
@@ -26,7 +26,6 @@ TenThousand: A game of TenThousand. (game.Game)
 
 from __future__ import division
 
-import itertools
 import random
 
 from .. import dice
@@ -296,7 +295,7 @@ class GamblerBot(TenKBot):
         """Decide whether to roll for more or score what you've got. (str)"""
         # Roll with a chance equal to the chance you will score.
         to_roll = len(self.game.dice.get_held())
-        if random.random() < self.score_chance[to_roll]:
+        if self.game.rng.random() < self.score_chance[to_roll]:
             return 'roll'
         else:
             return 'score'
@@ -676,6 +675,12 @@ class ProbabilityBot(TenKBot):
     """
     A bot using expected values. (TenKBot)
 
+    Attributes:
+    chances: The chance of no score and the expected score by dice rolled. (dict)
+
+    Methods:
+    calculate_chances: Calculate the chances of scoring for each number of dice. (dict)
+
     Overridden Methods:
     roll_or_score
     set_up
@@ -689,22 +694,31 @@ class ProbabilityBot(TenKBot):
         ev += self.chances[num_dice]['expected'] * (1 - self.chances[num_dice]['p-zero'])
         return 'roll' if ev > 0 else 'score'
 
-    def set_up(self):
-        """Make the probablity calculations. (None)"""
-        super(ProbabilityBot, self).set_up()
-        # Calculate the probabilites.
-        self.chances = {}
+    def calculate_chances(self):
+        """Calculate the chances of scoring for each number of dice. (dict)"""
+        chances = {}
+        # The scores only depend on the scoring options.
+        key = ('ten-thousand-score', self.game.__class__.__name__, self.game.option_set.settings_text)
+        score = lambda roll: self.game.score_dice(roll, False)
         # Calculate for each possible number of dice rolled.
         for num_dice in range(1, 7):
             # Score all possible rolls.
-            rolls = itertools.product(*[range(1, 7) for die in range(num_dice)])
-            points = [self.game.score_dice(roll, False) for roll in rolls]
+            distribution = dice.score_outcomes(num_dice, score, key = key)
+            points = sum([roll_points * weight for roll_points, weight in distribution.items()])
+            num_zero = distribution.get(0, 0)
             # Store chance of no score and average scoring roll.
-            num_zero = points.count(0)
-            self.chances[num_dice] = {}
-            self.chances[num_dice]['p-zero'] = num_zero / 6 ** num_dice
-            self.chances[num_dice]['expected'] = sum(points) / (6 ** num_dice - num_zero)
-        self.chances[0] = self.chances[6]
+            chances[num_dice] = {}
+            chances[num_dice]['p-zero'] = num_zero / 6 ** num_dice
+            chances[num_dice]['expected'] = points / (6 ** num_dice - num_zero)
+        chances[0] = chances[6]
+        return chances
+
+    def set_up(self):
+        """Get the probablity calculations. (None)"""
+        super(ProbabilityBot, self).set_up()
+        # The chances only depend on the scoring options.
+        key = ('ten-thousand-chances', self.game.__class__.__name__, self.game.option_set.settings_text)
+        self.chances = self.get_shared(key, self.calculate_chances)
 
 
 class TenThousand(game.Game):
@@ -1080,9 +1094,9 @@ class TenThousand(game.Game):
                         self.combo_scores[value][count] = mult * value
         # Set up the dice.
         if self.five_dice:
-            self.dice = dice.Pool([6] * 5)
+            self.dice = dice.Pool([6] * 5, rng = self.rng)
         else:
-            self.dice = dice.Pool([6] * 6)
+            self.dice = dice.Pool([6] * 6, rng = self.rng)
         # Set the wild.
         if self.wild:
             self.dice.dice[-1].sides[1] = -1
@@ -1351,7 +1365,7 @@ class TenThousand(game.Game):
         self.entered = {player.name: False for player in self.players}
         self.strikes = {player.name: 0 for player in self.players}
         # Randomize the turn order.
-        random.shuffle(self.players)
+        self.rng.shuffle(self.players)
 
     def score_dice(self, values, validate = True):
         """
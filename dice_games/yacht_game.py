@@ -1159,7 +1159,7 @@ class Yacht(game.Game):
     def set_up(self):
         """Set up the game. (None)"""
         # Set up the dice.
-        self.dice = dice.Pool([6] * 5)
+        self.dice = dice.Pool([6] * 5, rng = self.rng)
         self.roll_count = 1
         # Set up the scores.
         score_base = {category.name: None for category in self.score_cats}
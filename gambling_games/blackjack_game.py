@@ -807,7 +807,7 @@ class Blackjack(game.Game):
         self.dealer_skip = False
         # Set up the deck.
         self.deck = cards.Deck(decks = self.decks, shuffle_size = 17 * self.decks,
-            rank_set = BLACKJACK_RANKS)
+            rank_set = BLACKJACK_RANKS, rng = self.rng)
         self.deck.shuffle()
         # Set up default hands.
         self.dealer_hand = BlackjackHand(deck = self.deck)
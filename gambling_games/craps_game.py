@@ -690,7 +690,7 @@ class Craps(game.Game):
         self.point = 0
         self.force_roll = 0
         # Set up the dice.
-        self.dice = dice.Pool()
+        self.dice = dice.Pool(rng = self.rng)
         # Set up the bets.
         self.bet_classes = {}
         classes = [CrapsBet]
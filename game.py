@@ -6,29 +6,36 @@ The base game object for t_games.
 Copyright (C) 2018-2020 by Craig O'Brien and the t_games contributors.
 See the top level __init__.py file for details on the t_games license.
 
+Constants:
+REGISTRY_FILE: The location of the cached game registry. (str)
+
 Classes:
 Game: A game with a text interface. (OtherCmd)
 Fireball: A game of blowing things up. (Game)
 Flip: A test game of flipping coins. (Game)
 FlipBot: A bot to play Flip against. (Player)
+GameStub: A stand-in for a game class that is imported when needed. (object)
 Sorter: A test game of sorting a sequence. (Game)
 
 Functions:
+build_registry: Import all of the games and record them in the registry. (list)
+find_game_files: Find the Python files that define games. (list of str)
 load_games: Load all of the games defined locally. (tuple of dict)
+read_registry: Read the game registry, if it is up to date. (list)
+tournament_worker: Run part of a parallel tournament in another process. (dict)
 """
 
 
 from __future__ import division, print_function
 
 import glob
-try:
-    from StringIO import StringIO
-except ImportError:
-    from io import StringIO
+import importlib
 import itertools
 import math
+import multiprocessing
 import operator
 import os
+import pickle
 import random
 import re
 import sys
@@ -37,15 +44,27 @@ from . import dice
 from . import options
 from . import other_cmd
 from . import player
+from . import profiling
+from . import replay
 from . import utility
 
 
+# The location of the cached game registry.
+REGISTRY_FILE = os.path.join(utility.LOC, 'game_registry.txt')
+
+
 class Game(other_cmd.OtherCmd):
     """
     A game with a text interface. (OtherCmd)
 
     In non-solitaire games, the players attribute should be set in handle_options.
 
+    A game object can be played many times, as in tournaments and benchmarks.
+    The option settings and anything built in __init__ or handle_options last
+    for all of those games. The state tracked for every game is reset by
+    reset_game at the start of play, and state specific to the game should be
+    reset in set_up.
+
     The flags attribute represents a bunch of binary flags:
         1: Options were set by the player.
         2: Internal command tracking.
@@ -79,14 +98,23 @@ class Game(other_cmd.OtherCmd):
     force_end: How to force the end of the game. (str)
     gipfed: The names of games gipfed to. (list of str)
     gonzo: A flag indicating the gonzo option was used. (bool)
+    headless: A flag for skipping output that no one will see. (bool)
     human: The primary player of the game. (Player)
+    input_log: The human's inputs for the last game played, if recording. (InputLog)
     interface: The interface that started the game playing. (Interface)
+    last_seed: The seed for the random number generators in the last game. (int)
     next_player: The player to force to be the next player. (player.Player)
     option_set: The definitions of allowed options for the game (OptionSet)
     player_index: The index in self.players of the currently acting player. (int)
     players: The players in the game. (list of player.Player)
+    profile: Timings for the last game played, if profiling. (profiling.Profile)
+    profiling: A flag for timing the parts of each game played. (bool)
     raw_options: The options as given by the play command. (str)
+    recording: A flag for logging the human's inputs to each game played. (bool)
+    rng: The random number generator for the game. (random.Random)
     scores: The players' scores in the game. (dict of str: int)
+    seed: The seed for each game, or None for a new seed every game. (int or None)
+    set_up_seed: The seed for the random number generators during set up. (int)
     silent: A flag for suppressing pre-game output. (bool)
     turns: The number of turns played in the game. (int)
     win_loss_draw: A list of the player's results in the game. (list of int)
@@ -103,15 +131,20 @@ class Game(other_cmd.OtherCmd):
     do_xyzzy: Nothing happens. (None)
     game_over: Check for the end of the game. (bool)
     gipf_check: Check for successful gipfing. (int)
+    handle_cmd: Check text input for a valid command, timing it if profiling. (bool)
     handle_options: Handle game options and set the player list. (None)
     help_xyzzy: Help for the xyzzy command. (None)
+    parallel_tournament: Run a tournament of the game in multiple processes. (dict)
     play: Play the game. (list of int)
     player_action: Handle a player's turn or other player actions. (bool)
+    reset_game: Reset the state tracked for every game. (None)
+    seed_random: Seed the random number generators. (int)
     set_options: Define the options for the game. (bool)
     set_players: Reset/change the list of players. (None)
     set_up: Handle any pre-game tasks. (None)
     skip_player: Skip a player in the turn sequence. (player.Player)
     sorted_scores: Get a list of player names sorted by score. (list of tuple)
+    timed: Call a function, timing it if profiling. (object)
     tournament: Run a tournament of the game. (dict)
     wins_by_score: Calculate the win-loss-draw record based on scores. (tuple)
 
@@ -144,15 +177,19 @@ class Game(other_cmd.OtherCmd):
     options = '\nNo options have been specified for this game.\n'
     rules = '\nNo rules have been specified for this game.\n'
 
-    def __init__(self, human, raw_options, interface = None, silent = False):
+    def __init__(self, human, raw_options, interface = None, silent = False, seed = None):
         """
         Set up the game. (None)
 
+        The random number generators are seeded before the options are handled, so
+        that a given seed sets up the game the same way every time.
+
         Parameters:
         human: The primary player of the game. (player.Player)
         raw_options: The user's option choices as provided by the interface. (str)
         interface: The interface that started the game playing. (interface.Interface)
         silent: A flag for supressing the greeting. (bool)
+        seed: The seed for setting up and playing the game. (int or None)
         """
         # Set the specified attributes.
         self.human = human
@@ -162,7 +199,16 @@ class Game(other_cmd.OtherCmd):
         # Set the default attributes.
         self.flags = 0
         self.gipfed = []
+        self.headless = getattr(self.human, 'headless', False)
+        self.input_log = None
+        self.last_seed = None
         self.next_player = None
+        self.profile = None
+        self.profiling = False
+        self.recording = False
+        self.rng = random.Random()
+        self.seed = seed
+        self.set_up_seed = self.seed_random(self.seed)
         # Inherit aliases and help text from parent classes.
         self.aliases = {}
         self.help_text = {}
@@ -172,7 +218,7 @@ class Game(other_cmd.OtherCmd):
             if hasattr(cls, 'help_text'):
                 self.help_text.update(cls.help_text)
         # Introduce yourself.
-        if self.name != 'Fireball' and not self.silent:
+        if self.name != 'Fireball' and not (self.silent or self.headless):
             self.human.tell('\nWelcome to a game of {}, {}.'.format(self.name, self.human))
         # Define and process the game options.
         self.option_set = options.OptionSet(self)
@@ -392,7 +438,7 @@ class Game(other_cmd.OtherCmd):
     def game_over(self):
         """Check for the end of the game. (bool)"""
         # Dummy random determination of game end.
-        roll = random.randint(1, 3)
+        roll = self.rng.randint(1, 3)
         if roll == 1:
             self.human.tell('You lose.')
             self.win_loss_draw[1] = 1
@@ -473,6 +519,24 @@ class Game(other_cmd.OtherCmd):
         else:
             return 'invalid-game', 1
 
+    def handle_cmd(self, text):
+        """
+        Check text input for a valid command, timing it if profiling. (bool)
+
+        The return value is a flag indicating a valid command.
+
+        Parameters:
+        text: The raw text input by the user. (str)
+        """
+        if self.profile is None:
+            return super(Game, self).handle_cmd(text)
+        # Get the name of the method that will handle the command.
+        command = text.strip().partition(' ')[0].lower()
+        method = 'do_' + self.aliases.get(command, command)
+        if not hasattr(self, method):
+            method = 'default'
+        return self.profile.time('command', method, super(Game, self).handle_cmd, text)
+
     def handle_options(self):
         """Handle game options and set the player list. (None)"""
         self.option_set.handle_settings(self.raw_options)
@@ -493,6 +557,71 @@ class Game(other_cmd.OtherCmd):
             # Usually, just show the classic nothing happens.
             self.human.tell('\nNothing happens.')
 
+    def parallel_tournament(self, players, rounds, processes = None, seed = None):
+        """
+        Run a tournament of the game in multiple processes. (dict)
+
+        The rounds are split as evenly as possible between the processes. Each
+        process sets up its own copy of the game with the same option settings,
+        seeds the random module with its own seed, and runs a standard tournament.
+        The results are merged in process order, so a given seed and number of
+        processes always gives the same results. If the game is profiling, the
+        profiles from all of the processes are added together.
+
+        Parameters:
+        players: The players in the tournament. (list of player.Player)
+        rounds: The number of rounds to play. (int)
+        processes: The number of processes to use, defaults to the CPU count. (int)
+        seed: The seed for generating the per-process seeds. (int or None)
+        """
+        # Get the number of processes.
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        processes = max(1, min(processes, rounds))
+        # Package the players without their links to this game.
+        player_games = [getattr(player, 'game', None) for player in players]
+        try:
+            for player in players:
+                player.game = None
+            player_data = pickle.dumps(players, pickle.HIGHEST_PROTOCOL)
+        finally:
+            for player, player_game in zip(players, player_games):
+                player.game = player_game
+        # Set up the jobs for the processes.
+        seeder = random.Random(seed)
+        settings_text = self.option_set.settings_text or 'none'
+        base_rounds, extra_rounds = divmod(rounds, processes)
+        jobs = []
+        for process_index in range(processes):
+            process_rounds = base_rounds + (process_index < extra_rounds)
+            process_seed = seeder.randrange(utility.MAX_INT)
+            jobs.append((self.__class__, settings_text, player_data, process_rounds, process_seed,
+                self.profiling))
+        # Run the jobs.
+        if processes == 1:
+            job_results = [tournament_worker(jobs[0])]
+        else:
+            pool = multiprocessing.Pool(processes)
+            try:
+                job_results = pool.map(tournament_worker, jobs)
+            finally:
+                pool.close()
+                pool.join()
+        # Merge the results from each process by player position.
+        score_tracking = [[] for player in players]
+        place_tracking = [[] for player in players]
+        for job_result in job_results:
+            for player_index in range(len(players)):
+                score_tracking[player_index].extend(job_result['scores'][player_index])
+                place_tracking[player_index].extend(job_result['places'][player_index])
+        results = {'scores': dict(zip(players, score_tracking)),
+            'places': dict(zip(players, place_tracking))}
+        if self.profiling:
+            results['profile'] = profiling.Profile()
+            for job_result in job_results:
+                results['profile'].merge(job_result['profile'])
+        return results
+
     def play(self):
         """
         Play the game. (list of int)
@@ -507,41 +636,57 @@ class Game(other_cmd.OtherCmd):
             6: The options used for the game.
         """
         # Set up the game.
-        self.win_loss_draw = [0, 0, 0]
-        self.turns = 0
-        self.force_end = ''
-        self.flags &= 257  # reset everything but the options and match play flags.
-        self.scores = {}
-        self.set_up()
-        if not self.scores:
-            self.scores = {player: 0 for player in self.players}
-        for player in self.players:
-            player.game = self
-            player.set_up()
-        # Loop through the players repeatedly.
-        self.player_index = 0
-        while True:
-            # Loop through player actions until their turn is done.
-            self.current_player = self.players[self.player_index]
-            while self.player_action(self.current_player):
-                pass
-            self.turns += 1
-            # Check for the end of game.
-            if self.force_end or self.game_over():
-                break
-            # Move to the next player.
-            if self.next_player:
-                self.player_index = self.players.index(self.next_player)
-                self.next_player = None
-            else:
-                self.player_index = (self.player_index + 1) % len(self.players)
-        # Clean up the game.
-        self.clean_up()
-        for player in self.players:
-            player.clean_up()
+        self.reset_game()
+        self.profile = profiling.Profile() if self.profiling else None
+        if self.recording:
+            self.input_log = replay.InputLog(self.name, self.option_set.settings_text, self.set_up_seed,
+                self.last_seed, self.human.name)
+            self.input_log.watch(self.human)
+        watched = []
+        try:
+            self.timed('game', 'set_up', self.set_up)
+            if not self.scores:
+                self.scores = {player: 0 for player in self.players}
+            for player in self.players:
+                player.game = self
+                self.timed('player set_up', player.name, player.set_up)
+                if self.profile:
+                    self.profile.watch(player)
+                    watched.append(player)
+            # Loop through the players repeatedly.
+            self.player_index = 0
+            while True:
+                # Loop through player actions until their turn is done.
+                self.current_player = self.players[self.player_index]
+                while self.timed('action', self.current_player.name, self.player_action, self.current_player):
+                    pass
+                self.turns += 1
+                # Check for the end of game.
+                if self.force_end or self.timed('game', 'game_over', self.game_over):
+                    break
+                # Move to the next player.
+                if self.next_player:
+                    self.player_index = self.players.index(self.next_player)
+                    self.next_player = None
+                else:
+                    self.player_index = (self.player_index + 1) % len(self.players)
+            # Clean up the game.
+            self.timed('game', 'clean_up', self.clean_up)
+            for player in self.players:
+                self.timed('player clean_up', player.name, player.clean_up)
+        finally:
+            # Restore the players' ask methods, even if the game failed.
+            for player in watched:
+                self.profile.unwatch(player)
+            if self.recording:
+                self.input_log.unwatch(self.human)
         self.gipfed = []
+        if self.profile:
+            self.profile.games = 1
         # Report the results.
         results = [self.scores[self.human], self.turns, self.flags, self.option_set.settings_text]
+        if self.recording:
+            self.input_log.results = self.win_loss_draw + results[:3]
         return self.win_loss_draw + results
 
     def player_action(self, player):
@@ -553,10 +698,39 @@ class Game(other_cmd.OtherCmd):
         Parameters:
         player: The player whose turn it is. (Player)
         """
-        player.tell(self)
+        if not self.headless:
+            player.tell(self)
         move = player.ask(self.move_query)
         return self.handle_cmd(move)
 
+    def reset_game(self):
+        """Reset the state tracked for every game. (None)"""
+        self.last_seed = self.seed_random(self.seed)
+        self.win_loss_draw = [0, 0, 0]
+        self.turns = 0
+        self.force_end = ''
+        self.flags &= 257  # reset everything but the options and match play flags.
+        self.scores = {}
+        self.gipfed = []
+        self.next_player = None
+
+    def seed_random(self, seed = None):
+        """
+        Seed the random number generators. (int)
+
+        The game's random number generator is seeded, and then the random module is
+        seeded from it, so that code still using the random module works out the
+        same way for the same seed. The return value is the seed used.
+
+        Parameters:
+        seed: The seed to use, defaults to a new seed from the random module. (int or None)
+        """
+        if seed is None:
+            seed = random.randrange(utility.MAX_INT)
+        self.rng.seed(seed)
+        random.seed(self.rng.randrange(utility.MAX_INT))
+        return seed
+
     def set_options(self):
         """Define the options for the game. (None)"""
         pass
@@ -606,27 +780,53 @@ class Game(other_cmd.OtherCmd):
         scores.sort(reverse = True)
         return scores
 
+    def timed(self, kind, name, function, *args):
+        """
+        Call a function, timing it if profiling. (object)
+
+        The return value is the return value of the function.
+
+        Parameters:
+        kind: The kind of thing being timed. (str)
+        name: The name of the thing being timed. (str)
+        function: The function to call. (callable)
+
+        Other parameters are passed on to the function.
+        """
+        if self.profile is None:
+            return function(*args)
+        return self.profile.time(kind, name, function, *args)
+
     def tournament(self, players, rounds):
         """
         Run a tournament of the game. (dict)
 
+        The game is played headless during the tournament, with any output that
+        still gets printed thrown away. If the game is profiling, the profiles of
+        all the games are added together under the 'profile' key.
+
         Parameters:
         players: The players in the tournament. (list of player.Player)
         rounds: The number of rounds to play. (int)
         """
         # Mute the output.
         save_stdout = sys.stdout
-        sys.stdout = StringIO()
+        sys.stdout = open(os.devnull, 'w')
+        headless_hold = self.headless
+        self.headless = True
         try:
             # Set up the players.
             human_hold = self.set_players(players)
             # Set up results tracking.
             score_tracking = {player: [] for player in self.players}
             place_tracking = {player: [] for player in self.players}
+            tournament_profile = profiling.Profile()
             # Run the tournament.
             for game_index in range(rounds):
                 # Run the game.
                 results = self.play()
+                if self.profile is not None:
+                    tournament_profile.merge(self.profile)
                 # Track the results.
                 rankings = sorted(self.scores.values(), reverse = True)
                 for player, score in self.scores.items():
@@ -635,8 +835,13 @@ class Game(other_cmd.OtherCmd):
         finally:
             # Clean up.
             self.human = human_hold
+            self.headless = headless_hold
+            sys.stdout.close()
             sys.stdout = save_stdout
-        return {'scores': score_tracking, 'places': place_tracking}
+        results = {'scores': score_tracking, 'places': place_tracking}
+        if self.profiling:
+            results['profile'] = tournament_profile
+        return results
 
     def wins_by_score(self, show_self = True, silent = False):
         """
@@ -669,7 +874,7 @@ class Game(other_cmd.OtherCmd):
         # Calculate the human's rank.
         human_rank = self.win_loss_draw[1] + 1
         # Report results.
-        if not silent:
+        if not (silent or self.headless):
             # Show the final game state.
             if show_self:
                 self.human.tell(self)
@@ -738,7 +943,7 @@ class Fireball(Game):
         if not dice_count:
             return False
         sides = len(set(result[0] for result in fire_results)) * 2 + 2
-        pool = dice.Pool([sides] * dice_count)
+        pool = dice.Pool([sides] * dice_count, rng = self.rng)
         # Get the bonus to the roll.
         all_categories = set()
         for result in fire_results:
@@ -810,7 +1015,7 @@ class Flip(Game):
             self.bot = FlipBot('Tosser')
         # Set up the players as the human and the bot.
         self.players = [self.human, self.bot]
-        random.shuffle(self.players)
+        self.rng.shuffle(self.players)
         return True
 
     def player_action(self, player):
@@ -827,17 +1032,19 @@ class Flip(Game):
             return self.handle_cmd(flips)
         # Flip a coin the specified number of times.
         for flip_index in range(int(flips)):
-            if random.random() < 0.5:
+            if self.rng.random() < 0.5:
                 flip = 'tails'
             else:
                 flip = 'heads'
-            player.tell('Flip #{} is {}.'.format(flip_index + 1, flip))
+            if not self.headless:
+                player.tell('Flip #{} is {}.'.format(flip_index + 1, flip))
         # Record the final flip.
         if flip == 'heads':
             self.scores[player] += 1
         # Update the player.
-        player.tell('You now have {} heads.'.format(self.scores[player]))
-        player.tell()
+        if not self.headless:
+            player.tell('You now have {} heads.'.format(self.scores[player]))
+            player.tell()
 
 
 class FlipBot(player.Player):
@@ -861,8 +1068,9 @@ class FlipBot(player.Player):
         Parameters:
         prompt: The question being asked of the player. (str)
         """
-        flips = random.randint(1, 3)
-        self.game.human.tell('{} chooses to flip {}.'.format(self, self.count_words[flips]))
+        flips = self.game.rng.randint(1, 3)
+        if not self.game.headless:
+            self.game.human.tell('{} chooses to flip {}.'.format(self, self.count_words[flips]))
         return str(flips)
 
     def tell(self, *args, **kwargs):
@@ -953,7 +1161,7 @@ class Sorter(Game):
         # Set up the sequence to sort.
         self.sequence = list(range(self.length))
         while self.sequence == sorted(self.sequence):
-            random.shuffle(self.sequence)
+            self.rng.shuffle(self.sequence)
         # Determine the minimum number of swaps.
         self.minimum = 0
         check = self.sequence[:]
@@ -964,33 +1172,176 @@ class Sorter(Game):
                 self.minimum += 1
 
 
-def load_games():
+class GameStub(object):
     """
-    Load all of the games defined locally. (tuple of dict)
+    A stand-in for a game class that is imported when needed. (object)
 
-    The return value is two dictionaries. The first is game classes keyed to lower
-    case game names and aliases. The second is tree of categories, each one with
-    a dictionary of sub-categories and a list of games in that category.
+    The stub holds the class attributes needed for the menu. Any other attribute
+    access, or calling the stub to create a game, imports the game's module and
+    uses the real game class.
+
+    Attributes:
+    aka: Other names for the game. (list of str)
+    categories: The menu categories for the game. (list of str)
+    class_name: The name of the game class. (str)
+    game_class: The game class, once it has been imported. (Game)
+    module_name: The full name of the module the game is in. (str)
+    name: The name of the game. (str)
+    num_options: The number of settable options for the game. (int)
+
+    Methods:
+    load: Import the game class. (Game)
+
+    Overridden Methods:
+    __init__
+    __call__
+    __getattr__
+    __repr__
     """
-    # Find the Python game files.
-    game_files = []
+
+    def __init__(self, module_name, class_name, name, aka, categories, num_options):
+        """
+        Set up the stub's attributes. (None)
+
+        Parameters:
+        module_name: The full name of the module the game is in. (str)
+        class_name: The name of the game class. (str)
+        name: The name of the game. (str)
+        aka: Other names for the game. (list of str)
+        categories: The menu categories for the game. (list of str)
+        num_options: The number of settable options for the game. (int)
+        """
+        self.module_name = module_name
+        self.class_name = class_name
+        self.name = name
+        self.aka = aka
+        self.categories = categories
+        self.num_options = num_options
+        self.game_class = None
+
+    def __call__(self, *args, **kwargs):
+        """
+        Create an instance of the game. (Game)
+
+        Parameters:
+        The parameters are as per the game's __init__ method.
+        """
+        return self.load()(*args, **kwargs)
+
+    def __getattr__(self, attr):
+        """
+        Get attributes from the real game class. (object)
+
+        Parameters:
+        attr: The name of the attribute. (str)
+        """
+        # Don't import for special attributes or before initialization is done.
+        if attr.startswith('__') or attr == 'game_class':
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
+
+    def __repr__(self):
+        """Generate a debugging text representation. (str)"""
+        return '<GameStub for {}.{}>'.format(self.module_name, self.class_name)
+
+    def load(self):
+        """Import the game class. (Game)"""
+        if self.game_class is None:
+            module = importlib.import_module(self.module_name)
+            self.game_class = getattr(module, self.class_name)
+        return self.game_class
+
+
+def build_registry(game_files):
+    """
+    Import all of the games and record them in the registry. (list)
+
+    The return value is a list of argument tuples for GameStub. The registry is
+    saved with the modification times of the game files, so that it can be
+    checked for being out of date.
+
+    Parameters:
+    game_files: The Python files that define games. (list of str)
+    """
+    # Import the Python files.
+    module_names = set([__name__])
+    for game_file in game_files[1:]:
+        module_name = game_file[len(utility.LOC) - 7:-3].replace(os.sep, '.')
+        importlib.import_module(module_name)
+        module_names.add(module_name)
+    # Search through all of the game.Game sub-classes.
+    records = []
+    search = [Game]
+    while search:
+        game_class = search.pop()
+        # Only record games that can be imported by name.
+        module = sys.modules[game_class.__module__]
+        if game_class.__module__ in module_names and getattr(module, game_class.__name__, None) is game_class:
+            records.append((game_class.__module__, game_class.__name__, game_class.name,
+                list(game_class.aka), list(game_class.categories), game_class.num_options))
+        # Search the full hierarchy of sub-classes.
+        search.extend(game_class.__subclasses__())
+    # Save the registry, if possible.
+    lines = ['file\t{}\t{!r}'.format(game_file[len(utility.LOC) + 1:], os.path.getmtime(game_file))
+        for game_file in game_files]
+    for module_name, class_name, name, aka, categories, num_options in records:
+        fields = (module_name, class_name, name, '/'.join(aka), '/'.join(categories), num_options)
+        lines.append('game\t{}\t{}\t{}\t{}\t{}\t{}'.format(*fields))
+    try:
+        with open(REGISTRY_FILE, 'w') as registry_file:
+            registry_file.write('\n'.join(lines) + '\n')
+    except (IOError, OSError):
+        pass
+    return records
+
+
+def find_game_files():
+    """
+    Find the Python files that define games. (list of str)
+
+    This module is always the first file returned.
+    """
+    game_files = [os.path.join(utility.LOC, 'game.py')]
     base = '{0}{1}*{1}'.format(utility.LOC, os.sep)
     while True:
         new_files = glob.glob(base + '*_game.py')
         if new_files:
-            game_files.extend(new_files)
+            game_files.extend(sorted(new_files))
             base += '*' + os.sep
         else:
             break
-    # Import the Python files.
-    for game_file in game_files:
-        __import__(game_file[len(utility.LOC) - 7:-3].replace(os.sep, '.'))
-    # Search through all of the game.Game sub-classes.
-    categories = {'sub-categories': {}, 'games': []}
-    games = {}
+    return game_files
+
+
+def load_games():
+    """
+    Load all of the games defined locally. (tuple of dict)
+
+    The return value is two dictionaries. The first is game classes keyed to lower
+    case game names and aliases. The second is tree of categories, each one with
+    a dictionary of sub-categories and a list of games in that category.
+
+    Games from the game registry are GameStub instances, so that game modules are
+    only imported when they are needed.
+    """
+    # Get the game data, updating the registry if needed.
+    game_files = find_game_files()
+    records = read_registry(game_files)
+    if records is None:
+        records = build_registry(game_files)
+    game_classes = [GameStub(*record) for record in records]
+    # Add any other games that are already loaded, such as test games.
+    registered = set(record[:2] for record in records)
     search = [Game]
     while search:
         game_class = search.pop()
+        if (game_class.__module__, game_class.__name__) not in registered:
+            game_classes.append(game_class)
+        search.extend(game_class.__subclasses__())
+    # Search through all of the games.
+    categories = {'sub-categories': {}, 'games': []}
+    games = {}
+    for game_class in game_classes:
         # Store game by name.
         games[game_class.name.lower()] = game_class
         for alias in game_class.aka:
@@ -1005,11 +1356,81 @@ def load_games():
                 category = category['sub-categories'][game_category]
             # Store the game in the terminal category.
             category['games'].append(game_class)
-        # Search the full hierarchy of sub-classes.
-        search.extend(game_class.__subclasses__())
     return games, categories
 
 
+def read_registry(game_files):
+    """
+    Read the game registry, if it is up to date. (list)
+
+    The return value is a list of argument tuples for GameStub, or None if the
+    registry is missing or out of date.
+
+    Parameters:
+    game_files: The Python files that define games. (list of str)
+    """
+    # Read the registry.
+    try:
+        with open(REGISTRY_FILE) as registry_file:
+            lines = registry_file.read().splitlines()
+    except (IOError, OSError):
+        return None
+    # Parse the registry.
+    file_times = {}
+    records = []
+    try:
+        for line in lines:
+            fields = line.split('\t')
+            if fields[0] == 'file':
+                file_times[fields[1]] = fields[2]
+            elif fields[0] == 'game':
+                module_name, class_name, name, aka, categories, num_options = fields[1:]
+                aka = aka.split('/') if aka else []
+                records.append((module_name, class_name, name, aka, categories.split('/'), int(num_options)))
+    except ValueError:
+        return None
+    # Check the registry against the current game files.
+    current_times = {}
+    for game_file in game_files:
+        current_times[game_file[len(utility.LOC) + 1:]] = repr(os.path.getmtime(game_file))
+    if current_times != file_times:
+        return None
+    return records
+
+
+def tournament_worker(job):
+    """
+    Run part of a parallel tournament in another process. (dict)
+
+    The job is a tuple of the game class, the option settings text, the pickled
+    players, the number of rounds, the random seed, and the profiling flag. The
+    return value is the tournament results as lists in the same order as the
+    players, since the players can't be sent back to the parent process with
+    their links to this process's game.
+
+    Parameters:
+    job: The details of the tournament to run. (tuple)
+    """
+    game_class, settings_text, player_data, rounds, seed, profiling_flag = job
+    players = pickle.loads(player_data)
+    random.seed(seed)
+    # Set up the game without any greetings.
+    save_stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        game = game_class(players[0], settings_text)
+    finally:
+        sys.stdout.close()
+        sys.stdout = save_stdout
+    # Run the tournament.
+    game.profiling = profiling_flag
+    results = game.tournament(players, rounds)
+    job_results = {key: [results[key][player] for player in players] for key in ('scores', 'places')}
+    if profiling_flag:
+        job_results['profile'] = results['profile']
+    return job_results
+
+
 if __name__ == '__main__':
     # Run the unit testing.
     from t_tests.game_test import *
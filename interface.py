@@ -18,6 +18,7 @@ Statistics: Statistics on a sequence of t_games results. (object)
 
 Functions:
 excel_column: Convert a number into a Excel style column header. (str)
+group_results: Group game results by the name of the game. (dict)
 """
 
 
@@ -93,6 +94,7 @@ class Interface(other_cmd.OtherCmd):
     games: The games available to be played. (dict of str: game.Game)
     human: The player navigating the menu. (player.Player)
     previous: Previous menu locations visited. (list)
+    stats_cache: Game statistics and results seen, by game and filter. (dict)
     titles: The titles of the previous categories visited. (list)
     valve: A random valve. Figure out what it's for yourself. (RandomValve)
 
@@ -105,6 +107,7 @@ class Interface(other_cmd.OtherCmd):
     Methods:
     category_games: Get the games in the current category. (list of game.Game)
     cell_start: Set the starting population for the cell command. (str)
+    count_results: Count all of the user's results. (int)
     do_cell: Run an elementary cellular automaton. (bool)
     do_credits: Show the programming credits for the interface. (bool)
     do_games: List the available games. (bool)
@@ -115,6 +118,8 @@ class Interface(other_cmd.OtherCmd):
     do_random: Play a random game. (bool)
     do_rules: Show the rules for the specified game. (bool)
     do_stats: Show game statistics. (bool)
+    find_results: Get the user's results for some games. (list of list)
+    game_stats: Get up to date statistics for a game. (Statistics)
     menu: Run the game selection menu. (None)
     play_game: Play a selected game. (None)
     show_menu: Display the menu options to the user. (dict)
@@ -141,6 +146,7 @@ class Interface(other_cmd.OtherCmd):
         # Set the attributes.
         self.human = human
         self.games, self.categories = game.load_games()
+        self.stats_cache = {}
         self.valve = RandomValve()
         # Inherit aliases from parent classes.
         self.aliases = {}
@@ -205,6 +211,12 @@ class Interface(other_cmd.OtherCmd):
             start = args['symbol'].center(args['width'])
         return start
 
+    def count_results(self):
+        """Count all of the user's results. (int)"""
+        if hasattr(self.human, 'store'):
+            return len(self.human.store)
+        return len(self.human.results)
+
     def default(self, line):
         """
         Handle unrecognized user input. (bool)
@@ -481,23 +493,21 @@ class Interface(other_cmd.OtherCmd):
         if not arguments:
             # Find the relevant games.
             names = [game.name for game in self.category_games()]
-            relevant = [result for result in self.human.results if result[0] in names]
+            relevant = self.find_results(names)
             # Show the category and individual game stats.
             stats = Statistics(relevant, options, 'Category Statistics')
             self.human.tell(stats)
-            games = sorted(set([result[0] for result in relevant]))
-            for game in games:
-                relevant = [result for result in self.human.results if result[0] == game]
-                stats = Statistics(relevant, options = options)
+            game_results = group_results(relevant)
+            for game in sorted(game_results):
+                stats = Statistics(game_results[game], options = options)
                 self.human.tell(stats)
         # Handle specific game stats.
         elif arguments.lower() in self.games:
             # Find the relevant results.
             game_class = self.games[arguments.lower()]
-            relevant = [result for result in self.human.results if result[0] == game_class.name]
-            if relevant:
+            stats = self.game_stats(game_class.name, options)
+            if stats is not None:
                 # Show any relevant statistics
-                stats = Statistics(relevant, options = options)
                 self.human.tell(stats)
             else:
                 # Give a warning if there are no matching resutls.
@@ -505,23 +515,72 @@ class Interface(other_cmd.OtherCmd):
         # Handle overall stats.
         elif arguments.lower() == 'all':
             # Show the overall statistics.
-            stats = Statistics(self.human.results, options, 'Overall Statistics')
+            relevant = self.find_results()
+            stats = Statistics(relevant, options, 'Overall Statistics')
             self.human.tell(stats)
-            games = sorted(set([result[0] for result in self.human.results]))
+            game_results = group_results(relevant)
             # Show the stats for the individual games.
-            for game in games:
-                relevant = [result for result in self.human.results if result[0] == game]
-                stats = Statistics(relevant, options = options)
+            for game in sorted(game_results):
+                stats = Statistics(game_results[game], options = options)
                 self.human.tell(stats)
         # Handle the session statistics.
         elif arguments.lower() == 'session':
-            session_results = self.human.results[self.human.session_index:]
+            session_results = self.find_results(start = self.human.session_index)
             session_stats = Statistics(session_results, 'all', 'Session Statistics')
             self.human.tell(session_stats)
         # Show an error for invalid game names.
         else:
             self.human.error("I don't know that game.")
 
+    def find_results(self, game_names = None, start = 0):
+        """
+        Get the user's results for some games. (list of list)
+
+        If the user has a results store, it is used to look up the results rather
+        than searching through all of them.
+
+        Parameters:
+        game_names: The names of the games to get results for. (list of str)
+        start: The number of results to skip over. (int)
+        """
+        if hasattr(self.human, 'store'):
+            return self.human.store.select(game_names, start = start)
+        results = self.human.results[start:]
+        if game_names is not None:
+            results = [result for result in results if result[0] in game_names]
+        return results
+
+    def game_stats(self, game_name, options):
+        """
+        Get up to date statistics for a game. (Statistics)
+
+        Statistics are cached by game and filter options, and only the results
+        added since they were last used are added to them. If there are no results
+        for the game, None is returned.
+
+        Parameters:
+        game_name: The name of the game. (str)
+        options: The options for filtering the results. (str)
+        """
+        key = (game_name, tuple(options.lower().split()))
+        if key in self.stats_cache:
+            # Add any new results to the cached statistics.
+            stats, seen = self.stats_cache[key]
+            new_results = self.find_results(start = seen)
+            for result in new_results:
+                if result[0] == game_name:
+                    stats.add_result(result)
+            seen += len(new_results)
+        else:
+            # Calculate new statistics.
+            seen = self.count_results()
+            relevant = self.find_results([game_name])
+            if not relevant:
+                return None
+            stats = Statistics(relevant, options = options)
+        self.stats_cache[key] = (stats, seen)
+        return stats
+
     def menu(self):
         """Run the game selection menu. (None)"""
         # Start at the top category.
@@ -557,7 +616,7 @@ class Interface(other_cmd.OtherCmd):
                     self.titles.pop()
                 # Check for quiting.
                 elif choice == 'Quit':
-                    if self.human.session_index < len(self.human.results):
+                    if self.find_results(start = self.human.session_index):
                         self.do_stats('session / cheat xyzzy gipf')
                         self.human.tell('\nThanks for playing! Come back soon!\n')
                     else:
@@ -574,12 +633,16 @@ class Interface(other_cmd.OtherCmd):
         """
         Play a selected game. (None)
 
+        For players with a folder, the inputs to the last game played are saved
+        there as last_game.tgil, so the game can be replayed.
+
         Parameters:
         game_class: The game to play. (subclass of game.Game)
         options: Options specified by the play command. (str)
         """
         # Set up the game.
         self.game = game_class(self.human, options, self)
+        self.game.recording = hasattr(self.human, 'folder_name')
         # Don't play if there are option related errors.
         if self.game.option_set.errors:
             return False
@@ -588,6 +651,9 @@ class Interface(other_cmd.OtherCmd):
             # Play the game.
             results = self.game.play()
             self.human.store_results(self.game.name, results)
+            # Save a record of the game for replays.
+            if self.game.recording:
+                self.game.input_log.save(os.path.join(self.human.folder_name, 'last_game.tgil'))
             # Show the statics, including the game just played.
             stats_options = []
             if results[5] & 2:
@@ -713,8 +779,12 @@ class Statistics(object):
     """
     Statistics on a sequence of t_games results. (object)
 
+    The statistics are kept as running totals, so that new results can be added
+    without recalculating everything.
+
     Attributes:
     game_wld: The per game win/loss/draw counts. (list of int)
+    medians: Running medians for scores and turns. (dict of tuple: RunningMedian)
     options: The options for filtering the results. (str)
     results: The categoriezed results. (dict of str: list)
     player_wld: The per player win/loss/draw counts. (list of int)
@@ -722,9 +792,11 @@ class Statistics(object):
     title: The title for the statistics. (str)
 
     Methods:
+    add_result: Add a new result to the statistics. (None)
+    bin_result: Categorize a result based on win, loss, or draw. (None)
     bin_results: Categorize results based on win, loss, or draw. (None)
     filter_results: Filter game results based on user requests. (list of lists)
-    sequence_stats: Calculate and store statistics for some numbers. (None)
+    sequence_stats: Update the statistics for a new number. (None)
 
     Overridden Methods:
     __init__
@@ -751,16 +823,20 @@ class Statistics(object):
             self.title = '{} Statistics'.format(results[0][0])
         # Set the default attributes.
         self.results, self.stats = {}, {}
+        self.medians = {}
         for result_type in ('win', 'loss', 'draw', 'overall'):
             self.results[result_type] = []
             self.stats[result_type] = {}
+            for prefix in ('scores', 'turns'):
+                self.medians[(result_type, prefix)] = utility.RunningMedian()
         self.results['overall'] = self.filter_results(results, self.options)
         self.game_wld, self.player_wld = [0, 0, 0], [0, 0, 0]
+        self.stats['overall']['current-streak'] = 0
+        self.stats['overall']['streak-type'] = 0
+        for result_type in ('win', 'loss', 'draw'):
+            self.stats[result_type]['longest-streak'] = 0
         # Calculate statistics.
         self.bin_results()
-        for result_type in ('win', 'loss', 'draw', 'overall'):
-            self.sequence_stats(result_type, 'scores', [result[4] for result in self.results[result_type]])
-            self.sequence_stats(result_type, 'turns', [result[5] for result in self.results[result_type]])
 
     def __bool__(self):
         """Boolean value of the stats, or are there results? (bool)"""
@@ -807,47 +883,67 @@ class Statistics(object):
         lines.append('You are currently on a {} game {} streak.'.format(current_streak, streak_name))
         return '\n'.join(lines)
 
+    def add_result(self, result):
+        """
+        Add a new result to the statistics. (None)
+
+        Parameters:
+        result: The raw game result. (list)
+        """
+        if not self.title:
+            self.title = '{} Statistics'.format(result[0])
+        if self.filter_results([result], self.options):
+            self.results['overall'].append(result)
+            self.bin_result(result)
+
+    def bin_result(self, result):
+        """
+        Categorize a result based on win, loss, or draw. (None)
+
+        Parameters:
+        result: A game result that passed the filters. (list)
+        """
+        win, loss, draw = result[1:4]
+        if result[-2] & 256:
+            # Handle match play.
+            if win > loss:
+                result_type, streak_type = 'win', 1
+            elif loss > win:
+                result_type, streak_type = 'loss', -1
+            else:
+                result_type, streak_type = 'draw', 0
+        else:
+            # Handle single games.
+            if not loss and not win:
+                result_type, streak_type = 'draw', 0
+            elif not loss:
+                result_type, streak_type = 'win', 1
+            else:
+                result_type, streak_type = 'loss', -1
+        self.results[result_type].append(result)
+        # Update the per-game and per-player stats.
+        self.game_wld[('win', 'loss', 'draw').index(result_type)] += 1
+        self.player_wld[0] += win
+        self.player_wld[1] += loss
+        self.player_wld[2] += draw
+        # Update the streaks.
+        overall = self.stats['overall']
+        if overall['current-streak'] and overall['streak-type'] == streak_type:
+            overall['current-streak'] += 1
+        else:
+            overall['current-streak'] = 1
+            overall['streak-type'] = streak_type
+        longest = max(self.stats[result_type]['longest-streak'], overall['current-streak'])
+        self.stats[result_type]['longest-streak'] = longest
+        # Update the scores and turns.
+        for stat_type in (result_type, 'overall'):
+            self.sequence_stats(stat_type, 'scores', result[4])
+            self.sequence_stats(stat_type, 'turns', result[5])
+
     def bin_results(self):
         """Categorize results based on win, loss, or draw. (None)"""
-        # Loop through results storing totals and streak data.
-        wins = []
         for result in self.results['overall']:
-            win, loss, draw = result[1:4]
-            if result[-2] & 256:
-                # Handle match play.
-                if win > loss:
-                    self.results['win'].append(result)
-                    wins.append(1)
-                elif loss > win:
-                    self.results['loss'].append(result)
-                    wins.append(-1)
-                else:
-                    self.results['draw'].append(result)
-                    wins.append(0)
-            else:
-                # Handle single games.
-                if not loss and not win:
-                    self.results['draw'].append(result)
-                    wins.append(0)
-                elif not loss:
-                    self.results['win'].append(result)
-                    wins.append(1)
-                else:
-                    self.results['loss'].append(result)
-                    wins.append(-1)
-            # Update the per-player stats.
-            self.player_wld[0] += win
-            self.player_wld[1] += loss
-            self.player_wld[2] += draw
-        # Update the per-game stats.
-        self.game_wld = [len(self.results[result_type]) for result_type in ('win', 'loss', 'draw')]
-        # Get streaks.
-        current_streak, streak_type, longest_streaks = utility.streaks(wins)
-        self.stats['overall']['current-streak'] = current_streak
-        self.stats['overall']['streak-type'] = streak_type
-        self.stats['win']['longest-streak'] = longest_streaks[1]
-        self.stats['loss']['longest-streak'] = longest_streaks[-1]
-        self.stats['draw']['longest-streak'] = longest_streaks[0]
+            self.bin_result(result)
 
     def filter_results(self, results, options):
         """
@@ -910,20 +1006,29 @@ class Statistics(object):
         # Return the filtered data.
         return results
 
-    def sequence_stats(self, result_type, prefix, data):
+    def sequence_stats(self, result_type, prefix, value):
         """
-        Calculate and store statistics for some numbers. (None)
+        Update the statistics for a new number. (None)
 
         Paramters:
-        result_type: Win, loss, or draw. (str)
-        prefix: What the data represents. (str)
-        data: The numbers to get statistics for. (list of number)
+        result_type: Win, loss, draw, or overall. (str)
+        prefix: What the number represents. (str)
+        value: The number to add to the statistics. (number)
         """
-        if self.results[result_type]:
-            self.stats[result_type]['{}-mean'.format(prefix)] = utility.mean(data)
-            self.stats[result_type]['{}-median'.format(prefix)] = utility.median(data)
-            self.stats[result_type]['{}-min'.format(prefix)] = min(data)
-            self.stats[result_type]['{}-max'.format(prefix)] = max(data)
+        stats = self.stats[result_type]
+        median = self.medians[(result_type, prefix)]
+        median.add(value)
+        count = len(median)
+        if count == 1:
+            stats['{}-sum'.format(prefix)] = value
+            stats['{}-min'.format(prefix)] = value
+            stats['{}-max'.format(prefix)] = value
+        else:
+            stats['{}-sum'.format(prefix)] += value
+            stats['{}-min'.format(prefix)] = min(stats['{}-min'.format(prefix)], value)
+            stats['{}-max'.format(prefix)] = max(stats['{}-max'.format(prefix)], value)
+        stats['{}-mean'.format(prefix)] = stats['{}-sum'.format(prefix)] / float(count)
+        stats['{}-median'.format(prefix)] = median.median()
 
 
 def excel_column(n):
@@ -940,6 +1045,19 @@ def excel_column(n):
     return column
 
 
+def group_results(results):
+    """
+    Group game results by the name of the game. (dict)
+
+    Parameters:
+    results: The game results to group. (list of list)
+    """
+    groups = {}
+    for result in results:
+        groups.setdefault(result[0], []).append(result)
+    return groups
+
+
 if __name__ == '__main__':
     # Run the unit testing.
     from t_tests.interface_test import *
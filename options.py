@@ -6,6 +6,9 @@ Option handling for tgames.
 Copyright (C) 2018-2020 by Craig O'Brien and the t_games contributors.
 See the top level __init__.py file for details on the t_games license.
 
+Constants:
+PLAN_CACHE_SIZE: The most option plans to remember for one game class. (int)
+
 Classes:
 AllRange: A range that contains everything. (object)
 OptionSet: A set of options for a particular game. (object)
@@ -17,10 +20,15 @@ upper: Convert a string to upper case. (str)
 
 
 import collections
+import copy
 
 from . import utility
 
 
+# The most option plans to remember for one game class.
+PLAN_CACHE_SIZE = 128
+
+
 class AllRange(object):
     """
     A range that contains everything. (object)
@@ -48,6 +56,15 @@ class OptionSet(object):
     """
     A set of options for a particular game. (object)
 
+    Games are often created over and over with the same option settings, as in
+    tournaments and benchmarks. So the work of parsing and validating a settings
+    text is stored as a plan, shared by all games of the same class that define
+    the same options. Plans are only steps referring to the definitions, so the
+    actions are still taken on each game's own definitions and targets.
+
+    Class Attributes:
+    schemas: The compiled option data for each game class. (dict of type: dict)
+
     Attributes:
     aliases: The aliases for the options. (list of str)
     default_bots: The default bot players. (list of player.Bot)
@@ -63,13 +80,17 @@ class OptionSet(object):
     add_option: Add a new option definition. (None)
     apply_defaults: Apply the default settings. (None)
     apply_definitions: Apply the option definitions to the text settings. (None)
+    apply_plan: Take the actions from an option plan. (None)
+    apply_settings: Apply a settings text, using a stored plan if possible. (None)
     ask_bool: Ask a boolean question. (list)
     ask_bot_count: Ask a bot question, with count. (list)
     ask_bot_param: Ask a bot question, with parameters. (list)
     ask_parameter: Ask for an option parameter. (list)
     ask_settings: Get the setttings by asking the user. (None)
+    compile_schema: Get the compiled option data for the game's class. (dict)
     handle_settings: Handle text representing some option settings. (None)
     parse_settings: Parse the text settings. (dict of str: str)
+    plan_definitions: Plan applying the option definitions to text settings. (list of tuple)
     take_action: Take the final action to apply the option setting. (None)
 
     Overridden Methods:
@@ -77,6 +98,8 @@ class OptionSet(object):
     __repr__
     """
 
+    schemas = {}
+
     def __init__(self, game):
         """
         Set up an empty option set. (None)
@@ -184,33 +207,49 @@ class OptionSet(object):
         Parameters:
         prelim_settings: Unconverted option settings. (dict of str: str)
         """
-        for definition in self.definitions:
-            new_settings = {}
-            # If the option was not specified, use the default (if any).
-            if not prelim_settings[definition['name']]:
-                if definition['default'] is None:
-                    continue
-                else:
-                    self.take_action(definition, definition['default'])
+        self.apply_plan(self.plan_definitions(prelim_settings))
+
+    def apply_plan(self, plan):
+        """
+        Take the actions from an option plan. (None)
+
+        Settings from the plan are copied, so that a game changing its settings
+        does not change the plan for later games.
+
+        Parameters:
+        plan: The steps from plan_definitions. (list of tuple)
+        """
+        for index, source, setting in plan:
+            definition = self.definitions[index]
+            if source == 'setting':
+                self.take_action(definition, copy.deepcopy(setting))
             else:
-                # Loop through the settings for the option.
-                error = 'Invalid {} parameter: {!r}.'
-                valid = definition['valid']
-                check = definition['check']
-                for setting in prelim_settings[definition['name']]:
-                    # Add the value for simple options.
-                    if setting is None:
-                        self.take_action(definition, definition['value'])
-                    else:
-                        validated = self.validate_setting(definition, setting)
-                        if validated is None:
-                            self.errors.append(error.format(definition['name'], setting))
-                        else:
-                            self.take_action(definition, validated)
-                    # Apply default on error
-                    if self.errors and self.errors[-1][8:].startswith(definition['name']):
-                        if definition['default'] is not None:
-                            self.take_action(definition, definition['default'])
+                self.take_action(definition, definition[source])
+
+    def apply_settings(self, settings_text):
+        """
+        Apply a settings text, using a stored plan if possible. (None)
+
+        Parameters:
+        settings_text: The stripped settings text from the user. (str)
+        """
+        # Look for a stored plan.
+        settings_text = ' '.join(settings_text.split())
+        schema = self.compile_schema()
+        stored = schema['plans'].get(settings_text) if schema else None
+        if stored is None:
+            # Make a new plan.
+            error_count = len(self.errors)
+            prelim_settings = self.parse_settings(settings_text)
+            plan = self.plan_definitions(prelim_settings)
+            stored = (self.settings_text, plan, self.errors[error_count:])
+            if schema and len(schema['plans']) < PLAN_CACHE_SIZE:
+                schema['plans'][settings_text] = stored
+        else:
+            # Use the stored plan.
+            self.settings_text = stored[0]
+            self.errors.extend(stored[2])
+        self.apply_plan(stored[1])
 
     def ask_bool(self, definition):
         """
@@ -339,6 +378,24 @@ class OptionSet(object):
             # Apply defaults if no options changed.
             self.apply_defaults()
 
+    def compile_schema(self):
+        """
+        Get the compiled option data for the game's class. (dict)
+
+        The compiled data is shared by all games of the same class. If this game
+        defines different options than the compiled data, None is returned, and
+        the game's options are handled without any stored plans.
+        """
+        schema = self.schemas.get(self.game.__class__)
+        names = [definition['name'] for definition in self.definitions]
+        if schema is None:
+            schema = {'aliases': self.aliases.copy(), 'groups': self.groups.copy(), 'names': names,
+                'plans': {}}
+            self.schemas[self.game.__class__] = schema
+        elif schema['names'] != names or schema['aliases'] != self.aliases or schema['groups'] != self.groups:
+            return None
+        return schema
+
     def handle_settings(self, raw_settings):
         """
         Handle text representing option settings. (None)
@@ -353,8 +410,7 @@ class OptionSet(object):
             self.apply_defaults()
         elif settings_text:
             self.game.flags |= 1
-            prelim_settings = self.parse_settings(settings_text)
-            self.apply_definitions(prelim_settings)
+            self.apply_settings(settings_text)
         else:
             self.ask_settings()
         # Check for unspecified bots.
@@ -428,6 +484,42 @@ class OptionSet(object):
             prelim_settings[option].append(setting)
         return prelim_settings
 
+    def plan_definitions(self, prelim_settings):
+        """
+        Plan applying the option definitions to text settings. (list of tuple)
+
+        Each step of the plan is the index of a definition, the source of the
+        setting ('default', 'value', or 'setting'), and the validated setting.
+        Invalid settings are added to the errors as they are found.
+
+        Parameters:
+        prelim_settings: Unconverted option settings. (dict of str: str)
+        """
+        plan = []
+        for index, definition in enumerate(self.definitions):
+            # If the option was not specified, use the default (if any).
+            if not prelim_settings[definition['name']]:
+                if definition['default'] is not None:
+                    plan.append((index, 'default', None))
+            else:
+                # Loop through the settings for the option.
+                error = 'Invalid {} parameter: {!r}.'
+                for setting in prelim_settings[definition['name']]:
+                    # Add the value for simple options.
+                    if setting is None:
+                        plan.append((index, 'value', None))
+                    else:
+                        validated = self.validate_setting(definition, setting)
+                        if validated is None:
+                            self.errors.append(error.format(definition['name'], setting))
+                        else:
+                            plan.append((index, 'setting', validated))
+                    # Apply default on error
+                    if self.errors and self.errors[-1][8:].startswith(definition['name']):
+                        if definition['default'] is not None:
+                            plan.append((index, 'default', None))
+        return plan
+
     def take_action(self, definition, setting):
         """
         Take the final action to apply the option setting. (None)
@@ -348,10 +348,12 @@ class Slider(game.Game):
         for mix in range(self.shuffles):
             while len(blanks) < len(shuffle_cells):
                 offset = random.choice(((-1, 0), (0, -1), (0, 1), (1, 0)))
-                target = self.blank_cell.location + offset
-                if target in shuffle_cells:
-                    target_cell = self.board.cells[target]
-                    self.board.move(target, self.blank_cell.location, target_cell.contents)
+                try:
+                    target_cell = self.board.offset(self.blank_cell.location, offset)
+                except KeyError:
+                    continue
+                if target_cell.location in shuffle_cells:
+                    self.board.move(target_cell.location, self.blank_cell.location, target_cell.contents)
                     self.blank_cell = target_cell
                     blanks.add(target_cell)
             blanks = set()
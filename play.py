@@ -81,8 +81,8 @@ class Play(object):
         self.human.held_inputs = held_inputs
         self.menu.menu()
         # Handle the results
-        results = self.human.results[self.human.session_index:]
-        self.human.session_index = len(self.human.results)
+        results = self.human.store.select(start = self.human.session_index)
+        self.human.session_index += len(results)
         return results
 
     def reset(self):
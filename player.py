@@ -8,15 +8,20 @@ See the top level __init__.py file for details on the t_games license.
 
 Constants:
 BOT_NAMES: Names for computer opponents. (dict of str: str)
+EXACT: A transposition table value that is exact. (int)
+LOWER: A transposition table value that is a lower bound. (int)
 NO: Recognized responses equivalent to 'no'. (set of str)
+UPPER: A transposition table value that is an upper bound. (int)
 YES: Recognized responses equivalent to 'yes'. (set of str)
 
 Classes:
 BotError: An invalid play by a bot. (ValueError)
+SearchTimeout: A bot's search ran out of time. (Exception)
 Player: The base player class. (object)
 Humanoid: A player that communicates using input and print. (Player)
 Human: A human being, with stored data. (Humanoid)
 Tester: A preset test account. (Human)
+Headless: A player that ignores all output, for bot only games. (Player)
 Nameless: A player with a random name. (Player)
 Bot: A full computer player. (Nameless)
 AlphaBetaBot: A robot player using alpha-beta pruning. (Bot)
@@ -30,9 +35,11 @@ import os
 import random
 import re
 import string
+import time
 
 from . import utility
 from . import cards
+from . import storage
 
 
 # Convert 2.7 input to raw_input
@@ -75,16 +82,26 @@ NO.update(['nyet', 'wu', 'nahin', 'na', 'nao', 'bango', 'nahim', 'nahi', 'la', "
 YES = set(['yes', 'y', '1', 'yup', 'sure', 'affirmative', 'yeah', 'indubitably', 'yep', 'aye', 'ok', 'nem'])
 YES.update(['okay', 'eh', 'roger', 'da', 'si', 'shi', 'haan', 'hyam', 'sim', 'hai', 'ham', 'hoya'])
 
+EXACT, LOWER, UPPER = range(3)
+
 
 class BotError(ValueError):
     """An invalid play by a bot. (ValueError)"""
     pass
 
 
+class SearchTimeout(Exception):
+    """A bot's search ran out of time. (Exception)"""
+    pass
+
+
 class Player(object):
     """
     The base player class. (object)
 
+    Class Attributes:
+    headless: A flag for a player that never sees any output. (bool)
+
     Attributes:
     game: The game the player is playing. (game.Game)
     held_inputs: Inputs awaiting a question. (list of str)
@@ -114,6 +131,8 @@ class Player(object):
     __str__
     """
 
+    headless = False
+
     def __init__(self, name):
         """
         Save the player's name. (None)
@@ -570,13 +589,21 @@ class Human(Humanoid):
     """
     A human being, with stored data. (Player)
 
+    The player's results are only read from the results store when they are first
+    needed.
+
+    Class Attributes:
+    store_type: The type of results store used. (str)
+
     Attributes:
     color: The player's favorite color. (str)
     folder_name: The local file with the player's data. (str)
     fire_index: An indicator of the last time the player played Fireball. (int)
+    loaded_results: The results read from the store so far. (list of list)
     quest: The player's quest. (str)
     results: The results of games played. (list of list)
     session_index: The number of games played before this session. (int)
+    store: The storage for the player's results. (storage.ResultsStore)
 
     Methods:
     load_results: Load the player's history of play. (None)
@@ -588,6 +615,8 @@ class Human(Humanoid):
     __init__
     """
 
+    store_type = storage.DEFAULT_STORE
+
     def __init__(self):
         """Get a login from a human. (None)"""
         while True:
@@ -607,8 +636,6 @@ class Human(Humanoid):
                 new_player = input('I have not heard of you. Are you a new player? ')
                 if new_player.lower() in utility.YES:
                     os.mkdir(self.folder_name)
-                    with open(os.path.join(self.folder_name, 'results.txt'), 'w') as player_data:
-                        player_data.write('')
                     with open(os.path.join(self.folder_name, 'shortcuts.txt'), 'w') as player_data:
                         player_data.write('')
                     break
@@ -621,14 +648,18 @@ class Human(Humanoid):
         # Set default attributes.
         self.held_inputs = []
 
+    @property
+    def results(self):
+        """The results of games played. (list of list)"""
+        if self.loaded_results is None:
+            self.loaded_results = self.store.load()
+        return self.loaded_results
+
     def load_results(self):
         """Load the player's history of play. (None)"""
-        self.results = []
-        with open(os.path.join(self.folder_name, 'results.txt')) as player_data:
-            for line in player_data:
-                results = line.strip().split(',', 7)
-                self.results.append(results[:1] + [int(x) for x in results[1:-1]] + results[-1:])
-        self.session_index = len(self.results)
+        self.store = storage.open_store(self.folder_name, self.store_type)
+        self.loaded_results = None
+        self.session_index = len(self.store)
         self.fire_index = self.session_index
 
     def load_shortcuts(self):
@@ -652,12 +683,11 @@ class Human(Humanoid):
         game_name: The name of the game the result is from. (str)
         results: The results of playing the game. (list of int)
         """
-        # Store locally.
-        self.results.append([game_name] + results)
-        # Store in the player's file.
-        results_text = ','.join([str(x) for x in results])
-        with open(os.path.join(self.folder_name, 'results.txt'), 'a') as player_data:
-            player_data.write('{},{}\n'.format(game_name, results_text))
+        # Store locally, if the results have been loaded.
+        if self.loaded_results is not None:
+            self.loaded_results.append([game_name] + results)
+        # Store in the player's results store.
+        self.store.append(game_name, results)
 
     def store_shortcut(self, shortcut, text):
         """
@@ -701,8 +731,6 @@ class Tester(Human):
         self.folder_name = os.path.join(utility.LOC, base_name)
         if not os.path.exists(self.folder_name):
             os.mkdir(self.folder_name)
-            with open(os.path.join(self.folder_name, 'results.txt'), 'w') as player_data:
-                player_data.write('')
             with open(os.path.join(self.folder_name, 'shortcuts.txt'), 'w') as player_data:
                 player_data.write('')
         # Load any previous testing data.
@@ -712,6 +740,50 @@ class Tester(Human):
         self.held_inputs = []
 
 
+class Headless(Player):
+    """
+    A player that ignores all output, for bot only games. (Player)
+
+    A Headless player is meant to be the human used to set up a game that will
+    only be played by bots, such as a tournament. A game set up with a Headless
+    human skips building any output text that it can.
+
+    Overridden Methods:
+    __init__
+    error
+    tell
+    """
+
+    headless = True
+
+    def __init__(self, name = 'Nobody'):
+        """
+        Save the player's name. (None)
+
+        Parameters:
+        name: The name of the player. (str)
+        """
+        super(Headless, self).__init__(name)
+
+    def error(self, *args, **kwargs):
+        """
+        Ignore a warning about an invalid play. (None)
+
+        Parameters:
+        The parameters are as the built-in print function.
+        """
+        pass
+
+    def tell(self, *args, **kwargs):
+        """
+        Ignore information given to the player. (None)
+
+        Parameters:
+        The parameters are as per the built-in print function.
+        """
+        pass
+
+
 class Nameless(Player):
     """
     A player with a random name. (Player)
@@ -739,6 +811,7 @@ class Nameless(Player):
             if self.name not in taken_names:
                 break
         # Set default attributes.
+        self.game = None
         self.held_inputs = []
         self.shortcuts = {}
 
@@ -747,11 +820,25 @@ class Bot(Nameless):
     """
     A full computer player. (Player)
 
+    Bots are often reused for many games in a row, so their state is split in
+    three. Settings that last for the bot's life are set in __init__, and state
+    for a single game is set in set_up. Data that is the same for every game,
+    like strategy tables, is built once per process with get_shared, and kept
+    in shared_data for every bot after that.
+
+    Class Attributes:
+    shared_data: Data shared by all bots in the process. (dict)
+
+    Methods:
+    get_shared: Get data shared by all bots, building it if needed. (object)
+
     Overridden Methods:
     error
     tell
     """
 
+    shared_data = {}
+
     def error(self, *args, **kwargs):
         """
         Stop play due to a bot malfunction. (None)
@@ -766,6 +853,21 @@ class Bot(Nameless):
         # Raise an error.
         raise BotError(text.strip())
 
+    def get_shared(self, key, build, *args):
+        """
+        Get data shared by all bots, building it if needed. (object)
+
+        The shared data must not be changed by the bots using it.
+
+        Parameters:
+        key: The key for the data in shared_data. (hashable)
+        build: A function that creates the data. (callable)
+        *args: The parameters to build the data with.
+        """
+        if key not in self.shared_data:
+            self.shared_data[key] = build(*args)
+        return self.shared_data[key]
+
     def tell(self, *args, **kwargs):
         """
         Give information to the player. (None)
@@ -773,6 +875,9 @@ class Bot(Nameless):
         Parameters:
         The parameters are as per the built-in print function.
         """
+        # Don't bother with the text if no one is going to see it.
+        if getattr(self.game, 'headless', False):
+            return
         # Get the base text.
         kwargs['sep'] = kwargs.get('sep', ' ')
         kwargs['end'] = kwargs.get('end', '\n')
@@ -792,39 +897,78 @@ class AlphaBetaBot(Bot):
     A robot player using alpha-beta pruning. (Bot)
 
     The AlphaBetaBot assumes you have a board game, and the board has a get_moves
-    method which returns all legal moves, a copy method which returns an
-    indepent copy of the board, and a check_win method that returns 'game on'
-    until the game is over.
+    method which returns all legal moves, a make_move method that makes one of
+    those moves, a copy method which returns an indepent copy of the board, and a
+    check_win method that returns 'game on' until the game is over. Moves must be
+    hashable. If the board also has an unmake_move method that takes back a move,
+    moves are made and taken back on the one board instead of on copies.
+
+    If the board has a zobrist attribute with a hash of the position (as
+    board.ArrayBoard does), searched positions are stored in a transposition
+    table, so that a position reached by different orders of moves is only
+    searched once. The table is a fixed number of slots indexed by the hash. An
+    entry replaces the one in its slot if it is for the same position, or if it
+    was searched at least as deep.
+
+    The search method uses iterative deepening: it searches one move deep, then
+    two, and so on up to the depth attribute, or until time_limit seconds have
+    passed. If time runs out the best move of the last complete search is used.
+    Each pass orders the moves using the results of the ones before it: first the
+    best move from the transposition table, then the killer moves (recent moves
+    that caused a cutoff at the same ply), then the rest by their history (how
+    often and how deep they have caused cutoffs).
+
+    Class Attributes:
+    table_size: The number of slots in the transposition table. (int)
 
     Attributes:
-    depth: The depth of the search. (int)
+    deadline: When the current search must stop, or None. (float)
+    depth: The maximum depth of the search. (int)
     fudge: A fudge factor to avoid early capitulation. (int or float)
+    history: The cutoff scores for moves. (dict)
+    killers: The recent cutoff moves by ply. (dict of int: list)
+    table: The transposition table. (list of tuple)
+    time_limit: The maximum seconds per search, or 0 for no limit. (float)
 
     Methods:
     alpha_beta: Tree search with alpha-beta pruning. (tuple)
     eval_board: Evaluate the board. (int)
+    order_moves: Order moves for searching. (list)
+    record_cutoff: Record a move that caused a cutoff. (None)
+    search: Find the best move from a position. (object)
+    search_move: Search the position after a move. (tuple)
+    store: Store a searched position in the transposition table. (None)
 
     Overridden Methods:
     __init__
     """
 
-    def __init__(self, depth, fudge, taken_names = [], initial = ''):
+    table_size = 2 ** 16
+
+    def __init__(self, depth, fudge, taken_names = [], initial = '', time_limit = 0):
         """
         Set up the bot. (None)
 
         Parameters:
-        depth: The depth of the search. (int)
+        depth: The maximum depth of the search. (int)
         fudge: A fudge factor to avoid early capitulation. (int or float)
         taken_names: Names already used by a player. (list of str)
         initial: The first letter of the bot's name. (str)
+        time_limit: The maximum seconds per search, or 0 for no limit. (float)
         """
         # Do the standard initialization.
         super(AlphaBetaBot, self).__init__(taken_names, initial)
         # Initialize the alpha-beta attributes.
         self.depth = depth
         self.fudge = fudge
-
-    def alpha_beta(self, board, depth, alpha, beta, max_player):
+        self.time_limit = time_limit
+        # Initialize the search memory.
+        self.deadline = None
+        self.history = {}
+        self.killers = {}
+        self.table = [None] * self.table_size
+
+    def alpha_beta(self, board, depth, alpha, beta, max_player, ply = 0):
         """
         Tree search with alpha-beta pruning. (tuple)
 
@@ -837,24 +981,48 @@ class AlphaBetaBot(Bot):
         alpha: The best score for the maximizing player. (int)
         beta: The best score for the minimizing player. (int)
         max_player: Flag for evaluating the maximizing player. (int)
+        ply: How many moves deep this position is in the search. (int)
         """
+        # Check the clock.
+        if self.deadline is not None and time.time() > self.deadline:
+            raise SearchTimeout()
+        # Check the transposition table.
+        zobrist = getattr(board, 'zobrist', None)
+        table_move = None
+        if zobrist is not None:
+            key = zobrist * 2 + max_player
+            entry = self.table[key % self.table_size]
+            if entry is not None and entry[0] == key:
+                table_move = entry[4]
+                if entry[1] >= depth:
+                    if entry[3] == EXACT:
+                        return table_move, entry[2]
+                    elif entry[3] == LOWER:
+                        alpha = max(alpha, entry[2])
+                    else:
+                        beta = min(beta, entry[2])
+                    if beta <= alpha:
+                        return table_move, entry[2]
+        start_alpha, start_beta = alpha, beta
         # Initialize loops
         best_move = None
         # check for terminal node
         if depth == 0 or board.check_win() != 'game on':
             value = self.eval_board(board)
-            fudge = self.fudge * (self.depth - depth)
+            fudge = self.fudge * ply
             # ?? this is meant to prevent giving up in a forced win situation. Not sure it works.
             value -= fudge
+            if zobrist is not None:
+                self.store(key, depth, value, EXACT, None)
             return None, value
-        elif max_player:
+        moves = self.order_moves(board.get_moves(), table_move, ply)
+        unmake = hasattr(board, 'unmake_move')
+        if max_player:
             # maximize loop
             board_value = -utility.MAX_INT
-            for move in board.get_moves():
+            for move in moves:
                 # evaluate the move
-                clone = board.copy()
-                clone.make_move(move)
-                sub_move, move_value = self.alpha_beta(clone, depth - 1, alpha, beta, False)
+                sub_move, move_value = self.search_move(board, move, unmake, depth, alpha, beta, False, ply)
                 # check for better move
                 if move_value > board_value:
                     board_value = move_value
@@ -862,15 +1030,14 @@ class AlphaBetaBot(Bot):
                 # adjust and check alpha
                 alpha = max(alpha, board_value)
                 if beta <= alpha:
+                    self.record_cutoff(move, depth, ply)
                     break
         else:
             # minimize loop
             board_value = utility.MAX_INT
-            for move in board.get_moves():
+            for move in moves:
                 # evaluate the move
-                clone = board.copy()
-                clone.make_move(move)
-                sub_move, move_value = self.alpha_beta(clone, depth - 1, alpha, beta, True)
+                sub_move, move_value = self.search_move(board, move, unmake, depth, alpha, beta, True, ply)
                 # check for worse move
                 if move_value < board_value:
                     board_value = move_value
@@ -878,7 +1045,17 @@ class AlphaBetaBot(Bot):
                 # adjust and check beta
                 beta = min(beta, board_value)
                 if beta <= alpha:
+                    self.record_cutoff(move, depth, ply)
                     break
+        # Store the value, and whether it is a bound or exact.
+        if zobrist is not None:
+            if board_value <= start_alpha:
+                bound = UPPER
+            elif board_value >= start_beta:
+                bound = LOWER
+            else:
+                bound = EXACT
+            self.store(key, depth, board_value, bound, best_move)
         # return best move found with board value
         return best_move, board_value
 
@@ -891,6 +1068,114 @@ class AlphaBetaBot(Bot):
         """
         return NotImplemented
 
+    def order_moves(self, moves, table_move, ply):
+        """
+        Order moves for searching. (list)
+
+        Parameters:
+        moves: The legal moves. (list)
+        table_move: The best move from the transposition table. (object)
+        ply: How many moves deep the position is in the search. (int)
+        """
+        # Put the table move and the killer moves first.
+        first = []
+        for move in [table_move] + self.killers.get(ply, []):
+            if move in moves and move not in first:
+                first.append(move)
+        # Sort the rest by history.
+        rest = [move for move in moves if move not in first]
+        rest.sort(key = lambda move: -self.history.get(move, 0))
+        return first + rest
+
+    def record_cutoff(self, move, depth, ply):
+        """
+        Record a move that caused a cutoff. (None)
+
+        Parameters:
+        move: The move that caused the cutoff. (object)
+        depth: How many more iterations of the search there were. (int)
+        ply: How many moves deep the position is in the search. (int)
+        """
+        # Keep the last two killer moves.
+        killers = self.killers.setdefault(ply, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+        # Deeper cutoffs count for more.
+        self.history[move] = self.history.get(move, 0) + depth * depth
+
+    def search(self, board):
+        """
+        Find the best move from a position. (object)
+
+        Parameters:
+        board: The board position to move from. (board.Board)
+        """
+        # Clear the search memory.
+        self.table = [None] * self.table_size
+        self.history = {}
+        self.killers = {}
+        # Search deeper and deeper until out of depth or out of time.
+        start = time.time()
+        self.deadline = None
+        best_move = None
+        for depth in range(1, self.depth + 1):
+            try:
+                move, value = self.alpha_beta(board, depth, -utility.MAX_INT, utility.MAX_INT, True)
+            except SearchTimeout:
+                break
+            best_move = move
+            # Always finish the first pass, so there is a move.
+            if self.time_limit and self.deadline is None:
+                self.deadline = start + self.time_limit
+        self.deadline = None
+        return best_move
+
+    def search_move(self, board, move, unmake, depth, alpha, beta, max_player, ply):
+        """
+        Search the position after a move. (tuple)
+
+        The parameters other than move and unmake are for the position before the
+        move, except that max_player is for the position after the move.
+
+        Parameters:
+        board: The board position before the move. (board.Board)
+        move: The move to search. (object)
+        unmake: A flag for taking back the move rather than copying. (bool)
+        depth: How many more iterations of the search there should be. (int)
+        alpha: The best score for the maximizing player. (int)
+        beta: The best score for the minimizing player. (int)
+        max_player: Flag for evaluating the maximizing player. (int)
+        ply: How many moves deep the position is in the search. (int)
+        """
+        if unmake:
+            # Make the move, search, and take the move back, even if out of time.
+            board.make_move(move)
+            try:
+                return self.alpha_beta(board, depth - 1, alpha, beta, max_player, ply + 1)
+            finally:
+                board.unmake_move(move)
+        else:
+            clone = board.copy()
+            clone.make_move(move)
+            return self.alpha_beta(clone, depth - 1, alpha, beta, max_player, ply + 1)
+
+    def store(self, key, depth, value, bound, move):
+        """
+        Store a searched position in the transposition table. (None)
+
+        Parameters:
+        key: The hash of the position and the player to move. (int)
+        depth: How deep the position was searched. (int)
+        value: The value found for the position. (int)
+        bound: Whether the value is EXACT, a LOWER bound, or an UPPER bound. (int)
+        move: The best move found from the position. (object)
+        """
+        slot = key % self.table_size
+        entry = self.table[slot]
+        if entry is None or entry[0] == key or depth >= entry[1]:
+            self.table[slot] = (key, depth, value, bound, move)
+
 
 class Cyborg(Nameless, Humanoid):
     """A computer player that is run by a person. (Nameless, Humanoid)"""
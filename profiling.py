@@ -0,0 +1,160 @@
+"""
+profiling.py
+
+Timing of the parts of playing a game.
+
+Profiling is turned on by setting the profiling attribute of a game to True.
+After each game is played, the game's profile attribute holds the timings for
+that game. Tournaments add up the profiles of all of their games.
+
+Copyright (C) 2018-2020 by Craig O'Brien and the t_games contributors.
+See the top level __init__.py file for details on the t_games license.
+
+Constants:
+ASK_METHODS: The player methods timed by a profile. (tuple of str)
+
+Classes:
+Profile: Timings for the parts of playing a game. (object)
+"""
+
+
+import functools
+from timeit import default_timer
+
+
+# The player methods timed by a profile.
+ASK_METHODS = ('ask', 'ask_card', 'ask_card_list', 'ask_int', 'ask_int_list', 'ask_valid', 'ask_yes_no')
+
+
+class Profile(object):
+    """
+    Timings for the parts of playing a game. (object)
+
+    Timings are stored by the kind of thing timed and the name of the thing timed,
+    such as ('ask', 'Bob') or ('command', 'do_roll'). Each timing is a list of the
+    number of calls, the total time, and the longest time.
+
+    Attributes:
+    games: The number of games profiled. (int)
+    timings: The timings for each thing timed. (dict of tuple: list)
+
+    Methods:
+    data: Get the profile as plain Python data. (list of dict)
+    merge: Add another profile's timings to this one. (None)
+    record: Record the time for one call. (None)
+    time: Call a function and record how long it took. (object)
+    unwatch: Stop timing a player's questions. (None)
+    watch: Time a player's questions. (None)
+
+    Overridden Methods:
+    __init__
+    __repr__
+    __str__
+    """
+
+    def __init__(self):
+        """Set up the timing storage. (None)"""
+        self.games = 0
+        self.timings = {}
+
+    def __repr__(self):
+        """Generate a debugging text representation. (str)"""
+        return '<Profile of {} games with {} timings>'.format(self.games, len(self.timings))
+
+    def __str__(self):
+        """Human readable text representation. (str)"""
+        lines = ['Kind/Name                         Calls   Total (s)   Mean (ms)    Max (ms)']
+        for row in self.data():
+            label = '{}/{}'.format(row['kind'], row['name'])[:30]
+            line_data = (label, row['calls'], row['total'], row['mean'] * 1000, row['max'] * 1000)
+            lines.append('{:<30} {:>8} {:>11.4f} {:>11.4f} {:>11.4f}'.format(*line_data))
+        return '\n'.join(lines)
+
+    def data(self):
+        """
+        Get the profile as plain Python data. (list of dict)
+
+        The timings are sorted by total time, longest first.
+        """
+        rows = []
+        for (kind, name), (calls, total, longest) in self.timings.items():
+            rows.append({'kind': kind, 'name': name, 'calls': calls, 'total': total,
+                'mean': total / calls, 'max': longest})
+        rows.sort(key = lambda row: (-row['total'], row['kind'], row['name']))
+        return rows
+
+    def merge(self, other):
+        """
+        Add another profile's timings to this one. (None)
+
+        Parameters:
+        other: The profile to add. (Profile)
+        """
+        self.games += other.games
+        for key, (calls, total, longest) in other.timings.items():
+            timing = self.timings.setdefault(key, [0, 0.0, 0.0])
+            timing[0] += calls
+            timing[1] += total
+            timing[2] = max(timing[2], longest)
+
+    def record(self, kind, name, seconds):
+        """
+        Record the time for one call. (None)
+
+        Parameters:
+        kind: The kind of thing timed. (str)
+        name: The name of the thing timed. (str)
+        seconds: How long the call took. (float)
+        """
+        timing = self.timings.setdefault((kind, name), [0, 0.0, 0.0])
+        timing[0] += 1
+        timing[1] += seconds
+        timing[2] = max(timing[2], seconds)
+
+    def time(self, kind, name, function, *args, **kwargs):
+        """
+        Call a function and record how long it took. (object)
+
+        The return value is the return value of the function.
+
+        Parameters:
+        kind: The kind of thing timed. (str)
+        name: The name of the thing timed. (str)
+        function: The function to call. (callable)
+
+        Other parameters are passed on to the function.
+        """
+        start = default_timer()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.record(kind, name, default_timer() - start)
+
+    def unwatch(self, player):
+        """
+        Stop timing a player's questions. (None)
+
+        Parameters:
+        player: The player to stop timing. (player.Player)
+        """
+        for method_name in ASK_METHODS:
+            if getattr(player.__dict__.get(method_name), 'profile', None) is self:
+                del player.__dict__[method_name]
+
+    def watch(self, player):
+        """
+        Time a player's questions. (None)
+
+        The player's ask methods are replaced with timed versions on the player
+        object itself, which are removed by unwatch.
+
+        Parameters:
+        player: The player to time. (player.Player)
+        """
+        for method_name in ASK_METHODS:
+            method = getattr(player, method_name, None)
+            if method is None or method_name in player.__dict__:
+                continue
+            timed = functools.partial(self.time, method_name, player.name, method)
+            timed.profile = self
+            setattr(player, method_name, timed)
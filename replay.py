@@ -0,0 +1,303 @@
+"""
+replay.py
+
+Recording and replaying games for t_games.
+
+A game records the human's inputs when its recording attribute is True. The log
+of the inputs, along with the seeds for the game's random number generators, is
+enough to play the game again as it was played, starting from a freshly set up
+game. Replays are played headless with the output thrown away, so they run as
+fast as the game can go.
+
+Input logs are saved in a compact binary format: a four byte marker, a version
+byte, and then the zlib compressed seeds, results, game information, and inputs.
+
+Copyright (C) 2018-2020 by Craig O'Brien and the t_games contributors.
+See the top level __init__.py file for details on the t_games license.
+
+Constants:
+MARKER: The bytes at the start of every input log file. (bytes)
+VERSION: The version of the input log format. (int)
+
+Classes:
+ReplayError: A replay that does not match the recorded game. (ValueError)
+InputLog: A record of the inputs to a game. (object)
+Replayer: A player that repeats the inputs from an input log. (Humanoid)
+
+Functions:
+parse_log: Convert bytes into an input log. (InputLog)
+read_log: Read an input log from a file. (InputLog)
+replay: Play a recorded game again. (list)
+"""
+
+
+import functools
+import os
+import struct
+import sys
+import zlib
+
+from . import player
+
+
+# The bytes at the start of every input log file.
+MARKER = b'TGIL'
+
+# The version of the input log format.
+VERSION = 1
+
+
+class ReplayError(ValueError):
+    """A replay that does not match the recorded game. (ValueError)"""
+    pass
+
+
+class InputLog(object):
+    """
+    A record of the inputs to a game. (object)
+
+    Attributes:
+    game_name: The name of the game played. (str)
+    inputs: The answers the human gave, in order. (list of str)
+    options: The option settings the game was played with. (str)
+    player_name: The name of the human who played the game. (str)
+    results: The first six results of the game, if finished. (list of int)
+    seed: The seed for the random number generators during play. (int)
+    set_up_seed: The seed for the random number generators during set up. (int)
+
+    Methods:
+    record: Get an answer from a player, and log it. (str)
+    save: Write the input log to a file. (None)
+    to_bytes: Convert the input log to the binary format. (bytes)
+    unwatch: Stop logging a player's answers. (None)
+    watch: Log a player's answers. (None)
+
+    Overridden Methods:
+    __init__
+    __len__
+    __repr__
+    """
+
+    def __init__(self, game_name, options, set_up_seed, seed, player_name, inputs = None):
+        """
+        Set up the log. (None)
+
+        Parameters:
+        game_name: The name of the game played. (str)
+        options: The option settings the game was played with. (str)
+        set_up_seed: The seed for the random number generators during set up. (int)
+        seed: The seed for the random number generators during play. (int)
+        player_name: The name of the human who played the game. (str)
+        inputs: The answers the human gave, in order. (list of str)
+        """
+        # Set the specified attributes.
+        self.game_name = game_name
+        self.options = options
+        self.set_up_seed = set_up_seed
+        self.seed = seed
+        self.player_name = player_name
+        self.inputs = [] if inputs is None else inputs
+        # Set the default attributes.
+        self.results = []
+
+    def __len__(self):
+        """Count the inputs in the log. (int)"""
+        return len(self.inputs)
+
+    def __repr__(self):
+        """Generate a debugging text representation. (str)"""
+        text = '<InputLog of {} with {} inputs, seed {}>'
+        return text.format(self.game_name, len(self.inputs), self.seed)
+
+    def record(self, ask, prompt):
+        """
+        Get an answer from a player, and log it. (str)
+
+        Parameters:
+        ask: The player's original ask method. (callable)
+        prompt: The question being asked of the player. (str)
+        """
+        answer = ask(prompt)
+        self.inputs.append(answer)
+        return answer
+
+    def save(self, file_name):
+        """
+        Write the input log to a file. (None)
+
+        Parameters:
+        file_name: The path to the file to write. (str)
+        """
+        with open(file_name, 'wb') as log_file:
+            log_file.write(self.to_bytes())
+
+    def to_bytes(self):
+        """Convert the input log to the binary format. (bytes)"""
+        results = (list(self.results) + [0] * 6)[:6]
+        parts = [struct.pack('>QQ6q?', self.set_up_seed, self.seed, *(results + [bool(self.results)]))]
+        for text in [self.game_name, self.options, self.player_name] + self.inputs:
+            data = text.encode('utf-8')
+            parts.append(struct.pack('>I', len(data)))
+            parts.append(data)
+        return MARKER + struct.pack('>B', VERSION) + zlib.compress(b''.join(parts), 9)
+
+    def unwatch(self, player):
+        """
+        Stop logging a player's answers. (None)
+
+        Parameters:
+        player: The player to stop logging. (player.Player)
+        """
+        if getattr(player.__dict__.get('ask'), 'input_log', None) is self:
+            del player.__dict__['ask']
+
+    def watch(self, player):
+        """
+        Log a player's answers. (None)
+
+        The player's ask method is replaced with a logged version on the player
+        object itself, which is removed by unwatch. The other ask methods of a
+        Humanoid all go through the ask method, so they are logged as well.
+
+        Parameters:
+        player: The player to log. (player.Player)
+        """
+        if 'ask' not in player.__dict__:
+            logged = functools.partial(self.record, player.ask)
+            logged.input_log = self
+            player.ask = logged
+
+
+class Replayer(player.Humanoid):
+    """
+    A player that repeats the inputs from an input log. (Humanoid)
+
+    Replayers are headless, so the games they play skip output that no one will
+    see. If the game asks for more inputs than were logged, the replay has gone
+    wrong and a ReplayError is raised.
+
+    Class Attributes:
+    headless: A flag for a player that never sees any output. (bool)
+
+    Attributes:
+    input_index: The index of the next input to give. (int)
+    log: The input log being replayed. (InputLog)
+
+    Overridden Methods:
+    __init__
+    ask
+    error
+    tell
+    """
+
+    headless = True
+
+    def __init__(self, log):
+        """
+        Set up the inputs to repeat. (None)
+
+        Parameters:
+        log: The input log to replay. (InputLog)
+        """
+        super(Replayer, self).__init__(log.player_name)
+        self.log = log
+        self.input_index = 0
+
+    def ask(self, prompt):
+        """
+        Get information from the player. (str)
+
+        Parameters:
+        prompt: The question being asked of the player. (str)
+        """
+        if self.input_index >= len(self.log.inputs):
+            raise ReplayError('The replay of {} ran out of inputs.'.format(self.log.game_name))
+        self.input_index += 1
+        return self.log.inputs[self.input_index - 1]
+
+    def error(self, *args, **kwargs):
+        """
+        Warn the player about an invalid play. (None)
+
+        Parameters:
+        The parameters are as per the built-in print function.
+        """
+        pass
+
+    def tell(self, *args, **kwargs):
+        """
+        Give information to the player. (None)
+
+        Parameters:
+        The parameters are as per the built-in print function.
+        """
+        pass
+
+
+def parse_log(data):
+    """
+    Convert bytes into an input log. (InputLog)
+
+    Parameters:
+    data: An input log in the binary format. (bytes)
+    """
+    # Check the header.
+    if data[:4] != MARKER:
+        raise ValueError('The data is not an input log.')
+    version = struct.unpack('>B', data[4:5])[0]
+    if version != VERSION:
+        raise ValueError('Unknown input log version: {}.'.format(version))
+    # Get the numbers.
+    body = zlib.decompress(data[5:])
+    values = struct.unpack('>QQ6q?', body[:65])
+    # Get the text.
+    texts = []
+    position = 65
+    while position < len(body):
+        length = struct.unpack('>I', body[position:position + 4])[0]
+        position += 4
+        texts.append(body[position:position + length].decode('utf-8'))
+        position += length
+    # Build the log.
+    log = InputLog(texts[0], texts[1], values[0], values[1], texts[2], texts[3:])
+    if values[8]:
+        log.results = list(values[2:8])
+    return log
+
+
+def read_log(file_name):
+    """
+    Read an input log from a file. (InputLog)
+
+    Parameters:
+    file_name: The path to the input log file. (str)
+    """
+    with open(file_name, 'rb') as log_file:
+        return parse_log(log_file.read())
+
+
+def replay(game_class, log):
+    """
+    Play a recorded game again. (list)
+
+    The return value is the results of the game, as returned by Game.play. Any
+    output that still gets printed is thrown away.
+
+    Parameters:
+    game_class: The game that was recorded. (type)
+    log: The record of the game. (InputLog)
+    """
+    # Mute the output.
+    save_stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        # Set up the game.
+        replay_game = game_class(Replayer(log), log.options or 'none', silent = True,
+            seed = log.set_up_seed)
+        replay_game.seed = log.seed
+        # Play the game.
+        return replay_game.play()
+    finally:
+        # Clean up.
+        sys.stdout.close()
+        sys.stdout = save_stdout
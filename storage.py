@@ -0,0 +1,339 @@
+"""
+storage.py
+
+Storage of player results for t_games.
+
+A player's game results are stored as rows of [game name, win, loss, draw,
+score, turns, flags, options]. The results stores all handle the same rows, so
+they can be swapped out for each other.
+
+Copyright (C) 2018-2020 by Craig O'Brien and the t_games contributors.
+See the top level __init__.py file for details on the t_games license.
+
+Constants:
+DEFAULT_STORE: The type of results store to use by default. (str)
+STORES: The available results stores. (dict of str: ResultsStore)
+
+Classes:
+ResultsStore: A place to keep a player's game results. (object)
+SQLiteStore: Game results stored in an indexed SQLite database. (ResultsStore)
+TextStore: Game results stored in a comma separated text file. (ResultsStore)
+
+Functions:
+open_store: Open the results store for a player's folder. (ResultsStore)
+"""
+
+
+import os
+
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
+
+class ResultsStore(object):
+    """
+    A place to keep a player's game results. (object)
+
+    Subclasses must override extend and load, the other methods are built on
+    those two.
+
+    Attributes:
+    folder_name: The local folder with the player's data. (str)
+
+    Methods:
+    append: Add a game result to the store. (None)
+    close: Release any resources held by the store. (None)
+    extend: Add several game results to the store. (None)
+    game_names: Get the names of the games with results. (list of str)
+    load: Get all of the game results. (list of list)
+    select: Get the game results matching some criteria. (list of list)
+
+    Overridden Methods:
+    __init__
+    __len__
+    __repr__
+    """
+
+    def __init__(self, folder_name):
+        """
+        Set up the store. (None)
+
+        Parameters:
+        folder_name: The local folder with the player's data. (str)
+        """
+        self.folder_name = folder_name
+
+    def __len__(self):
+        """Count the game results in the store. (int)"""
+        return len(self.load())
+
+    def __repr__(self):
+        """Generate a debugging text representation. (str)"""
+        return '<{} for {!r}>'.format(self.__class__.__name__, self.folder_name)
+
+    def append(self, game_name, results):
+        """
+        Add a game result to the store. (None)
+
+        Parameters:
+        game_name: The name of the game the result is from. (str)
+        results: The results of playing the game. (list)
+        """
+        self.extend([[game_name] + results])
+
+    def close(self):
+        """Release any resources held by the store. (None)"""
+        pass
+
+    def extend(self, rows):
+        """
+        Add several game results to the store. (None)
+
+        Parameters:
+        rows: The game names and results to add. (list of list)
+        """
+        raise NotImplementedError('The store {!r} cannot add results.'.format(self))
+
+    def game_names(self):
+        """Get the names of the games with results. (list of str)"""
+        return sorted(set(row[0] for row in self.load()))
+
+    def load(self):
+        """Get all of the game results. (list of list)"""
+        raise NotImplementedError('The store {!r} cannot load results.'.format(self))
+
+    def select(self, game_names = None, flags = 0, options = None, start = 0):
+        """
+        Get the game results matching some criteria. (list of list)
+
+        Parameters:
+        game_names: The games to get results for, defaults to all. (list of str)
+        flags: Only get results with one of these flags set. (int)
+        options: Only get results with these exact options. (str)
+        start: The number of results to skip over. (int)
+        """
+        rows = self.load()[start:]
+        if game_names is not None:
+            rows = [row for row in rows if row[0] in game_names]
+        if flags:
+            rows = [row for row in rows if row[6] & flags]
+        if options is not None:
+            rows = [row for row in rows if row[7] == options]
+        return rows
+
+
+class SQLiteStore(ResultsStore):
+    """
+    Game results stored in an indexed SQLite database. (ResultsStore)
+
+    When the database is first created, any results from the player's text file
+    are copied into it. The text file is left as it was, but is no longer
+    updated. The database is set up in one transaction, and the database's
+    user_version is set once the copy is done, so an interrupted copy is redone
+    the next time the store is opened.
+
+    Attributes:
+    connection: The connection to the database. (sqlite3.Connection)
+    file_name: The location of the database. (str)
+
+    Methods:
+    insert: Add several game results without committing them. (None)
+    migrate: Copy the results from another store. (None)
+
+    Overridden Methods:
+    __init__
+    __len__
+    close
+    extend
+    game_names
+    load
+    select
+    """
+
+    def __init__(self, folder_name):
+        """
+        Set up the store. (None)
+
+        Parameters:
+        folder_name: The local folder with the player's data. (str)
+        """
+        super(SQLiteStore, self).__init__(folder_name)
+        self.file_name = os.path.join(folder_name, 'results.db')
+        # Connect to the database.
+        self.connection = sqlite3.connect(self.file_name)
+        self.connection.text_factory = str
+        # Set up the database in one explicit transaction.
+        self.connection.isolation_level = None
+        self.connection.execute('BEGIN')
+        try:
+            # Set up the table and indexes.
+            self.connection.execute('CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY, ' +
+                'game TEXT, win INTEGER, loss INTEGER, draw INTEGER, score INTEGER, turns INTEGER, ' +
+                'flags INTEGER, options TEXT)')
+            for column in ('game', 'flags', 'options'):
+                sql = 'CREATE INDEX IF NOT EXISTS results_{0} ON results ({0})'
+                self.connection.execute(sql.format(column))
+            # Bring in any old results, unless that has been done.
+            if not self.connection.execute('PRAGMA user_version').fetchone()[0]:
+                self.migrate(TextStore(folder_name, create = False))
+                self.connection.execute('PRAGMA user_version = 1')
+        except Exception:
+            self.connection.execute('ROLLBACK')
+            self.connection.close()
+            raise
+        self.connection.execute('COMMIT')
+        self.connection.isolation_level = ''
+
+    def __len__(self):
+        """Count the game results in the store. (int)"""
+        return self.connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def close(self):
+        """Release any resources held by the store. (None)"""
+        self.connection.close()
+
+    def extend(self, rows):
+        """
+        Add several game results to the store. (None)
+
+        Parameters:
+        rows: The game names and results to add. (list of list)
+        """
+        with self.connection:
+            self.insert(rows)
+
+    def game_names(self):
+        """Get the names of the games with results. (list of str)"""
+        cursor = self.connection.execute('SELECT DISTINCT game FROM results ORDER BY game')
+        return [row[0] for row in cursor]
+
+    def insert(self, rows):
+        """
+        Add several game results without committing them. (None)
+
+        Parameters:
+        rows: The game names and results to add. (list of list)
+        """
+        sql = 'INSERT INTO results (game, win, loss, draw, score, turns, flags, options) '
+        sql += 'VALUES (?, ?, ?, ?, ?, ?, ?, ?)'
+        self.connection.executemany(sql, [tuple(row) for row in rows])
+
+    def load(self):
+        """Get all of the game results. (list of list)"""
+        return self.select()
+
+    def migrate(self, store):
+        """
+        Copy the results from another store. (None)
+
+        The results are not committed, so they can be part of a larger transaction.
+
+        Parameters:
+        store: The store to copy results from. (ResultsStore)
+        """
+        self.insert(store.load())
+
+    def select(self, game_names = None, flags = 0, options = None, start = 0):
+        """
+        Get the game results matching some criteria. (list of list)
+
+        Parameters:
+        game_names: The games to get results for, defaults to all. (list of str)
+        flags: Only get results with one of these flags set. (int)
+        options: Only get results with these exact options. (str)
+        start: The number of results to skip over. (int)
+        """
+        # Build the query.
+        sql = 'SELECT game, win, loss, draw, score, turns, flags, options FROM results'
+        conditions, parameters = [], []
+        if game_names is not None:
+            game_names = list(game_names)
+            conditions.append('game IN ({})'.format(', '.join('?' * len(game_names))))
+            parameters.extend(game_names)
+        if flags:
+            conditions.append('flags & ?')
+            parameters.append(flags)
+        if options is not None:
+            conditions.append('options = ?')
+            parameters.append(options)
+        if start:
+            conditions.append('id > (SELECT id FROM results ORDER BY id LIMIT 1 OFFSET ?)')
+            parameters.append(start - 1)
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY id'
+        # Get the results.
+        return [list(row) for row in self.connection.execute(sql, parameters)]
+
+
+class TextStore(ResultsStore):
+    """
+    Game results stored in a comma separated text file. (ResultsStore)
+
+    This was the original format for t_games results.
+
+    Attributes:
+    file_name: The location of the text file. (str)
+
+    Overridden Methods:
+    __init__
+    extend
+    load
+    """
+
+    def __init__(self, folder_name, create = True):
+        """
+        Set up the store. (None)
+
+        Parameters:
+        folder_name: The local folder with the player's data. (str)
+        create: A flag for creating the text file if it is missing. (bool)
+        """
+        super(TextStore, self).__init__(folder_name)
+        self.file_name = os.path.join(folder_name, 'results.txt')
+        if create and not os.path.exists(self.file_name):
+            with open(self.file_name, 'w') as player_data:
+                player_data.write('')
+
+    def extend(self, rows):
+        """
+        Add several game results to the store. (None)
+
+        Parameters:
+        rows: The game names and results to add. (list of list)
+        """
+        lines = [','.join([str(x) for x in row]) + '\n' for row in rows]
+        with open(self.file_name, 'a') as player_data:
+            player_data.write(''.join(lines))
+
+    def load(self):
+        """Get all of the game results. (list of list)"""
+        rows = []
+        if os.path.exists(self.file_name):
+            with open(self.file_name) as player_data:
+                for line in player_data:
+                    results = line.strip().split(',', 7)
+                    rows.append(results[:1] + [int(x) for x in results[1:-1]] + results[-1:])
+        return rows
+
+
+# The available results stores.
+STORES = {'text': TextStore}
+if sqlite3 is not None:
+    STORES['sqlite'] = SQLiteStore
+
+# The type of results store to use by default.
+DEFAULT_STORE = 'sqlite' if sqlite3 is not None else 'text'
+
+
+def open_store(folder_name, store_type = DEFAULT_STORE):
+    """
+    Open the results store for a player's folder. (ResultsStore)
+
+    Parameters:
+    folder_name: The local folder with the player's data. (str)
+    store_type: The key in STORES of the type of store to use. (str)
+    """
+    return STORES[store_type](folder_name)
@@ -0,0 +1,186 @@
+"""
+bench_test.py
+
+Unit testing of bench.py
+
+Classes:
+BenchGameTest: Tests of benchmarking a single game. (unittest.TestCase)
+BenchReplayTest: Tests of benchmarking a recorded game. (unittest.TestCase)
+BenchScriptTest: Tests of benchmarking games without bots. (unittest.TestCase)
+CompareTest: Tests of finding benchmark regressions. (unittest.TestCase)
+PercentileTest: Tests of calculating percentiles. (unittest.TestCase)
+SetUpPlayersTest: Tests of setting up games without a human. (unittest.TestCase)
+"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from t_games import bench
+from t_games import game
+from t_games import replay
+from t_games.adventure_games import oregon_trail_game
+from t_games.card_games.solitaire_games import calvin_cards_game
+from t_games.dice_games import pig_game
+from t_games.simulation_games import hamurabi_game
+from t_games.t_tests import unitility
+
+
+class BenchGameTest(unittest.TestCase):
+    """Tests of benchmarking a single game. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.data = bench.bench_game(pig_game.Pig, 3, 1)
+
+    def testGames(self):
+        """Test the number of games played."""
+        self.assertEqual(3, self.data['games'])
+
+    def testMode(self):
+        """Test playing with bots."""
+        self.assertEqual('bots', self.data['mode'])
+
+    def testPercentiles(self):
+        """Test the latency percentiles."""
+        self.assertTrue(0 < self.data['p50'] <= self.data['p95'])
+
+    def testSeeded(self):
+        """Test that seeded benchmarks play the same games."""
+        data = bench.bench_game(pig_game.Pig, 3, 1)
+        self.assertEqual(self.data['turns'], data['turns'])
+
+    def testStatus(self):
+        """Test a successful benchmark."""
+        self.assertEqual('ok', self.data['status'])
+
+
+class BenchReplayTest(unittest.TestCase):
+    """Tests of benchmarking a recorded game. (unittest.TestCase)"""
+
+    def setUp(self):
+        # Record a game.
+        flip = game.Flip(unitility.AutoBot(['2'] * 50), 'none')
+        flip.recording = True
+        flip.play()
+        # Save the record.
+        self.folder_name = tempfile.mkdtemp()
+        self.file_name = os.path.join(self.folder_name, 'flip.tgil')
+        flip.input_log.save(self.file_name)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder_name)
+
+    def testDiverged(self):
+        """Test a replay that does not match the recording."""
+        log = replay.read_log(self.file_name)
+        log.results[4] += 1
+        log.save(self.file_name)
+        data = bench.bench_replay(self.file_name, {'flip': game.Flip}, 1)
+        self.assertEqual('diverged', data['status'])
+
+    def testMissing(self):
+        """Test replaying an unknown game."""
+        self.assertEqual('error', bench.bench_replay(self.file_name, {}, 2)['status'])
+
+    def testReplay(self):
+        """Test replaying a recorded game."""
+        data = bench.bench_replay(self.file_name, {'flip': game.Flip}, 2)
+        self.assertEqual(('replay', 'ok', 2), (data['mode'], data['status'], data['games']))
+
+
+class BenchScriptTest(unittest.TestCase):
+    """Tests of benchmarking games without bots. (unittest.TestCase)"""
+
+    def testOptions(self):
+        """Test answering option questions before quitting."""
+        data = bench.bench_game(calvin_cards_game.CalvinCards, 2, 1)
+        self.assertEqual(('script', 'quit', 2), (data['mode'], data['status'], data['games']))
+
+    def testPlay(self):
+        """Test playing a game with a script."""
+        data = bench.bench_game(hamurabi_game.Hamurabi, 2, 1)
+        self.assertEqual(('script', 'ok', 2), (data['mode'], data['status'], data['games']))
+        self.assertGreater(data['turns'], 2)
+
+    def testSetUp(self):
+        """Test answering set up questions before quitting."""
+        data = bench.bench_game(oregon_trail_game.OregonTrail, 2, 1)
+        self.assertEqual(('script', 'quit', 2), (data['mode'], data['status'], data['games']))
+
+
+class CompareTest(unittest.TestCase):
+    """Tests of finding benchmark regressions. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.baseline = {'games': [{'name': 'Pig', 'status': 'ok', 'games_per_sec': 100.0}]}
+
+    def compare(self, status, games_per_sec):
+        """
+        Compare a new benchmark to the baseline. (list of str)
+
+        Parameters:
+        status: The status of the new benchmark. (str)
+        games_per_sec: The speed of the new benchmark. (float)
+        """
+        current = {'games': [{'name': 'Pig', 'status': status, 'games_per_sec': games_per_sec}]}
+        return bench.compare(self.baseline, current)
+
+    def testFaster(self):
+        """Test a faster benchmark."""
+        self.assertEqual([], self.compare('ok', 150.0))
+
+    def testMissing(self):
+        """Test a game missing from the baseline."""
+        current = {'games': [{'name': 'Flip', 'status': 'ok', 'games_per_sec': 1.0}]}
+        self.assertEqual([], bench.compare(self.baseline, current))
+
+    def testNoise(self):
+        """Test a benchmark slower within the threshold."""
+        self.assertEqual([], self.compare('ok', 95.0))
+
+    def testSlower(self):
+        """Test a benchmark slower beyond the threshold."""
+        self.assertEqual(['Pig: 20.0% slower (100.00 -> 80.00 games/sec)'], self.compare('ok', 80.0))
+
+    def testStatus(self):
+        """Test a benchmark that stopped working."""
+        self.assertEqual(['Pig: status went from ok to error'], self.compare('error', 0.0))
+
+
+class PercentileTest(unittest.TestCase):
+    """Tests of calculating percentiles. (unittest.TestCase)"""
+
+    def testHigh(self):
+        """Test a high percentile."""
+        self.assertEqual(95, bench.percentile(list(range(100, 0, -1)), 95))
+
+    def testMedian(self):
+        """Test the median."""
+        self.assertEqual(3, bench.percentile([5, 1, 4, 2, 3], 50))
+
+    def testSingle(self):
+        """Test a percentile of one number."""
+        self.assertEqual(8, bench.percentile([8], 5))
+
+
+class SetUpPlayersTest(unittest.TestCase):
+    """Tests of setting up games without a human. (unittest.TestCase)"""
+
+    def testBots(self):
+        """Test replacing the human with a bot."""
+        human = unitility.AutoBot()
+        game = pig_game.Pig(human, 'none')
+        bench.set_up_players(game, human)
+        self.assertNotIn(human, game.players)
+
+    def testScript(self):
+        """Test leaving the human in a game without bots."""
+        human = unitility.AutoBot()
+        game = unitility.TestGame(human, 'none')
+        self.assertEqual('script', bench.set_up_players(game, human))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,10 +4,12 @@ board_test.py
 Unit testing of board.py.
 
 Classes:
+ArrayBoardTest: Tests of a board stored as a list of pieces. (TestCase)
 BoardTest: Tests of the parent Board class. (TestCase)
 BoardCellTest: Tests of the board cell class. (TestCase)
 CoordinateTest: Tests of n-dimensional coordinates. (TestCase)
 DimBoardTest: Tests of a multi-dimensional board. (TestCase)
+GeometryTest: Tests of the shared cell tables for a size of board. (TestCase)
 LineBoardTest: Tests of a one dimensional board. (TestCase)
 MultiCellTest: Tests of the multi-cell class. (TestCase)
 """
@@ -18,6 +20,97 @@ import unittest
 from t_games import board
 
 
+class ArrayBoardTest(unittest.TestCase):
+    """Tests of a board stored as a list of pieces. (TestCase)"""
+
+    def setUp(self):
+        self.board = board.ArrayBoard((3, 3))
+        self.board.place((1, 2), '@')
+        self.board.place((3, 2), '&')
+
+    def testCellRead(self):
+        """Test reading a piece through a board cell."""
+        self.assertEqual('@', self.board.cells[(1, 2)].contents)
+
+    def testCellWrite(self):
+        """Test writing a piece through a board cell."""
+        self.board.cells[(2, 2)].add_piece('%')
+        self.assertEqual('%', self.board.contents[self.board.indexes[(2, 2)]])
+
+    def testClear(self):
+        """Test clearing the board."""
+        self.board.clear()
+        self.assertEqual([None] * 9, self.board.contents)
+
+    def testCopyIndependence(self):
+        """Test the indenpendence of a copy of the board."""
+        new_board = self.board.copy()
+        self.board.move((1, 2), (2, 3))
+        self.assertNotEqual(new_board.cells[(1, 2)].contents, self.board.cells[(1, 2)].contents)
+        self.assertNotEqual(new_board.cells[(2, 3)].contents, self.board.cells[(2, 3)].contents)
+
+    def testCopyLayout(self):
+        """Test that a copy shares the coordinate maps."""
+        new_board = self.board.copy()
+        self.assertIs(self.board.indexes, new_board.indexes)
+
+    def testCopyValues(self):
+        """Test the correctness of a copy of the board."""
+        new_board = self.board.copy()
+        self.assertEqual(new_board.cells, self.board.cells)
+
+    def testDimBoardEqual(self):
+        """Test equality with a dictionary based board."""
+        dim_board = board.DimBoard((3, 3))
+        dim_board.place((1, 2), '@')
+        dim_board.place((3, 2), '&')
+        self.assertEqual(dim_board, self.board)
+
+    def testHashCopy(self):
+        """Test that a copy has the same hash."""
+        self.assertEqual(self.board.zobrist, self.board.copy().zobrist)
+
+    def testHashEmpty(self):
+        """Test that removing all the pieces resets the hash."""
+        self.board.place((1, 2), None)
+        self.board.cells[(3, 2)].clear()
+        self.assertEqual(0, self.board.zobrist)
+
+    def testHashOrder(self):
+        """Test that the hash does not depend on the order of the moves."""
+        other = board.ArrayBoard((3, 3))
+        other.place((3, 2), '&')
+        other.place((1, 2), '@')
+        self.assertEqual(self.board.zobrist, other.zobrist)
+
+    def testHashPiece(self):
+        """Test that the hash depends on the pieces."""
+        other = board.ArrayBoard((3, 3))
+        other.place((1, 2), '&')
+        other.place((3, 2), '@')
+        self.assertNotEqual(self.board.zobrist, other.zobrist)
+
+    def testLocations(self):
+        """Test the locations are in the same order as a dim board."""
+        self.assertEqual(list(board.DimBoard((3, 3)).cells), list(self.board.cells))
+
+    def testOffsetValue(self):
+        """Test the value of an offset."""
+        center = board.Coordinate((2, 2))
+        self.assertEqual((1, 3), self.board.offset(center, (-1, 1)).location)
+
+    def testRehash(self):
+        """Test recalculating the hash."""
+        zobrist = self.board.zobrist
+        self.board.zobrist = 0
+        self.board.rehash()
+        self.assertEqual(zobrist, self.board.zobrist)
+
+    def testRepr(self):
+        """Test the debugging text representation."""
+        self.assertEqual('<ArrayBoard with 3x3 ArrayCells>', repr(self.board))
+
+
 class BoardTest(unittest.TestCase):
     """Tests of the parent Board class. (TestCase)"""
 
@@ -470,6 +563,10 @@ class DimBoardTest(unittest.TestCase):
         locations = sorted(self.board.cells.keys())
         self.assertEqual(check, locations)
 
+    def testOffsetOff(self):
+        """Test an offset off of the board."""
+        self.assertRaises(KeyError, self.board.offset, (3, 2), (1, 0))
+
     def testOffsetValue(self):
         """Test the value of an offset."""
         center = board.Coordinate((2, 2))
@@ -490,6 +587,49 @@ class DimBoardTest(unittest.TestCase):
         self.assertEqual('<DimBoard with 3x3 MultiCells>', repr(test_board))
 
 
+class GeometryTest(unittest.TestCase):
+    """Tests of the shared cell tables for a size of board. (TestCase)"""
+
+    def setUp(self):
+        self.geometry = board.geometry((3, 3))
+
+    def testNeighborsCenter(self):
+        """Test the neighbors of the center cell."""
+        neighbors = self.geometry.neighbors(((0, 1), (1, 0), (0, -1), (-1, 0)))[self.geometry.indexes[(2, 2)]]
+        locations = [self.geometry.coordinates[index] for index in neighbors]
+        self.assertEqual([(2, 3), (3, 2), (2, 1), (1, 2)], locations)
+
+    def testNeighborsCorner(self):
+        """Test the neighbors of a corner cell."""
+        neighbors = self.geometry.neighbors(((0, 1), (1, 0), (0, -1), (-1, 0)))[self.geometry.indexes[(1, 1)]]
+        locations = [self.geometry.coordinates[index] for index in neighbors]
+        self.assertEqual([(1, 2), (2, 1)], locations)
+
+    def testRays(self):
+        """Test getting lines of cells."""
+        rays = self.geometry.rays(((1, 0), (1, 1)), 3)
+        lines = [[self.geometry.coordinates[index] for index in ray] for ray in rays]
+        check = [[(1, 1), (2, 1), (3, 1)], [(1, 1), (2, 2), (3, 3)], [(1, 2), (2, 2), (3, 2)], [(1, 3), (2, 3), (3, 3)]]
+        self.assertEqual(check, lines)
+
+    def testRepr(self):
+        """Test the debugging text representation."""
+        self.assertEqual('Geometry((3, 3))', repr(self.geometry))
+
+    def testShared(self):
+        """Test that boards of the same size share a geometry."""
+        self.assertIs(self.geometry, board.DimBoard([3, 3]).geometry)
+
+    def testStep(self):
+        """Test offsetting from a cell."""
+        index = self.geometry.step((1, -1))[self.geometry.indexes[(1, 2)]]
+        self.assertEqual((2, 1), self.geometry.coordinates[index])
+
+    def testStepOff(self):
+        """Test offsetting off the grid."""
+        self.assertIsNone(self.geometry.step((1, 0))[self.geometry.indexes[(3, 1)]])
+
+
 class LineBoardTest(unittest.TestCase):
     """Tests of a one dimensional board. (TestCase)"""
 
@@ -4,21 +4,30 @@ cards_test.py
 Unit testing of cards.py
 
 Classes:
+CardSetTest: Tests of sets of cards as bits. (unittest.TestCase)
 CardTest: Tests of the standard Card class. (unittest.TestCase)
 CRandTest: Test of the implementation of C's rand function.
+DealCacheTest: Tests of the cache of C-style deal orders. (unittest.TestCase)
+DeckBulkDealTest: Tests of bulk deals with and without NumPy. (unittest.TestCase)
 DeckTest: Test of the standard Deck class. (unittest.TestCase)
 FeatureSetTest: Tests of the FeatureSet (ranks/suits) class. (TestCase)
 HandTest: Test of the Hand (of cards) class. (unittest.TestCase)
 MultiTrackingDeckTest: Tests of the MultiTrackingDeck class. (TestCase)
 ParseTextTest: Tests of the parse_text function. (unittest.TestCase)
 PileTest: Tests of the Pile (of Cards) class. (unittest.TestCase)
+RemoveCardsTest: Tests of the remove_cards function. (unittest.TestCase)
 TrackingCardTest: Tests of the TrackingCard class. (unittest.TestCase)
 TrackingDeckTest: Tests of the TrackingDeck class. (unittest.TestCase)
 """
 
 
 import collections
+import copy
+import os
+import pickle
 import random
+import shutil
+import tempfile
 import unittest
 
 from t_games import cards
@@ -26,6 +35,119 @@ from t_games.card_games.solitaire_games import solitaire_game as solitaire
 from t_games.t_tests import unitility
 
 
+class CardSetTest(unittest.TestCase):
+    """Tests of sets of cards as bits. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.hand = cards.Hand([cards.Card('A', 'S'), cards.Card('5', 'H'), cards.Card('5', 'C')])
+        self.card_set = self.hand.card_set()
+
+    def testAdd(self):
+        """Test adding a card to the set."""
+        self.card_set.add('kd')
+        self.assertIn(cards.Card('K', 'D'), self.card_set)
+
+    def testAnd(self):
+        """Test getting the cards in two sets."""
+        other = cards.CardSet(['5C', 'KD'])
+        self.assertEqual(cards.CardSet(['5C']), self.card_set & other)
+
+    def testCode(self):
+        """Test the integer code for a card."""
+        self.assertEqual(3 * 16 + 1, self.card_set.code(cards.Card('A', 'S')))
+
+    def testContains(self):
+        """Test checking for a card by text."""
+        self.assertIn('5h', self.card_set)
+
+    def testContainsNot(self):
+        """Test checking for a card not in the set."""
+        self.assertNotIn(cards.Card('5', 'D'), self.card_set)
+
+    def testDiscard(self):
+        """Test removing a card from the set."""
+        self.card_set.discard('AS')
+        self.assertEqual(cards.CardSet(['5C', '5H']), self.card_set)
+
+    def testDiscardMissing(self):
+        """Test removing a card that is not in the set."""
+        self.card_set.discard('AD')
+        self.assertEqual(3, len(self.card_set))
+
+    def testIter(self):
+        """Test iterating over the codes in suit then rank order."""
+        self.assertEqual([5, 2 * 16 + 5, 3 * 16 + 1], list(self.card_set))
+
+    def testLen(self):
+        """Test counting the cards."""
+        self.assertEqual(3, len(self.card_set))
+
+    def testLenDuplicates(self):
+        """Test counting the cards with duplicates."""
+        self.assertEqual(2, len(cards.CardSet(['5C', 'KD', '5c'])))
+
+    def testNotEqual(self):
+        """Test checking for different cards."""
+        self.assertNotEqual(cards.CardSet(['5C', '5H']), self.card_set)
+
+    def testNotEqualSame(self):
+        """Test checking for different cards with the same cards."""
+        self.assertFalse(cards.CardSet(['5C', '5H', 'AS']) != self.card_set)
+
+    def testNotHashable(self):
+        """Test that card sets can't be hashed."""
+        self.assertRaises(TypeError, hash, self.card_set)
+
+    def testOfRank(self):
+        """Test getting the cards of a rank."""
+        self.assertEqual(cards.CardSet(['5C', '5H']), self.card_set.of_rank('5'))
+
+    def testOfSuit(self):
+        """Test getting the cards of a suit."""
+        self.assertEqual(cards.CardSet(['AS']), self.card_set.of_suit('s'))
+
+    def testOr(self):
+        """Test getting the cards in either set."""
+        self.assertEqual(4, len(self.card_set | cards.CardSet(['5C', 'KD'])))
+
+    def testRankCount(self):
+        """Test counting the cards of a rank."""
+        self.assertEqual([1, 2, 0], [self.card_set.rank_count(rank) for rank in 'A5k'])
+
+    def testRankIn(self):
+        """Test checking for a rank."""
+        self.assertEqual([True, False], [self.card_set.rank_in('a'), self.card_set.rank_in('K')])
+
+    def testRepr(self):
+        """Test the debugging text representation."""
+        self.assertEqual('<CardSet [5C, 5H, AS]>', repr(self.card_set))
+
+    def testSub(self):
+        """Test getting the cards not in another set."""
+        self.assertEqual(cards.CardSet(['AS', '5H']), self.card_set - cards.CardSet(['5C', 'KD']))
+
+    def testSuitCount(self):
+        """Test counting the cards of a suit."""
+        self.assertEqual([1, 0, 1, 1], [self.card_set.suit_count(suit) for suit in 'CDHS'])
+
+    def testSuitIn(self):
+        """Test checking for a suit."""
+        self.assertEqual([True, False], [self.card_set.suit_in('h'), self.card_set.suit_in('D')])
+
+    def testToCards(self):
+        """Test converting back to cards."""
+        self.assertEqual(sorted(self.hand.cards), self.card_set.to_cards())
+
+    def testToHand(self):
+        """Test converting back to a hand."""
+        self.assertEqual(self.hand, self.card_set.to_hand())
+
+    def testTooBig(self):
+        """Test a feature set too big for the bits."""
+        suits = cards.FeatureSet('CDHSR', ['Clubs', 'Diamonds', 'Hearts', 'Spades', 'Roses'])
+        self.assertRaises(ValueError, cards.CardSet, suit_set = suits)
+
+
 class CardTest(unittest.TestCase):
     """Tests of the standard Card class. (unittest.TestCase)"""
 
@@ -97,6 +219,24 @@ class CardTest(unittest.TestCase):
         """Test equality of card and upper case string."""
         self.assertEqual('XD', self.joker)
 
+    def testFaceDownText(self):
+        """Test that cards with different down text have different faces."""
+        self.assertIsNot(self.ace.face, cards.Card('A', 'S', down_text = '##').face)
+
+    def testFaceRankSet(self):
+        """Test that cards from different rank sets have different faces."""
+        self.assertIsNot(self.ace.face, cards.Card('A', 'S', rank_set = cards.STANDARD_WRAP_RANKS).face)
+
+    def testFaceShared(self):
+        """Test that cards of the same rank and suit share a face."""
+        self.assertIs(self.ace.face, cards.Card('A', 'S').face)
+
+    def testFaceUp(self):
+        """Test that turning a card over does not change other cards."""
+        other = cards.Card('A', 'S')
+        self.ace.up = True
+        self.assertEqual('??', str(other))
+
     def testFormatA(self):
         """Test formatting with no format specification."""
         self.assertEqual('a jack of hearts', '{:a}'.format(self.jack))
@@ -195,12 +335,165 @@ class CRandTest(unittest.TestCase):
         self.assertEqual('CRand({})'.format(self.rand.state), repr(self.rand))
 
 
+class DealCacheTest(unittest.TestCase):
+    """Tests of the cache of C-style deal orders. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.folder_name = tempfile.mkdtemp()
+        self.cache = cards.DealCache(os.path.join(self.folder_name, 'deals.dat'))
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.folder_name)
+
+    def testBuild(self):
+        """Test building the cache file."""
+        self.cache.build(20)
+        self.assertEqual(20, self.cache.count)
+
+    def testDealCached(self):
+        """Test getting a deal from the cache file."""
+        self.cache.build(20)
+        self.assertEqual(cards.crand_order(17), self.cache.deal(17))
+
+    def testDealMissing(self):
+        """Test getting a deal without a cache file."""
+        self.assertEqual(cards.crand_order(17), self.cache.deal(17))
+
+    def testDealPast(self):
+        """Test getting a deal past the end of the cache file."""
+        self.cache.build(20)
+        self.assertEqual(cards.crand_order(21), self.cache.deal(21))
+
+    def testDealSize(self):
+        """Test getting a deal for a different size deck than the cache."""
+        self.cache.build(20)
+        self.assertEqual(cards.crand_order(17, 104), self.cache.deal(17, 104))
+
+    def testDeals(self):
+        """Test iterating over a range of deals."""
+        self.cache.build(5)
+        check = [cards.crand_order(number) for number in range(3, 9)]
+        self.assertEqual(check, list(self.cache.deals(3, 9)))
+
+    def testOrder(self):
+        """Test that a deal order has each card once."""
+        self.assertEqual(list(range(52)), sorted(bytearray(cards.crand_order(801))))
+
+
+class DeckBulkDealTest(unittest.TestCase):
+    """Tests of bulk deals with and without NumPy. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.deck = cards.Deck()
+        self.numpy_hold = cards.numpy
+
+    def tearDown(self):
+        cards.numpy = self.numpy_hold
+
+    def checkArray(self, deals, shape):
+        """
+        Check that bulk deals are a NumPy integer array. (None)
+
+        Parameters:
+        deals: The bulk deals to check. (numpy.ndarray)
+        shape: The expected shape of the array. (tuple of int)
+        """
+        self.assertIsInstance(deals, self.numpy_hold.ndarray)
+        self.assertEqual('i', deals.dtype.kind)
+        self.assertEqual(shape, deals.shape)
+
+    def checkDeals(self, deals):
+        """
+        Check that bulk deals are lists of lists of int. (None)
+
+        Parameters:
+        deals: The bulk deals to check. (list of list)
+        """
+        self.assertIsInstance(deals, list)
+        for deal in deals:
+            self.assertIsInstance(deal, list)
+            self.assertTrue(all(type(code) is int for code in deal))
+
+    @unittest.skipIf(cards.numpy is None, 'NumPy is not installed.')
+    def testDealsNumPy(self):
+        """Test the type of bulk deals with NumPy."""
+        self.checkArray(self.deck.bulk_deal(3), (3, 52))
+
+    def testDealsPython(self):
+        """Test the type of bulk deals without NumPy."""
+        cards.numpy = None
+        self.checkDeals(self.deck.bulk_deal(3))
+
+    @unittest.skipIf(cards.numpy is None, 'NumPy is not installed.')
+    def testHandsMatch(self):
+        """Test that bulk deals with hands are the same shape with or without NumPy."""
+        numpy_hands, numpy_stock = self.deck.bulk_deal(3, 4, 5)
+        cards.numpy = None
+        hands, stock = self.deck.bulk_deal(3, 4, 5)
+        self.assertEqual([[len(hand) for hand in deal] for deal in hands],
+            [[len(hand) for hand in deal] for deal in numpy_hands])
+        self.assertEqual([len(deal) for deal in stock], [len(deal) for deal in numpy_stock])
+
+    @unittest.skipIf(cards.numpy is None, 'NumPy is not installed.')
+    def testHandsNumPy(self):
+        """Test the type of bulk deals with hands with NumPy."""
+        hands, stock = self.deck.bulk_deal(3, 4, 5)
+        self.checkArray(hands, (3, 4, 5))
+        self.checkArray(stock, (3, 32))
+
+    def testHandsPython(self):
+        """Test the type of bulk deals with hands without NumPy."""
+        cards.numpy = None
+        hands, stock = self.deck.bulk_deal(3, 4, 5)
+        for deal in hands:
+            self.checkDeals(deal)
+        self.checkDeals(stock)
+
+
 class DeckTest(unittest.TestCase):
     """Test of the standard Deck class. (unittest.TestCase)"""
 
     def setUp(self):
         self.deck = cards.Deck()
 
+    def testBulkDealCount(self):
+        """Test the number of decks shuffled in a bulk deal."""
+        self.assertEqual(5, len(self.deck.bulk_deal(5)))
+
+    def testBulkDealCards(self):
+        """Test that each bulk deal has all of the cards."""
+        codes = sorted(cards.CardSet(self.deck.cards))
+        for deal in self.deck.bulk_deal(5):
+            self.assertEqual(codes, sorted(int(code) for code in deal))
+
+    def testBulkDealHands(self):
+        """Test dealing hands around the players in a bulk deal."""
+        self.deck.rng = random.Random(801)
+        deals = self.deck.bulk_deal(3)
+        self.deck.rng = random.Random(801)
+        hands, stock = self.deck.bulk_deal(3, 4, 5)
+        check = [int(code) for code in deals[2][1:20:4]]
+        self.assertEqual(check, [int(code) for code in hands[2][1]])
+
+    def testBulkDealSeed(self):
+        """Test that bulk deals follow the deck's random number generator."""
+        self.deck.rng = random.Random(801)
+        deals = self.deck.bulk_deal(3)
+        self.deck.rng = random.Random(801)
+        self.assertEqual([list(deal) for deal in deals], [list(deal) for deal in self.deck.bulk_deal(3)])
+
+    def testBulkDealStock(self):
+        """Test the stock left after dealing hands in a bulk deal."""
+        hands, stock = self.deck.bulk_deal(3, 4, 5)
+        self.assertEqual(32, len(stock[0]))
+
+    def testBulkDealUnchanged(self):
+        """Test that a bulk deal does not change the deck."""
+        check = self.deck.cards[:]
+        self.deck.bulk_deal(3, 4, 5)
+        self.assertEqual(check, self.deck.cards)
+
     def testCut(self):
         """Test cutting a deck of cards."""
         self.deck.shuffle()
@@ -277,6 +570,10 @@ class DeckTest(unittest.TestCase):
         card = self.deck.deal(up = True)
         self.assertTrue(card.up)
 
+    def testDeepCopy(self):
+        """Test deep copying a deck."""
+        self.assertEqual(self.deck.cards, copy.deepcopy(self.deck).cards)
+
     def testDiscard(self):
         """Test discarding a card."""
         self.deck.shuffle()
@@ -394,6 +691,10 @@ class DeckTest(unittest.TestCase):
         card = self.deck.pick(18)
         self.assertTrue(card.up)
 
+    def testPickle(self):
+        """Test pickling a deck."""
+        self.assertEqual(self.deck.cards, pickle.loads(pickle.dumps(self.deck)).cards)
+
     def testPlayerHandsKeys(self):
         players = ['Jack', 'Robert', 'Tyler']
         hands = self.deck.player_hands(players)
@@ -493,6 +794,14 @@ class DeckTest(unittest.TestCase):
         self.deck.shuffle()
         self.assertNotEqual(check, self.deck.cards)
 
+    def testShuffleRNG(self):
+        """Test shuffling with a seeded random number generator."""
+        self.deck = cards.Deck(rng = random.Random(801))
+        other = cards.Deck(rng = random.Random(801))
+        self.deck.shuffle()
+        other.shuffle()
+        self.assertEqual(other.cards, self.deck.cards)
+
 
 class FeatureSetTest(unittest.TestCase):
     """Tests of the FeatureSet (ranks/suits) class. (unittest.TestCase)"""
@@ -783,6 +1092,20 @@ class HandTest(unittest.TestCase):
         """Test finding all of the cards in hand."""
         self.assertEqual(self.hand, self.hand.find())
 
+    def testFindChanged(self):
+        """Test finding cards after the hand's cards change."""
+        self.hand.cards = cards.parse_text('5D 6D 7D 4C 5C 3C 5H')
+        self.hand.find(rank = '5')
+        self.hand.cards.append(cards.Card('5', 'S'))
+        check = cards.Hand(cards.parse_text('5C 5D 5H 5S'))
+        self.assertEqual(check, self.hand.find(rank = '5'))
+
+    def testFindCopy(self):
+        """Test that changing found cards does not change later finds."""
+        self.hand.cards = cards.parse_text('5D 6D 7D 4C 5C 3C 5H')
+        self.hand.find(rank = '5').cards.pop()
+        self.assertEqual(3, len(self.hand.find(rank = '5')))
+
     def testFindNotRank(self):
         """Test finding cards in hand excluding a rank."""
         self.hand.cards = cards.parse_text('5D 6D 7D 3C 4C 5C 5H')
@@ -848,6 +1171,13 @@ class HandTest(unittest.TestCase):
         self.hand.cards = cards.parse_text('5D 6D 7D 4C 5C 3C 5H')
         self.assertTrue(self.hand.rank_in('7'))
 
+    def testRankInRemoved(self):
+        """Test checking for a rank after it is removed from the hand."""
+        self.hand.cards = cards.parse_text('5D 6D 7D 4C 5C 3C 5H')
+        self.hand.rank_in('7')
+        self.hand.cards.remove('7D')
+        self.assertFalse(self.hand.rank_in('7'))
+
     def testRanks(self):
         """Test getting the ranks in a hand."""
         self.hand.cards = cards.parse_text('5D 6D 7D 4C 5C 3C 5H')
@@ -902,7 +1232,7 @@ class HandTest(unittest.TestCase):
             self.hand.draw()
         check = str(self.hand)
         for card in self.hand:
-            card.down = False
+            card.up = False
         self.assertEqual(check, self.hand.show_player())
 
     def testShowPlayerUp(self):
@@ -944,6 +1274,14 @@ class HandTest(unittest.TestCase):
         self.hand.cards = cards.parse_text('5D 6D 7D 4C 5C 3C 5H')
         self.assertTrue(self.hand.suit_in('C'))
 
+    def testSuitInShift(self):
+        """Test checking for a suit after shifting it to another hand."""
+        self.hand.cards = cards.parse_text('5D 6D 7D 4C 5C 3C 5H')
+        other = cards.Hand(deck = self.deck)
+        other.suit_in('H')
+        self.hand.shift('5H', other)
+        self.assertTrue(other.suit_in('H'))
+
     def testSuits(self):
         """Test getting the suits in a hand."""
         self.hand.cards = cards.parse_text('5D 6D 7D 4C 5C 3C 5H')
@@ -1162,17 +1500,41 @@ class PileTest(unittest.TestCase):
         check = self.pile.cards + self.cards
         self.assertEqual(check, self.pile + other)
 
+    def testAppend(self):
+        """Test adding a card to a pile."""
+        self.pile.append(self.cards[0])
+        self.assertEqual(self.cards[0], self.pile[-1])
+
     def testChildPile(self):
         """Test that the child of a Pile is a Pile."""
         pile = self.pile._child(cards.parse_text('AD 2D 3D'))
         self.assertIsInstance(pile, cards.Pile)
 
+    def testContainsNo(self):
+        """Test checking for a card not in a pile."""
+        self.assertNotIn('KS', self.pile)
+
+    def testContainsYes(self):
+        """Test checking for a card in a pile."""
+        self.assertIn('QS', self.pile)
+
+    def testCount(self):
+        """Test counting cards in a pile."""
+        self.pile.extend(self.pile.cards[:3])
+        self.assertEqual(2, self.pile.count('3C'))
+
     def testDel(self):
         """Test deleting a card from the pile."""
         check = self.pile[:2] + self.pile[3:]
         del self.pile[2]
         self.assertEqual(check, self.pile)
 
+    def testExtend(self):
+        """Test adding cards to a pile."""
+        check = self.pile.cards + self.cards
+        self.pile.extend(self.cards)
+        self.assertEqual(check, self.pile.cards)
+
     def testEqualListNo(self):
         """Test a pile not being equal to a different list."""
         check = cards.parse_text('AS 4C 2H 8D QH JH')
@@ -1217,6 +1579,14 @@ class PileTest(unittest.TestCase):
         check = cards.parse_text('3C 2H QH')
         self.assertEqual(check, self.pile[1:6:2])
 
+    def testIndex(self):
+        """Test finding the position of a card in a pile."""
+        self.assertEqual(4, self.pile.index('8D'))
+
+    def testIndexStart(self):
+        """Test finding the position of a card in part of a pile."""
+        self.assertRaises(ValueError, self.pile.index, 'QS', 3)
+
     def testInplaceMultiply(self):
         """Test multiplying a Pile in place."""
         base = cards.parse_text('8S AH')
@@ -1242,6 +1612,10 @@ class PileTest(unittest.TestCase):
         check = cards.parse_text('AS 3C QS JS 2H 8D QH JH')
         self.pile.insert(3, cards.parse_text('JS'))
 
+    def testIter(self):
+        """Test iterating over a pile."""
+        self.assertEqual(self.pile.cards, [card for card in self.pile])
+
     def testLen(self):
         """Test the len of a Pile."""
         self.assertEqual(7, len(self.pile))
@@ -1267,6 +1641,20 @@ class PileTest(unittest.TestCase):
         check = []
         self.assertEqual(check, self.pile * 0)
 
+    def testPop(self):
+        """Test removing the top card from a pile."""
+        check = self.pile.cards[-1]
+        self.assertEqual(check, self.pile.pop())
+
+    def testPopIndex(self):
+        """Test removing a card from a pile by position."""
+        self.assertEqual('QS', self.pile.pop(2))
+
+    def testRemove(self):
+        """Test removing a card from a pile."""
+        self.pile.remove('QS')
+        self.assertNotIn('QS', self.pile)
+
     def testRepr(self):
         """Test the debugging text representation of a Pile."""
         self.assertEqual('<Pile [AS, 3C, QS, 2H, 8D, QH, JH]>', repr(self.pile))
@@ -1275,6 +1663,16 @@ class PileTest(unittest.TestCase):
         """Test the debugging text representation of an empty Pile."""
         self.assertEqual('<Pile []>', repr(cards.Pile()))
 
+    def testReverse(self):
+        """Test reversing the order of a pile."""
+        check = self.pile.cards[::-1]
+        self.pile.reverse()
+        self.assertEqual(check, self.pile.cards)
+
+    def testReversed(self):
+        """Test iterating over a pile from the top."""
+        self.assertEqual(self.pile.cards[::-1], list(reversed(self.pile)))
+
     def testRightMultiply(self):
         """Test right multiplying a Pile."""
         base = cards.parse_text('8S AH')
@@ -1353,6 +1751,30 @@ class PileTest(unittest.TestCase):
         self.assertEqual(check, self.pile.cards)
 
 
+class RemoveCardsTest(unittest.TestCase):
+    """Tests of the remove_cards function. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.pile = [cards.Card(*pair) for pair in (('T', 'C'), ('J', 'C'), ('Q', 'C'), ('K', 'C'))]
+
+    def testRemoveMiddle(self):
+        """Test removing cards from the middle of a pile."""
+        check = [self.pile[0], self.pile[3]]
+        cards.remove_cards(self.pile, self.pile[1:3])
+        self.assertEqual(check, self.pile)
+
+    def testRemoveNone(self):
+        """Test removing no cards from a pile."""
+        cards.remove_cards(self.pile, [])
+        self.assertEqual(4, len(self.pile))
+
+    def testRemoveTop(self):
+        """Test removing cards from the top of a pile."""
+        check = self.pile[:2]
+        cards.remove_cards(self.pile, self.pile[2:])
+        self.assertEqual(check, self.pile)
+
+
 class TrackingCardTest(unittest.TestCase):
     """Tests of the location aware TrackingCard class. (unittest.TestCase)"""
 
@@ -1569,6 +1991,24 @@ class TrackingDeckTest(unittest.TestCase):
             check.append(card)
         self.assertEqual(check, self.deck.discards)
 
+    def testDiscardPlayIndex(self):
+        """Test that discarding keeps the in play indexes correct."""
+        self.deck.shuffle()
+        dealt = [self.deck.deal([]) for deal in range(9)]
+        self.deck.discard(dealt[2])
+        self.deck.discard(dealt[5])
+        self.assertEqual(list(range(7)), [self.deck.in_play.index(card) for card in self.deck.in_play])
+        self.assertEqual(list(range(7)), [card.play_index for card in self.deck.in_play])
+
+    def testDiscardUnder(self):
+        """Test discarding a card that is not on top of it's game location."""
+        pile = []
+        self.deck.shuffle()
+        card = self.deck.deal(pile)
+        top = self.deck.deal(pile)
+        self.deck.discard(card)
+        self.assertEqual([top], pile)
+
     def testShuffleDeckLocation(self):
         """Test shuffle on discard's deck location."""
         self.deck.shuffle()
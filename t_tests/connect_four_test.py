@@ -9,7 +9,10 @@ C4Bots: The bot classes used in testing. (list of player.Bot)
 Classes:
 ABFindShortsTest: Tests of finding two or three pieces in a row. (TestCase)
 BoardCheckWinTest: Tests of C4Board.check_win. (unittest.TestCase)
+BoardMoveTest: Tests of making and unmaking C4Board moves. (unittest.TestCase)
+BotSearchTest: Tests of the Connect Four bots' searching. (unittest.TestCase)
 C4BotTest: Tests of the ConnectFour bots. (unittest.TestCase)
+TimeLimitTest: Tests of the bots' time limits. (unittest.TestCase)
 """
 
 
@@ -259,9 +262,120 @@ class BoardCheckWinTest(unittest.TestCase):
             self.board.place((col, row), 'O')
         self.assertEqual('O', self.board.check_win())
 
+    def testVerticalTall(self):
+        """Test detecting a vertical win at the top of a board taller than wide."""
+        tall_board = connect_four.C4Board((4, 8), pieces = ['X', 'O'])
+        for row in range(5, 9):
+            tall_board.place((2, row), 'X')
+        self.assertEqual('X', tall_board.check_win())
+
+
+class BoardMoveTest(unittest.TestCase):
+    """Tests of making and unmaking C4Board moves. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.board = connect_four.C4Board(pieces = ['X', 'O'], poppable = True)
+        for column in (4, 4, 3, 4, 4):
+            self.board.make_move((column, self.board.get_moves()[0][1]))
+        self.contents = self.board.contents[:]
+        self.zobrist = self.board.zobrist
+
+    def testMakeFull(self):
+        """Test dropping a piece in a full column."""
+        self.board.make_move((4, 'O'))
+        self.board.make_move((4, 'X'))
+        self.assertRaises(ValueError, self.board.make_move, (4, 'O'))
+
+    def testUnmakeDrop(self):
+        """Test taking back a dropped piece."""
+        self.board.make_move((4, 'O'))
+        self.board.unmake_move((4, 'O'))
+        self.assertEqual((self.contents, self.zobrist), (self.board.contents, self.board.zobrist))
+
+    def testUnmakeFull(self):
+        """Test taking back a piece that filled a column."""
+        self.board.make_move((4, 'O'))
+        self.board.make_move((4, 'X'))
+        self.board.unmake_move((4, 'X'))
+        self.board.unmake_move((4, 'O'))
+        self.assertEqual((self.contents, self.zobrist), (self.board.contents, self.board.zobrist))
+
+    def testUnmakePop(self):
+        """Test taking back a popped piece."""
+        self.board.make_move((-4, 'X'))
+        self.board.unmake_move((-4, 'X'))
+        self.assertEqual((self.contents, self.zobrist, 0), (self.board.contents, self.board.zobrist, self.board.pops))
+
+    def testUnmakeWrong(self):
+        """Test taking back a piece that is not on top."""
+        self.assertRaises(ValueError, self.board.unmake_move, (3, 'O'))
+
+
+class BotSearchTest(unittest.TestCase):
+    """Tests of the Connect Four bots' searching. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.board = connect_four.C4Board(pieces = ['X', 'O'])
+        self.bot = connect_four.C4BotGamma(depth = 4)
+        players = [self.bot, unitility.ProtoObject()]
+        self.bot.game = unitility.ProtoObject(board = self.board, players = players, symbols = ['X', 'O'])
+        self.bot.game.columns, self.bot.game.rows = 7, 6
+        self.bot.symbol = 'X'
+        self.bot.set_up()
+
+    def testBlock(self):
+        """Test blocking the other player's win."""
+        for column in (7, 1, 7, 2, 6, 3):
+            self.board.make_move((column, self.board.get_moves()[0][1]))
+        self.assertEqual((4, 'X'), self.bot.search(self.board.copy()))
+
+    def testTimeLimit(self):
+        """Test getting a move when the time limit is used up."""
+        self.bot.time_limit = 0.000001
+        self.assertIn(self.bot.search(self.board.copy()), self.board.get_moves())
+
+    def testWin(self):
+        """Test taking a win."""
+        for column in (1, 1, 2, 2, 3, 3):
+            self.board.make_move((column, self.board.get_moves()[0][1]))
+        self.assertEqual((4, 'X'), self.bot.search(self.board.copy()))
+
 
 #C4BotTest = unitility.bot_test(connect_four.ConnectFour, C4Bots, 1, [2], bot_params = [(), (), (8,)])
 
 
+class TimeLimitTest(unittest.TestCase):
+    """Tests of the bots' time limits. (unittest.TestCase)"""
+
+    def setGame(self, options):
+        """
+        Set up a game to check the time limit in. (None)
+
+        Parameters:
+        options: The options for the game. (str)
+        """
+        self.game = connect_four.ConnectFour(unitility.AutoBot(['X']), options)
+        self.game.headless = False
+
+    def testDefault(self):
+        """Test the default time limit for a bot level."""
+        self.setGame('bot-level=hard')
+        self.game.set_up()
+        self.assertEqual(5, self.game.bot.time_limit)
+
+    def testHeadless(self):
+        """Test turning off the time limit in a headless game."""
+        self.setGame('bot-level=hard')
+        self.game.headless = True
+        self.game.set_up()
+        self.assertEqual(0, self.game.bot.time_limit)
+
+    def testOption(self):
+        """Test setting the time limit with an option."""
+        self.setGame('time-limit=0.5')
+        self.game.set_up()
+        self.assertEqual(0.5, self.game.bot.time_limit)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -7,14 +7,23 @@ Classes:
 DieTest: Tests of a single die. (unittest.TestCase)
 DominoPoolRollTest: Test rolling a sampling pool of dice. (unittest.TestCase)
 DominoPoolTest: Test of a sampling pool of dice. (unittest.TestCase)
+OutcomesTest: Tests of iterating over distinct rolls. (unittest.TestCase)
+PoolBulkRollTest: Tests of bulk rolls with and without NumPy. (unittest.TestCase)
 PoolTest: Test of a pool of dice. (unittest.TestCase)
+ScoreOutcomesTest: Tests of score distributions for dice. (unittest.TestCase)
 ShuffleDieTest: Tests of a sampling die. (unittest.TestCase)
+ValuePoolTest: Tests of a pool of dice as plain values. (unittest.TestCase)
 """
 
 
 from __future__ import division
 
+import collections
+import copy
+import itertools
 import operator
+import pickle
+import random
 import unittest
 
 from t_games import dice
@@ -68,6 +77,11 @@ class DieTest(unittest.TestCase):
         """Test that the copy of a die has the same value."""
         self.assertEqual(self.die.value, self.die.copy().value)
 
+    def testDeepCopy(self):
+        """Test deep copying a die."""
+        clone = copy.deepcopy(self.die)
+        self.assertEqual((self.die.sides, self.die.value), (clone.sides, clone.value))
+
     def testDivMod(self):
         """Test divmoding a die."""
         self.assertEqual((self.die.value // 3, self.die.value % 3), divmod(self.die, 3))
@@ -178,6 +192,11 @@ class DieTest(unittest.TestCase):
         """Test the negation of a die."""
         self.assertEqual(self.die.value * -1, -self.die)
 
+    def testPickle(self):
+        """Test pickling a die."""
+        clone = pickle.loads(pickle.dumps(self.die))
+        self.assertEqual((self.die.sides, self.die.value), (clone.sides, clone.value))
+
     def testPositiveNegative(self):
         """Test the positive of a negative die."""
         die = dice.Die([-1, -2, -3])
@@ -302,6 +321,11 @@ class DieTest(unittest.TestCase):
         self.die.held = True
         self.assertRaises(ValueError, self.die.roll)
 
+    def testRollRNG(self):
+        """Test rolling with a seeded random number generator."""
+        rolls = [dice.Die(rng = random.Random(801)).roll() for die_index in range(5)]
+        self.assertEqual(1, len(set(rolls)))
+
     def testRound(self):
         """Test rounding a die."""
         die = dice.Die([1.1, 1.2, 1.3])
@@ -395,6 +419,16 @@ class DominoPoolTest(unittest.TestCase):
     def setUp(self):
         self.pool = dice.DominoPool()
 
+    def testDeepCopy(self):
+        """Test deep copying a domino pool."""
+        clone = copy.deepcopy(self.pool)
+        self.assertEqual((self.pool.population, self.pool.values), (clone.population, clone.values))
+
+    def testPickle(self):
+        """Test pickling a domino pool."""
+        clone = pickle.loads(pickle.dumps(self.pool))
+        self.assertEqual((self.pool.population, self.pool.values), (clone.population, clone.values))
+
     def testReplaceNo(self):
         """Test replacing with a valid value."""
         self.assertEqual(5, self.pool.replace(5))
@@ -418,6 +452,88 @@ class DominoPoolTest(unittest.TestCase):
         self.assertEqual(check, str(pool))
 
 
+class OutcomesTest(unittest.TestCase):
+    """Tests of iterating over distinct rolls. (unittest.TestCase)"""
+
+    def testOutcomesDistinct(self):
+        """Test the number of distinct rolls."""
+        self.assertEqual(252, len(list(dice.outcomes(5))))
+
+    def testOutcomesNone(self):
+        """Test the outcomes of rolling no dice."""
+        self.assertEqual([((), 1)], list(dice.outcomes(0)))
+
+    def testOutcomesRepeats(self):
+        """Test that the weights add up with repeated sides."""
+        sides = [1, 2, 2, 3, 3, 3]
+        self.assertEqual(len(sides) ** 3, sum([weight for roll, weight in dice.outcomes(3, sides)]))
+
+    def testOutcomesRepeatsWeights(self):
+        """Test that the weights match every ordered roll with repeated sides."""
+        check = collections.Counter(tuple(sorted(roll)) for roll in itertools.product([1, 1, 2], repeat = 3))
+        self.assertEqual(check, dict(dice.outcomes(3, [1, 1, 2])))
+
+    def testOutcomesSides(self):
+        """Test outcomes with a list of sides."""
+        check = [(('H', 'H'), 1), (('H', 'T'), 2), (('T', 'T'), 1)]
+        self.assertEqual(check, list(dice.outcomes(2, ['H', 'T'])))
+
+    def testOutcomesWeights(self):
+        """Test that the weights match every ordered roll."""
+        check = collections.Counter(tuple(sorted(roll)) for roll in itertools.product(range(1, 5), repeat = 3))
+        self.assertEqual(check, dict(dice.outcomes(3, 4)))
+
+
+class PoolBulkRollTest(unittest.TestCase):
+    """Tests of bulk rolls with and without NumPy. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.pool = dice.Pool([4, 6, 6, [2, 3, 5, 7]])
+        self.pool.dice[2].held = True
+        self.numpy_hold = dice.numpy
+
+    def tearDown(self):
+        dice.numpy = self.numpy_hold
+
+    def checkRolls(self, rolls):
+        """
+        Check the shape and values of bulk rolls. (None)
+
+        Parameters:
+        rolls: The bulk rolls to check. (array or list)
+        """
+        self.assertEqual([4] * 50, [len(roll) for roll in rolls])
+        for roll in rolls:
+            for value, die in zip(roll, self.pool.dice):
+                self.assertIn(value, die.sides)
+            self.assertEqual(self.pool.values[2], roll[2])
+
+    @unittest.skipIf(dice.numpy is None, 'NumPy is not installed.')
+    def testMatch(self):
+        """Test that bulk rolls have the same values with or without NumPy."""
+        numpy_rolls = self.pool.bulk_roll(500, random.Random(801))
+        dice.numpy = None
+        rolls = self.pool.bulk_roll(500, random.Random(801))
+        numpy_values = [sorted(set(column)) for column in zip(*numpy_rolls)]
+        self.assertEqual([sorted(set(column)) for column in zip(*rolls)], numpy_values)
+
+    @unittest.skipIf(dice.numpy is None, 'NumPy is not installed.')
+    def testNumPy(self):
+        """Test the shape and values of bulk rolls with NumPy."""
+        rolls = self.pool.bulk_roll(50)
+        self.assertIsInstance(rolls, self.numpy_hold.ndarray)
+        self.assertEqual(('i', (50, 4)), (rolls.dtype.kind, rolls.shape))
+        self.checkRolls(rolls)
+
+    def testPython(self):
+        """Test the shape and values of bulk rolls without NumPy."""
+        dice.numpy = None
+        rolls = self.pool.bulk_roll(50)
+        self.assertIsInstance(rolls, list)
+        self.assertTrue(all(isinstance(roll, list) for roll in rolls))
+        self.checkRolls(rolls)
+
+
 class PoolTest(unittest.TestCase):
     """Test of a pool of dice. (unittest.TestCase)"""
 
@@ -438,6 +554,34 @@ class PoolTest(unittest.TestCase):
         self.pool.append(other)
         self.assertEqual(7, self.pool.values[-1])
 
+    def testBulkRollCount(self):
+        """Test the number of rolls from rolling a pool in bulk."""
+        self.assertEqual(10, len(self.pool.bulk_roll(10)))
+
+    def testBulkRollHeld(self):
+        """Test that held dice keep their values when rolling in bulk."""
+        self.pool.dice[1].held = True
+        check = self.pool.values[1]
+        self.assertEqual([check] * 10, [int(roll[1]) for roll in self.pool.bulk_roll(10)])
+
+    def testBulkRollSides(self):
+        """Test rolling dice with different sides in bulk."""
+        self.pool = dice.Pool([4, 6, [2, 3, 5, 7]])
+        for roll in self.pool.bulk_roll(20):
+            self.assertIn(roll[0], (1, 2, 3, 4))
+            self.assertIn(roll[2], (2, 3, 5, 7))
+
+    def testBulkRollSeed(self):
+        """Test that rolling in bulk follows the random number generator."""
+        rolls = [list(roll) for roll in self.pool.bulk_roll(5, random.Random(801))]
+        self.assertEqual(rolls, [list(roll) for roll in self.pool.bulk_roll(5, random.Random(801))])
+
+    def testBulkRollUnchanged(self):
+        """Test that rolling in bulk does not change the pool."""
+        check = self.pool.values[:]
+        self.pool.bulk_roll(10)
+        self.assertEqual(check, self.pool.values)
+
     def testContains(self):
         """Test an item being in the list."""
         check = self.pool[1].value
@@ -510,6 +654,10 @@ class PoolTest(unittest.TestCase):
         self.pool.values = [1, 2, 2, 1, 6]
         self.assertEqual([0, 2, 2, 0, 0, 0, 1], self.pool.counts())
 
+    def testDeepCopy(self):
+        """Test deep copying a pool."""
+        self.assertEqual(self.pool.values, copy.deepcopy(self.pool).values)
+
     def testDeleteDie(self):
         """Test deleting a die from the pool."""
         del self.pool[3]
@@ -607,6 +755,16 @@ class PoolTest(unittest.TestCase):
         """Test the length of a pool."""
         self.assertEqual(5, len(self.pool))
 
+    def testPickle(self):
+        """Test pickling a pool."""
+        self.assertEqual(self.pool.values, pickle.loads(pickle.dumps(self.pool)).values)
+
+    def testPickleRNG(self):
+        """Test pickling a pool with its own random number generator."""
+        self.pool = dice.Pool([6] * 5, rng = random.Random(801))
+        clone = pickle.loads(pickle.dumps(self.pool))
+        self.assertEqual(self.pool.roll(), clone.roll())
+
     def testPopIndexValue(self):
         """Test the return value of popping a pool with an index."""
         check = self.pool[2]
@@ -706,6 +864,14 @@ class PoolTest(unittest.TestCase):
         self.pool.roll()
         self.assertEqual(held_values, sorted([die for die in self.pool if die.held]))
 
+    def testRollRNG(self):
+        """Test rolling a pool with a seeded random number generator."""
+        pool = dice.Pool([6] * 5, rng = random.Random(801))
+        other = dice.Pool([6] * 5, rng = random.Random(801))
+        pool.roll()
+        other.roll()
+        self.assertEqual(pool.values, other.values)
+
     def testRollIndex(self):
         """Test that rolling by index does not affect the other values."""
         held_values = self.pool.values[:]
@@ -803,12 +969,49 @@ class PoolTest(unittest.TestCase):
         self.assertEqual('{} and {}'.format(*pool.values), str(pool))
 
 
+class ScoreOutcomesTest(unittest.TestCase):
+    """Tests of score distributions for dice. (unittest.TestCase)"""
+
+    def testScoreCached(self):
+        """Test that score distributions are cached."""
+        self.assertIs(dice.score_outcomes(3, sum), dice.score_outcomes(3, sum))
+
+    def testScoreKey(self):
+        """Test caching a score distribution by key."""
+        distribution = dice.score_outcomes(2, max, key = 'test-max')
+        self.assertIs(distribution, dice.score_outcomes(2, min, key = 'test-max'))
+
+    def testScoreTotal(self):
+        """Test that a score distribution covers every ordered roll."""
+        self.assertEqual(6 ** 4, sum(dice.score_outcomes(4, sum).values()))
+
+    def testScoreTwo(self):
+        """Test the distribution of the sum of two dice."""
+        self.assertEqual(6, dice.score_outcomes(2, sum)[7])
+
+
 class ShuffleDieTest(unittest.TestCase):
     """Tests of a sampling die. (unittest.TestCase)"""
 
     def setUp(self):
         self.die = dice.ShuffleDie()
 
+    def testDeepCopy(self):
+        """Test deep copying a sampling die."""
+        clone = copy.deepcopy(self.die)
+        self.assertEqual((self.die.population, self.die.value), (clone.population, clone.value))
+
+    def testPickle(self):
+        """Test pickling a sampling die."""
+        clone = pickle.loads(pickle.dumps(self.die))
+        self.assertEqual((self.die.population, self.die.value), (clone.population, clone.value))
+
+    def testRNG(self):
+        """Test shuffling with a seeded random number generator."""
+        self.die = dice.ShuffleDie(rng = random.Random(801))
+        other = dice.ShuffleDie(rng = random.Random(801))
+        self.assertEqual(other.population, self.die.population)
+
     def testReset(self):
         """Test reeetting a shuffle die."""
         self.die.reset()
@@ -854,5 +1057,90 @@ class ShuffleDieTest(unittest.TestCase):
         self.assertEqual('<ShuffleDie {}>'.format(self.die.value), repr(self.die))
 
 
+class ValuePoolTest(unittest.TestCase):
+    """Tests of a pool of dice as plain values. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.pool = dice.Pool([6] * 5, rng = random.Random(801))
+        self.pool.values = [1, 3, 3, 5, 6]
+        for die, value in zip(self.pool.dice, self.pool.values):
+            die.value = value
+        self.pool.dice[2].held = True
+        self.values = self.pool.value_pool()
+
+    def testCopy(self):
+        """Test that copies of a value pool are independent."""
+        other = self.values.copy()
+        other.values[0] = 6
+        self.assertEqual([1, 3, 3, 5, 6], self.values.values)
+
+    def testCopyEqual(self):
+        """Test that a copy of a value pool is equal to it."""
+        self.assertEqual(self.values, self.values.copy())
+
+    def testCopyRNG(self):
+        """Test that a copy of a value pool keeps the random number generator."""
+        self.assertIs(self.values.rng, self.values.copy().rng)
+
+    def testCounts(self):
+        """Test counting the values in a value pool."""
+        self.assertEqual([0, 1, 0, 2, 0, 1, 1], self.values.counts())
+
+    def testHeld(self):
+        """Test the held dice in a value pool."""
+        self.assertEqual(0b100, self.values.held)
+
+    def testHold(self):
+        """Test holding values in a value pool."""
+        self.values.hold([3, 6])
+        self.assertEqual([3, 3, 6], self.values.get_held())
+
+    def testHoldMissing(self):
+        """Test holding a value that is not free in a value pool."""
+        self.values.hold(3)
+        self.assertRaises(ValueError, self.values.hold, 3)
+
+    def testNotEqual(self):
+        """Test inequality of value pools with different values."""
+        other = self.values.copy()
+        other.values[0] = 6
+        self.assertTrue(self.values != other)
+
+    def testNotEqualSame(self):
+        """Test inequality of value pools with the same values."""
+        self.assertFalse(self.values != self.values.copy())
+
+    def testRNG(self):
+        """Test that a value pool gets the random number generator of its pool."""
+        self.assertIs(self.pool.dice[0].rng, self.values.rng)
+
+    def testRelease(self):
+        """Test releasing the dice in a value pool."""
+        self.values.release()
+        self.assertEqual([1, 3, 3, 5, 6], self.values.get_free())
+
+    def testRollHeld(self):
+        """Test that held values are not rolled."""
+        for roll in range(20):
+            self.values.roll(random)
+            self.assertEqual(3, self.values.values[2])
+
+    def testRollRNG(self):
+        """Test that a value pool rolls with its random number generator."""
+        self.values.rng = random.Random(801)
+        rolls = [self.values.roll()[:] for roll in range(5)]
+        self.values.rng = random.Random(801)
+        self.assertEqual(rolls, [self.values.roll()[:] for roll in range(5)])
+
+    def testRollSides(self):
+        """Test that rolled values come from the sides of the dice."""
+        for roll in range(20):
+            self.assertTrue(set(self.values.roll(random)) <= set(range(1, 7)))
+
+    def testValues(self):
+        """Test the values of a value pool."""
+        self.assertEqual(self.pool.values, self.values.values)
+
+
 if __name__ == '__main__':
     unittest.main()
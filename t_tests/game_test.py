@@ -7,10 +7,13 @@ Classes:
 GameCommandTest: Test of game do_foo methods. (unittest.TestCase)
 GameGipfCheckTest: Test of validating a gipf move. (unittest.TestCase)
 GameInitTest: Test of game initialization. (unittest.TestCase)
+GameParallelTournamentTest: Tests of multi-process tournaments. (TestCase)
 GamePlayTest: Tests of playing the game. (unittest.TestCase)
 GameRPNTest: Test of the RPN calculator in game.Game. (unittest.TestCase)
+GameSeedTest: Tests of seeding and recording games. (unittest.TestCase)
 GameSkipTest: Tests of the skipping around the turn order. (unittest.TestCase)
 GameSortedScoresTest: Tests of providing players sorted by score. (TestCase)
+GameStubTest: Tests of lazy loading game classes. (unittest.TestCase)
 GameTextTest: Tests of the base game class text versions. (unittest.TestCase)
 GameTournamentTest: Tests of tournaments. (unittest.TestCase)
 GameWinsByScoreTest: Tests of the win_by_scores method. (unittest.TestCase)
@@ -243,6 +246,10 @@ class GameInitTest(unittest.TestCase):
         check = '\nWelcome to a game of Null, Bumblebee.\n'
         self.assertEqual(check, self.bot.info[0])
 
+    def testHeadless(self):
+        """Test setting the headless flag from the human."""
+        self.assertTrue(game.Game(player.Headless(), '').headless)
+
     def testHelp(self):
         """Test updating help dictionairy."""
         check = '\nUse the rules command for instructions on how to play.'
@@ -260,6 +267,10 @@ class GameInitTest(unittest.TestCase):
         """Test setting raw_options."""
         self.assertEqual('', self.game.raw_options)
 
+    def testSeed(self):
+        """Test setting up the game with a given seed."""
+        self.assertEqual(801, game.Game(self.bot, '', seed = 801).set_up_seed)
+
 
 class GamePlayTest(unittest.TestCase):
     """Tests of playing the game. (unittest.TestCase)"""
@@ -278,6 +289,27 @@ class GamePlayTest(unittest.TestCase):
         self.game.play()
         self.assertTrue(self.game.all_done)
 
+    def testProfileUnwatchError(self):
+        """Test not leaving timed methods on the players when the game fails."""
+        self.bot.replies = []
+        self.game.profiling = True
+        self.assertRaises(IndexError, self.game.play)
+        self.assertNotIn('ask', self.bot.__dict__)
+
+    def testReplayFlags(self):
+        """Test that the game flags are reset when playing again."""
+        self.game.flags |= 4
+        self.game.play()
+        self.bot.replies = ['win']
+        self.game.play()
+        self.assertFalse(self.game.flags & 4)
+
+    def testReplayTurns(self):
+        """Test that the turns are reset when playing again."""
+        self.game.play()
+        self.bot.replies = ['win']
+        self.assertEqual(1, self.game.play()[4])
+
     def testForceLoss(self):
         """Test forcing the end of the game with a loss."""
         self.bot.replies = ['quit']
@@ -309,6 +341,31 @@ class GamePlayTest(unittest.TestCase):
         self.game.play()
         self.assertEqual(1, self.game.player_index)
 
+    def testProfileAsk(self):
+        """Test profiling the bot's questions."""
+        self.bot.replies = ['continue', 'win']
+        self.game.profiling = True
+        self.game.play()
+        self.assertEqual(2, self.game.profile.timings[('ask', self.bot.name)][0])
+
+    def testProfileGameOver(self):
+        """Test profiling the end of game checks."""
+        self.bot.replies = ['next', 'next', 'win']
+        self.game.profiling = True
+        self.game.play()
+        self.assertEqual(3, self.game.profile.timings[('game', 'game_over')][0])
+
+    def testProfileOff(self):
+        """Test not profiling by default."""
+        self.game.play()
+        self.assertIsNone(self.game.profile)
+
+    def testProfileUnwatch(self):
+        """Test not leaving timed methods on the players."""
+        self.game.profiling = True
+        self.game.play()
+        self.assertNotIn('ask', self.bot.__dict__)
+
     def testScores(self):
         """Test that the scores are set up."""
         self.game.play()
@@ -429,6 +486,60 @@ def rpn_tests():
 GameRPNTest = rpn_tests()
 
 
+class GameSeedTest(unittest.TestCase):
+    """Tests of seeding and recording games. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.bot = unitility.AutoBot(['2'] * 50)
+        self.game = game.Flip(self.bot, 'none', seed = 801)
+
+    def testLastSeed(self):
+        """Test recording the seed used for a game."""
+        self.game.play()
+        self.assertEqual(801, self.game.last_seed)
+
+    def testNewSeed(self):
+        """Test getting a new seed for each game."""
+        self.game.seed = None
+        self.game.play()
+        first_seed = self.game.last_seed
+        self.bot.replies = ['2'] * 50
+        self.game.play()
+        self.assertNotEqual(first_seed, self.game.last_seed)
+
+    def testRecording(self):
+        """Test recording the human's inputs."""
+        self.game.recording = True
+        self.game.play()
+        self.assertEqual(['2'] * (50 - len(self.bot.replies)), self.game.input_log.inputs)
+
+    def testRecordingResults(self):
+        """Test recording the results of the game."""
+        self.game.recording = True
+        results = self.game.play()
+        self.assertEqual(results[:6], self.game.input_log.results)
+
+    def testRecordingUnwatch(self):
+        """Test removing the recorded ask method after the game."""
+        self.game.recording = True
+        self.game.play()
+        self.assertNotIn('ask', self.bot.__dict__)
+
+    def testRecordingUnwatchError(self):
+        """Test removing the recorded ask method when the game fails."""
+        self.bot.replies = []
+        self.game.recording = True
+        self.assertRaises(IndexError, self.game.play)
+        self.assertNotIn('ask', self.bot.__dict__)
+
+    def testSameSeed(self):
+        """Test playing the same game with the same seed."""
+        results = self.game.play()
+        self.bot.replies = ['2'] * 50
+        other = game.Flip(self.bot, 'none', seed = 801)
+        self.assertEqual(results, other.play())
+
+
 class GameSkipTest(unittest.TestCase):
     """Tests of the skipping a player in the turn order. (unittest.TestCase)"""
 
@@ -526,6 +637,30 @@ class GameSortedScoresTest(unittest.TestCase):
         self.assertEqual(check, self.game.sorted_scores())
 
 
+class GameStubTest(unittest.TestCase):
+    """Tests of lazy loading game classes. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.stub = game.GameStub('t_games.game', 'Flip', 'Flip', [], ['Test Games'], 1)
+
+    def testAttribute(self):
+        """Test getting an attribute from the real game class."""
+        self.assertEqual(game.Flip.rules, self.stub.rules)
+
+    def testCall(self):
+        """Test creating a game from a stub."""
+        self.assertIsInstance(self.stub(unitility.AutoBot(), 'none'), game.Flip)
+
+    def testLoad(self):
+        """Test loading the real game class."""
+        self.assertIs(game.Flip, self.stub.load())
+
+    def testNoLoad(self):
+        """Test not loading the game class for menu attributes."""
+        self.stub.name, self.stub.aka, self.stub.categories, self.stub.num_options
+        self.assertIsNone(self.stub.game_class)
+
+
 class GameTextTest(unittest.TestCase):
     """Tests of the base game class text representations. (unittest.TestCase)"""
 
@@ -567,10 +702,18 @@ class GameTournamentTest(unittest.TestCase):
         # Run a tournament with the bots.
         self.results = self.game.tournament(self.bots, 5)
 
+    def testHeadlessReset(self):
+        """Test resetting the headless flag after a tournament."""
+        self.assertFalse(self.game.headless)
+
     def testHumanReset(self):
         """Test resetting the human after a tournament."""
         self.assertEqual(self.human, self.game.human)
 
+    def testNoProfile(self):
+        """Test not including a profile when not profiling."""
+        self.assertNotIn('profile', self.results)
+
     def testPlaceTracking(self):
         """Test rank tracking in a tournament."""
         check = {name: [4 - index] * 5 for index, name in enumerate(self.bot_names)}
@@ -586,6 +729,75 @@ class GameTournamentTest(unittest.TestCase):
         self.assertEqual(check, self.results['scores'])
 
 
+class GameParallelTournamentTest(unittest.TestCase):
+    """Tests of multi-process tournaments. (unittest.TestCase)"""
+
+    class RollGame(game.Game):
+        """A game that scores players randomly. (game.Game)"""
+        name = 'Roll'
+        def play(self):
+            """Score players randomly. (None)"""
+            self.scores = {player: random.randint(1, 6) for player in self.players}
+
+    def setUp(self):
+        # Set up the games.
+        self.human = unitility.AutoBot()
+        self.alphabet = GameTournamentTest.AlphabetGame(self.human, '')
+        self.roll = self.RollGame(self.human, '')
+        # Set up the bots with alphabetical names.
+        self.bots = []
+        self.bot_names = ['Andy', "Bob", 'Charlie', 'David']
+        for bot_name in self.bot_names:
+            self.bots.append(unitility.AutoBot())
+            self.bots[-1].name = bot_name
+
+    def testMerge(self):
+        """Test merging parallel results into the serial format."""
+        results = self.alphabet.parallel_tournament(self.bots, 5, processes = 2, seed = 1)
+        self.assertEqual(self.alphabet.tournament(self.bots, 5), results)
+
+    def testPlayerKeys(self):
+        """Test the parallel results are keyed to the original players."""
+        results = self.alphabet.parallel_tournament(self.bots, 3, processes = 2, seed = 1)
+        self.assertEqual(set(id(bot) for bot in self.bots), set(id(bot) for bot in results['scores']))
+
+    def testProfile(self):
+        """Test adding up profiles from a parallel tournament."""
+        test_game = unitility.TestGame(self.human, '')
+        test_game.profiling = True
+        bots = [unitility.AutoBot(['win'] * 5)]
+        bots.append(unitility.AutoBot(['win'] * 5, taken_names = [bots[0].name]))
+        results = test_game.parallel_tournament(bots, 5, processes = 2, seed = 1)
+        self.assertEqual(5, results['profile'].games)
+
+    def testRounds(self):
+        """Test the right number of rounds played in a parallel tournament."""
+        results = self.roll.parallel_tournament(self.bots, 7, processes = 3, seed = 1)
+        self.assertEqual(7, len(results['places']['Charlie']))
+
+    def testSameNames(self):
+        """Test a parallel tournament with players that have the same name."""
+        self.bots[1].name = self.bots[0].name
+        results = self.roll.parallel_tournament(self.bots, 6, processes = 2, seed = 1)
+        self.assertEqual(6, len(results['scores'][self.bots[0]]))
+
+    def testSameNamesMerge(self):
+        """Test merging parallel results with same named players."""
+        self.bots[1].name = self.bots[0].name
+        results = self.alphabet.parallel_tournament(self.bots, 5, processes = 2, seed = 1)
+        self.assertEqual(self.alphabet.tournament(self.bots, 5), results)
+
+    def testSeeded(self):
+        """Test repeating a parallel tournament with the same seed."""
+        results = self.roll.parallel_tournament(self.bots, 10, processes = 2, seed = 801)
+        self.assertEqual(results, self.roll.parallel_tournament(self.bots, 10, processes = 2, seed = 801))
+
+    def testSingleProcess(self):
+        """Test a parallel tournament run in one process."""
+        results = self.roll.parallel_tournament(self.bots, 4, processes = 1, seed = 1)
+        self.assertEqual(4, len(results['scores']['Andy']))
+
+
 class GameWinsByScoreTest(unittest.TestCase):
     """Tests of the win_by_scores method. (unittest.TestCase)"""
 
@@ -609,6 +821,15 @@ class GameWinsByScoreTest(unittest.TestCase):
         best_score, winner, human_rank = self.game.wins_by_score()
         self.assertEqual(81, best_score)
 
+    def testHeadless(self):
+        """Test scoring a headless game without output."""
+        self.game.headless = True
+        self.game.human.info = []
+        self.game.scores[self.game.human.name] = 81
+        best_score, winner, human_rank = self.game.wins_by_score()
+        self.assertEqual([self.game.human], winner)
+        self.assertEqual([], self.game.human.info)
+
     def testHumanLoss(self):
         """Test correctly identifying a human loser."""
         self.game.scores[self.game.human.name] = 18
@@ -760,13 +981,13 @@ class GameXyzzyHelpTest(unittest.TestCase):
     """Tests of Game.help_xyzzy. (unittest.TestCase)"""
 
     def setUp(self):
+        # Set up the game.
+        self.bot = unitility.AutoBot([''])
+        self.game = game.Game(self.bot, '')
         # Set up a random module you can manipulate.
         self.random_hold = game.random
         self.mock_random = unitility.MockRandom()
         game.random = self.mock_random
-        # Set up the game.
-        self.bot = unitility.AutoBot([''])
-        self.game = game.Game(self.bot, '')
 
     def tearDown(self):
         game.random = self.random_hold
@@ -792,5 +1013,54 @@ class GameXyzzyHelpTest(unittest.TestCase):
         self.assertEqual(1, len(self.bot.info))
 
 
+class LoadGamesTest(unittest.TestCase):
+    """Tests of the load_games function. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.registry_hold = game.REGISTRY_FILE
+        game.REGISTRY_FILE = os.path.join(game.utility.LOC, 't_tests', 'test_registry.txt')
+        self.game_files = game.find_game_files()
+
+    def tearDown(self):
+        if os.path.exists(game.REGISTRY_FILE):
+            os.remove(game.REGISTRY_FILE)
+        game.REGISTRY_FILE = self.registry_hold
+
+    def testCategories(self):
+        """Test loading games into categories."""
+        games, categories = game.load_games()
+        dice_games = categories['sub-categories']['Dice Games']['games']
+        self.assertIn(games['pig'], dice_games)
+
+    def testLoadedGames(self):
+        """Test including games that are not in the registry."""
+        games, categories = game.load_games()
+        self.assertIs(unitility.TestGame, games['unit'])
+
+    def testMissing(self):
+        """Test reading a missing registry."""
+        self.assertIsNone(game.read_registry(self.game_files))
+
+    def testNewFile(self):
+        """Test reading a registry after a game file has been added."""
+        game.build_registry(self.game_files[:-1])
+        self.assertIsNone(game.read_registry(self.game_files))
+
+    def testRead(self):
+        """Test reading the registry back."""
+        records = game.build_registry(self.game_files)
+        self.assertEqual(records, game.read_registry(self.game_files))
+
+    def testStubs(self):
+        """Test loading registered games as stubs."""
+        games, categories = game.load_games()
+        self.assertIsInstance(games['pig'], game.GameStub)
+
+    def testStubAliases(self):
+        """Test aliases sharing the same stub."""
+        games, categories = game.load_games()
+        self.assertIs(games['liars dice'], games['lidi'])
+
+
 if __name__ == '__main__':
     unittest.main()
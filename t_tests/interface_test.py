@@ -11,6 +11,7 @@ InterfaceMenuTest: Tests of the Interface's menu system. (unittest.TestCase)
 InterfacePlayGameTest: Tests playing a game through the interface. (TestCase)
 InterfaceShwoMenuTest: Tests of setting up the interface menu. (TestCase)
 InterfaceTextTest: Tests of the Interface's text handling. (unittest.TestCase)
+StatisticsAddResultTest: Tests of adding results to statistics. (TestCase)
 StatisticsBinResultsTest: Tests of Statistics.bin_results. (TestCase)
 StatisticsBinResultsMatchTest: Tests of bin_results with match play. (TestCase)
 StatisticsDunderTest: Tests of other dunder methods for Statistics. (TestCase)
@@ -254,6 +255,35 @@ class InterfaceGameTest(unittest.TestCase):
         self.interface.focus = self.interface.categories['sub-categories']['Dice Games']
         self.assertEqual(check, sorted([game.name for game in self.interface.category_games()]))
 
+    def testFindResultsGames(self):
+        """Test find_results for specific games."""
+        self.bot.results = [result[:] for result in TEST_RESULTS]
+        check = [result for result in TEST_RESULTS if result[0] in ('Null', 'Unit')]
+        self.assertEqual(check, self.interface.find_results(['Null', 'Unit']))
+
+    def testFindResultsStart(self):
+        """Test find_results skipping earlier results."""
+        self.bot.results = [result[:] for result in TEST_RESULTS]
+        self.assertEqual(TEST_RESULTS[9:], self.interface.find_results(start = 9))
+
+    def testGameStatsCache(self):
+        """Test game_stats updating cached statistics."""
+        self.bot.results = [result[:] for result in TEST_RESULTS]
+        stats = self.interface.game_stats('Flip', 'cheat')
+        self.bot.results.append(['Flip', 1, 0, 0, 6, 6, 0, ''])
+        self.assertIs(stats, self.interface.game_stats('Flip', 'cheat'))
+        self.assertEqual(4, len(stats.results['overall']))
+
+    def testGameStatsNone(self):
+        """Test game_stats for an unplayed game."""
+        self.bot.results = [result[:] for result in TEST_RESULTS]
+        self.assertIsNone(self.interface.game_stats('Pig', ''))
+
+    def testGroupResults(self):
+        """Test grouping results by game."""
+        groups = interface.group_results(TEST_RESULTS)
+        self.assertEqual(TEST_RESULTS[3:6], groups['Sorter'])
+
 
 class InterfaceMenuTest(unittest.TestCase):
     """Tests of the Interface's menu system. (unittest.TestCase)"""
@@ -447,6 +477,31 @@ class InterfaceTextTest(unittest.TestCase):
         self.assertEqual(check, repr(self.interface))
 
 
+class StatisticsAddResultTest(unittest.TestCase):
+    """Tests of adding results to statistics. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.results = [result[:] for result in TEST_RESULTS]
+        self.stats = interface.Statistics(self.results[:6], 'cheat', title = 'Test Statistics')
+        for result in self.results[6:]:
+            self.stats.add_result(result)
+
+    def testFiltered(self):
+        """Test filtering added results."""
+        self.assertNotIn(self.results[-1], self.stats.results['overall'])
+
+    def testMatch(self):
+        """Test added results matching statistics calculated all at once."""
+        check = interface.Statistics(self.results, 'cheat', title = 'Test Statistics')
+        self.assertEqual(str(check), str(self.stats))
+
+    def testTitle(self):
+        """Test setting the title from an added result."""
+        stats = interface.Statistics([])
+        stats.add_result(self.results[0])
+        self.assertEqual('Flip Statistics', stats.title)
+
+
 class StatisticsBinResultsTest(unittest.TestCase):
     """Tests of Statistics.bin_results. (unittest.TestCase)"""
 
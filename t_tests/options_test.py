@@ -8,6 +8,7 @@ AddOptionTest: Tests of adding options to OptionSets. (unittest.TestCase)
 AllRangeTest: Tests of the all inclusive range. (unittest.TestCase)
 OptionTextTest: Tests of text representations of OptionSet. (unittest.TestCase)
 ParseTest: Tests of OptionSet.parse_settings changing settings_text (TestCase)
+PlanTest: Tests of reusing parsed option settings. (unittest.TestCase)
 ReprTest: Test the repr of an OptionSet. (unittest.TestCase)
 TakeActionTest: Tests of OptionSet.take_action. (unittest.TestCase)
 """
@@ -18,6 +19,7 @@ import unittest
 from t_games import game
 from t_games import options
 from t_games import player
+from t_games.dice_games import pig_game
 from t_games.t_tests import unitility
 
 
@@ -240,6 +242,41 @@ class ParseTest(unittest.TestCase):
         self.assertEqual('spam three=3', self.option_set.settings_text)
 
 
+class PlanTest(unittest.TestCase):
+    """Tests of reusing parsed option settings. (unittest.TestCase)"""
+
+    def setUp(self):
+        options.OptionSet.schemas.pop(pig_game.Pig, None)
+        self.game = pig_game.Pig(unitility.AutoBot(), 'sh = 3 bpr=10/20')
+
+    def testCopies(self):
+        """Test that reused settings are not shared between games."""
+        self.game.option_set.settings['bots'][0][1].append(30)
+        pig = pig_game.Pig(unitility.AutoBot(), 'sh = 3 bpr=10/20')
+        self.assertEqual([10, 20], pig.option_set.settings['bots'][0][1])
+
+    def testDifferentOptions(self):
+        """Test not reusing settings for a game with different options."""
+        option_set = options.OptionSet(self.game)
+        option_set.add_option('spam')
+        self.assertIsNone(option_set.compile_schema())
+
+    def testErrors(self):
+        """Test repeating the errors from reused settings."""
+        pig = pig_game.Pig(unitility.AutoBot(['yes']), 'sh=3 spam')
+        pig = pig_game.Pig(unitility.AutoBot(['no']), 'sh=3 spam')
+        self.assertEqual(['Unrecognized option: spam.'], pig.option_set.errors)
+
+    def testReuse(self):
+        """Test getting the same settings from a reused plan."""
+        pig = pig_game.Pig(unitility.AutoBot(), 'sh=3   bpr=10/20')
+        self.assertEqual((3, 'base-pace-race=10/20 shuffle=3'), (pig.shuffle, pig.option_set.settings_text))
+
+    def testStored(self):
+        """Test storing the plan for a settings text."""
+        self.assertIn('sh = 3 bpr=10/20', options.OptionSet.schemas[pig_game.Pig]['plans'])
+
+
 class ReprTest(unittest.TestCase):
     """Test the repr of an OptionSet. (unittest.TestCase)"""
 
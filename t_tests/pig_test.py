@@ -9,6 +9,7 @@ TEST_BOTS: The bot classes for Pig.
 Classes:
 PigBotBaseTest: Test the Pig bots w/ no options. (unittest.TestCase)
 PigBotEvenTest: Test the Pig bots w/ the even-turns option. (unittest.TestCase)
+PigBotPenoptimalTest: Test the approximately optimal Pig bot. (unittest.TestCase)
 """
 
 
@@ -28,5 +29,18 @@ PigBotBaseTest = unitility.bot_test(pig.Pig, TEST_BOTS, 10, [3, 4])
 PigBotEvenTest = unitility.bot_test(pig.Pig, TEST_BOTS, 10, [3, 4], 'even-turns')
 
 
+class PigBotPenoptimalTest(unittest.TestCase):
+    """Test the approximately optimal Pig bot. (unittest.TestCase)"""
+
+    def testData(self):
+        """Test reading the hold values."""
+        data = pig.PigBotPenoptimal().data
+        self.assertEqual((100, 100), (len(data), len(data[0])))
+
+    def testSharedData(self):
+        """Test that the hold values are only read once."""
+        self.assertIs(pig.PigBotPenoptimal().data, pig.PigBotPenoptimal().data)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
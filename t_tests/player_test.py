@@ -4,7 +4,9 @@ player_test.py
 Unittesting of t_games/player.py
 
 Classes:
+AlphaBetaBotTest: Tests of the AlphaBetaBot class. (unittest.TestCase)
 BotTest: Tests of the Bot class. (unittest.TestCase)
+HeadlessTest: Tests of the Headless class. (unittest.TestCase)
 HumanoidAskCardListTest: Tests of Humaoid asking for cards. (unittest.TestCase)
 HumanoidAskCardTest: Tests of Humanoid asking for a card. (unittest.TestCase)
 HumanoidAskIntListTest: Tests of Humaoid asking for integers. (TestCase)
@@ -25,6 +27,56 @@ from t_games import cards
 from t_games.t_tests import unitility
 
 
+class AlphaBetaBotTest(unittest.TestCase):
+    """Tests of the AlphaBetaBot class. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.bot = player.AlphaBetaBot(4, 0)
+        self.bot.store(5, 2, 18, player.EXACT, 'spam')
+
+    def testOrderMovesHistory(self):
+        """Test ordering moves by their history."""
+        self.bot.history = {'eggs': 4, 'sausage': 9}
+        self.assertEqual(['sausage', 'eggs', 'spam', 'bacon'], self.bot.order_moves(['spam', 'eggs', 'bacon', 'sausage'], None, 1))
+
+    def testOrderMovesKillers(self):
+        """Test ordering moves with killer moves."""
+        self.bot.killers = {1: ['bacon', 'lobster']}
+        self.assertEqual(['bacon', 'spam', 'eggs'], self.bot.order_moves(['spam', 'eggs', 'bacon'], None, 1))
+
+    def testOrderMovesTable(self):
+        """Test ordering moves with the transposition table move first."""
+        self.bot.killers = {1: ['bacon']}
+        self.assertEqual(['eggs', 'bacon', 'spam'], self.bot.order_moves(['spam', 'eggs', 'bacon'], 'eggs', 1))
+
+    def testRecordCutoffHistory(self):
+        """Test recording cutoffs in the history."""
+        self.bot.record_cutoff('spam', 2, 1)
+        self.bot.record_cutoff('spam', 3, 2)
+        self.assertEqual({'spam': 13}, self.bot.history)
+
+    def testRecordCutoffKillers(self):
+        """Test keeping the last two killer moves."""
+        for move in ('spam', 'eggs', 'spam', 'bacon'):
+            self.bot.record_cutoff(move, 2, 1)
+        self.assertEqual(['bacon', 'eggs'], self.bot.killers[1])
+
+    def testStoreDeeper(self):
+        """Test a deeper search replacing another position."""
+        self.bot.store(5 + self.bot.table_size, 3, 81, player.LOWER, 'eggs')
+        self.assertEqual((5 + self.bot.table_size, 3, 81, player.LOWER, 'eggs'), self.bot.table[5])
+
+    def testStoreSame(self):
+        """Test a shallower search replacing the same position."""
+        self.bot.store(5, 1, 81, player.UPPER, 'eggs')
+        self.assertEqual((5, 1, 81, player.UPPER, 'eggs'), self.bot.table[5])
+
+    def testStoreShallower(self):
+        """Test a shallower search not replacing another position."""
+        self.bot.store(5 + self.bot.table_size, 1, 81, player.LOWER, 'eggs')
+        self.assertEqual((5, 2, 18, player.EXACT, 'spam'), self.bot.table[5])
+
+
 class BotTest(unittest.TestCase):
     """Tests of the Bot class. (unittest.TestCase)"""
 
@@ -48,6 +100,17 @@ class BotTest(unittest.TestCase):
             self.bot.error('Whoops.')
         self.assertEqual('Whoops.', err.exception.args[0])
 
+    def testGetShared(self):
+        """Test building shared data."""
+        player.Bot.shared_data.pop('test-spam', None)
+        self.assertEqual([8, 1], self.bot.get_shared('test-spam', list, (8, 1)))
+
+    def testGetSharedOnce(self):
+        """Test that shared data is only built once."""
+        player.Bot.shared_data.pop('test-spam', None)
+        data = self.bot.get_shared('test-spam', list, (8, 1))
+        self.assertIs(data, player.Bot().get_shared('test-spam', list, (1, 8)))
+
     def testTellComplex(self):
         """Test complex output for Bot.tell"""
         self.bot.tell('Spam', 'spam', 'and eggs', sep = ', ', end = '!')
@@ -59,12 +122,49 @@ class BotTest(unittest.TestCase):
         check = "{0} has won the game. {0}'s quest is complete.".format(self.bot.name)
         self.assertEqual(check, sys.stdout.output[0])
 
+    def testTellHeadless(self):
+        """Test Bot.tell in a headless game."""
+        self.bot.game = unitility.ProtoObject(headless = True)
+        self.bot.tell('Craig moved west.')
+        self.assertEqual([], sys.stdout.output)
+
     def testTellSimple(self):
         """Test a simple case for Bot.tell."""
         self.bot.tell('Craig moved west.')
         self.assertEqual('Craig moved west.', sys.stdout.output[0])
 
 
+class HeadlessTest(unittest.TestCase):
+    """Tests of the Headless class. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.human = player.Headless()
+        self.stdout_hold = sys.stdout
+        sys.stdout = unitility.ProtoStdOut()
+
+    def tearDown(self):
+        sys.stdout = self.stdout_hold
+
+    def testAsk(self):
+        """Test that a Headless player can't answer questions."""
+        with self.assertRaises(player.BotError):
+            self.human.ask('What is your quest? ')
+
+    def testError(self):
+        """Test that a Headless player ignores errors."""
+        self.human.error('That is not a valid move.')
+        self.assertEqual([], sys.stdout.output)
+
+    def testFlag(self):
+        """Test the headless flag of a Headless player."""
+        self.assertTrue(self.human.headless)
+
+    def testTell(self):
+        """Test that a Headless player ignores information."""
+        self.human.tell('Craig moved west.')
+        self.assertEqual([], sys.stdout.output)
+
+
 class HumanoidAskCardListTest(unittest.TestCase):
     """Tests of Humaoid asking for cards. (unittest.TestCase)"""
 
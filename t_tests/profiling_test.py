@@ -0,0 +1,98 @@
+"""
+profiling_test.py
+
+Unit testing of profiling.py
+
+Classes:
+ProfileTest: Tests of profiling games. (unittest.TestCase)
+ProfileWatchTest: Tests of timing player questions. (unittest.TestCase)
+"""
+
+
+import unittest
+
+from t_games import profiling
+from t_games.t_tests import unitility
+
+
+class ProfileTest(unittest.TestCase):
+    """Tests of profiling games. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.profile = profiling.Profile()
+        self.profile.record('ask', 'Bob', 0.5)
+        self.profile.record('ask', 'Bob', 0.25)
+        self.profile.record('game', 'set_up', 1.0)
+
+    def testData(self):
+        """Test the plain data version of a profile."""
+        check = {'kind': 'ask', 'name': 'Bob', 'calls': 2, 'total': 0.75, 'mean': 0.375, 'max': 0.5}
+        self.assertEqual(check, self.profile.data()[1])
+
+    def testDataOrder(self):
+        """Test sorting the plain data by total time."""
+        self.assertEqual(['set_up', 'Bob'], [row['name'] for row in self.profile.data()])
+
+    def testMerge(self):
+        """Test adding profiles together."""
+        other = profiling.Profile()
+        other.games = 2
+        other.record('ask', 'Bob', 0.75)
+        self.profile.merge(other)
+        self.assertEqual([3, 1.5, 0.75], self.profile.timings[('ask', 'Bob')])
+
+    def testMergeGames(self):
+        """Test adding up the number of games profiled."""
+        other = profiling.Profile()
+        other.games = 2
+        self.profile.merge(other)
+        self.assertEqual(2, self.profile.games)
+
+    def testRecord(self):
+        """Test recording a timing."""
+        self.assertEqual([2, 0.75, 0.5], self.profile.timings[('ask', 'Bob')])
+
+    def testRepr(self):
+        """Test the debugging text representation of a profile."""
+        self.assertEqual('<Profile of 0 games with 2 timings>', repr(self.profile))
+
+    def testStr(self):
+        """Test the human readable text representation of a profile."""
+        lines = str(self.profile).split('\n')
+        self.assertTrue(lines[2].startswith('ask/Bob'))
+
+    def testTime(self):
+        """Test timing a function call."""
+        self.assertEqual(3, self.profile.time('test', 'len', len, 'abc'))
+        self.assertEqual(1, self.profile.timings[('test', 'len')][0])
+
+
+class ProfileWatchTest(unittest.TestCase):
+    """Tests of timing player questions. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.bot = unitility.AutoBot()
+        self.bot.replies = ['spam', 'eggs']
+        self.profile = profiling.Profile()
+        self.profile.watch(self.bot)
+
+    def testAnswer(self):
+        """Test getting the answer to a watched question."""
+        self.assertEqual('spam', self.bot.ask('What? '))
+
+    def testTiming(self):
+        """Test timing a watched question."""
+        self.bot.ask('What? ')
+        self.bot.ask('What? ')
+        self.assertEqual(2, self.profile.timings[('ask', self.bot.name)][0])
+
+    def testUnwatch(self):
+        """Test no longer timing questions."""
+        self.profile.unwatch(self.bot)
+        self.bot.ask('What? ')
+        self.assertNotIn(('ask', self.bot.name), self.profile.timings)
+
+    def testUnwatchMethods(self):
+        """Test removing the timed methods from the player."""
+        self.profile.unwatch(self.bot)
+        self.assertNotIn('ask', self.bot.__dict__)
@@ -0,0 +1,185 @@
+"""
+replay_test.py
+
+Unit testing of replay.py
+
+Classes:
+ConnectFourReplayTest: Tests of replaying a game against a search bot. (TestCase)
+InputLogTest: Tests of recording a game's inputs. (unittest.TestCase)
+PigReplayTest: Tests of replaying a game that uses its random generator. (TestCase)
+ReplayerTest: Tests of repeating logged inputs. (unittest.TestCase)
+ReplayTest: Tests of replaying games. (unittest.TestCase)
+"""
+
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from t_games import game
+from t_games import player
+from t_games import replay
+from t_games.board_games import connect_four_game
+from t_games.dice_games import pig_game
+from t_games.t_tests import unitility
+
+
+class ConnectFourReplayTest(unittest.TestCase):
+    """Tests of replaying a game against a search bot. (TestCase)"""
+
+    def setUp(self):
+        self.stdout_hold = sys.stdout
+        sys.stdout = unitility.ProtoStdOut()
+        self.human = player.Humanoid('Buckaroo')
+        self.human.held_inputs = ['X'] + ['4', '3', '5', '2', '6', '1', '7'] * 6
+        self.game = connect_four_game.ConnectFour(self.human, 'bot-level=easy')
+        self.game.recording = True
+        self.results = self.game.play()
+
+    def tearDown(self):
+        sys.stdout = self.stdout_hold
+
+    def testResults(self):
+        """Test getting the same results from a replay against the default bot."""
+        self.assertEqual(self.results, replay.replay(connect_four_game.ConnectFour, self.game.input_log))
+
+
+class InputLogTest(unittest.TestCase):
+    """Tests of recording a game's inputs. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.log = replay.InputLog('Flip', 'none', 801, 108, 'Bob', ['2', 'quit', 'eggs'])
+        self.log.results = [0, 1, 0, -3, 18, 4]
+
+    def testBytes(self):
+        """Test converting to the binary format and back."""
+        log = replay.parse_log(self.log.to_bytes())
+        self.assertEqual((self.log.game_name, self.log.options, self.log.set_up_seed, self.log.seed,
+            self.log.player_name, self.log.inputs, self.log.results), (log.game_name, log.options,
+            log.set_up_seed, log.seed, log.player_name, log.inputs, log.results))
+
+    def testBytesMarker(self):
+        """Test the marker at the start of the binary format."""
+        self.assertTrue(self.log.to_bytes().startswith(replay.MARKER))
+
+    def testBytesNoResults(self):
+        """Test the binary format for an unfinished game."""
+        self.log.results = []
+        self.assertEqual([], replay.parse_log(self.log.to_bytes()).results)
+
+    def testLen(self):
+        """Test counting the inputs."""
+        self.assertEqual(3, len(self.log))
+
+    def testParseBad(self):
+        """Test parsing data that is not an input log."""
+        self.assertRaises(ValueError, replay.parse_log, b'spam and eggs')
+
+    def testRepr(self):
+        """Test the debugging text representation."""
+        self.assertEqual('<InputLog of Flip with 3 inputs, seed 108>', repr(self.log))
+
+    def testSave(self):
+        """Test writing the log to a file and reading it back."""
+        folder_name = tempfile.mkdtemp()
+        try:
+            file_name = os.path.join(folder_name, 'test.tgil')
+            self.log.save(file_name)
+            self.assertEqual(self.log.inputs, replay.read_log(file_name).inputs)
+        finally:
+            shutil.rmtree(folder_name)
+
+    def testUnwatch(self):
+        """Test no longer logging a player's answers."""
+        bot = unitility.AutoBot(['spam', 'eggs'])
+        self.log.watch(bot)
+        self.log.unwatch(bot)
+        bot.ask('What? ')
+        self.assertEqual(3, len(self.log))
+
+    def testWatch(self):
+        """Test logging a player's answers."""
+        bot = unitility.AutoBot(['spam', 'eggs'])
+        self.log.watch(bot)
+        self.assertEqual('spam', bot.ask('What? '))
+        self.assertEqual('spam', self.log.inputs[-1])
+
+
+class PigReplayTest(unittest.TestCase):
+    """Tests of replaying a game that uses its random generator. (TestCase)"""
+
+    def setUp(self):
+        self.stdout_hold = sys.stdout
+        sys.stdout = unitility.ProtoStdOut()
+        self.bot = unitility.AutoBot(['roll', 'roll', 'stop'] * 200)
+        self.game = pig_game.Pig(self.bot, 'shuffle=2 easy')
+        self.game.recording = True
+        self.results = self.game.play()
+
+    def tearDown(self):
+        sys.stdout = self.stdout_hold
+
+    def testResults(self):
+        """Test getting the same results from a replay with a shuffle die."""
+        self.assertEqual(self.results, replay.replay(pig_game.Pig, self.game.input_log))
+
+
+class ReplayerTest(unittest.TestCase):
+    """Tests of repeating logged inputs. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.log = replay.InputLog('Flip', 'none', 801, 108, 'Bob', ['2', '3'])
+        self.replayer = replay.Replayer(self.log)
+
+    def testAsk(self):
+        """Test repeating the inputs in order."""
+        self.assertEqual(['2', '3'], [self.replayer.ask('?'), self.replayer.ask('?')])
+
+    def testAskInt(self):
+        """Test parsing repeated inputs."""
+        self.replayer.game = unitility.ProtoObject(force_end = '')
+        self.assertEqual(2, self.replayer.ask_int('?'))
+
+    def testHeadless(self):
+        """Test that a replayer is headless."""
+        self.assertTrue(game.Game(self.replayer, 'none').headless)
+
+    def testName(self):
+        """Test using the name of the recorded player."""
+        self.assertEqual('Bob', self.replayer.name)
+
+    def testOutOfInputs(self):
+        """Test asking for more inputs than were logged."""
+        self.replayer.ask('?')
+        self.replayer.ask('?')
+        self.assertRaises(replay.ReplayError, self.replayer.ask, '?')
+
+
+class ReplayTest(unittest.TestCase):
+    """Tests of replaying games. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.bot = unitility.AutoBot(['2'] * 50)
+        self.game = game.Flip(self.bot, 'none')
+        self.game.recording = True
+        self.results = self.game.play()
+
+    def testResults(self):
+        """Test getting the same results from a replay."""
+        self.assertEqual(self.results, replay.replay(game.Flip, self.game.input_log))
+
+    def testResultsAgain(self):
+        """Test getting the same results from repeated replays."""
+        replay.replay(game.Flip, self.game.input_log)
+        self.assertEqual(self.results, replay.replay(game.Flip, self.game.input_log))
+
+    def testResultsBytes(self):
+        """Test getting the same results from a replay of a saved log."""
+        log = replay.parse_log(self.game.input_log.to_bytes())
+        self.assertEqual(self.results, replay.replay(game.Flip, log))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+"""
+storage_test.py
+
+Unit testing of storage.py
+
+Classes:
+ResultsStoreTest: Tests of the base results store. (unittest.TestCase)
+SQLiteStoreTest: Tests of storing results in SQLite. (unittest.TestCase)
+TextStoreTest: Tests of storing results in a text file. (unittest.TestCase)
+"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from t_games import storage
+
+
+TEST_ROWS = [['Pig', 1, 0, 0, 100, 12, 0, ''], ['Flip', 0, 1, 0, 3, 2, 1, 'flips=3'],
+    ['Pig', 0, 1, 0, 87, 15, 2, 'score=75'], ['Sorter', 1, 0, 0, 8, 8, 0, 'a, b, c']]
+
+
+class ResultsStoreTest(unittest.TestCase):
+    """Tests of the base results store. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.store = storage.ResultsStore('')
+
+    def testExtend(self):
+        """Test that adding results is left to subclasses."""
+        self.assertRaises(NotImplementedError, self.store.extend, TEST_ROWS)
+
+    def testLoad(self):
+        """Test that loading results is left to subclasses."""
+        self.assertRaises(NotImplementedError, self.store.load)
+
+
+class SQLiteStoreTest(unittest.TestCase):
+    """Tests of storing results in SQLite. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.folder_name = tempfile.mkdtemp()
+        self.store = storage.SQLiteStore(self.folder_name)
+        self.store.extend(TEST_ROWS)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.folder_name)
+
+    def testAppend(self):
+        """Test adding a single result."""
+        self.store.append('Flip', [1, 0, 0, 5, 1, 0, ''])
+        self.assertEqual(['Flip', 1, 0, 0, 5, 1, 0, ''], self.store.load()[-1])
+
+    def testGameNames(self):
+        """Test getting the names of the games played."""
+        self.assertEqual(['Flip', 'Pig', 'Sorter'], self.store.game_names())
+
+    def testLen(self):
+        """Test counting the results."""
+        self.assertEqual(4, len(self.store))
+
+    def testLoad(self):
+        """Test loading all of the results."""
+        self.assertEqual(TEST_ROWS, self.store.load())
+
+    def testMigrate(self):
+        """Test migrating results from a text file."""
+        folder_name = tempfile.mkdtemp()
+        try:
+            storage.TextStore(folder_name).extend(TEST_ROWS)
+            store = storage.SQLiteStore(folder_name)
+            self.assertEqual(TEST_ROWS, store.load())
+            store.close()
+        finally:
+            shutil.rmtree(folder_name)
+
+    def testMigrateFailed(self):
+        """Test redoing a failed migration from a text file."""
+        folder_name = tempfile.mkdtemp()
+        try:
+            text_store = storage.TextStore(folder_name)
+            text_store.extend(TEST_ROWS + [['Pig', 'one']])
+            self.assertRaises(storage.sqlite3.Error, storage.SQLiteStore, folder_name)
+            os.remove(text_store.file_name)
+            text_store.extend(TEST_ROWS)
+            store = storage.SQLiteStore(folder_name)
+            self.assertEqual(TEST_ROWS, store.load())
+            store.close()
+        finally:
+            shutil.rmtree(folder_name)
+
+    def testMigrateOnce(self):
+        """Test not migrating results from a text file twice."""
+        folder_name = tempfile.mkdtemp()
+        try:
+            storage.TextStore(folder_name).extend(TEST_ROWS)
+            storage.SQLiteStore(folder_name).close()
+            store = storage.SQLiteStore(folder_name)
+            self.assertEqual(TEST_ROWS, store.load())
+            store.close()
+        finally:
+            shutil.rmtree(folder_name)
+
+    def testPersist(self):
+        """Test reading the results back from the database."""
+        self.store.close()
+        self.store = storage.SQLiteStore(self.folder_name)
+        self.assertEqual(TEST_ROWS, self.store.load())
+
+    def testSelectFlags(self):
+        """Test selecting results by flags."""
+        self.assertEqual(TEST_ROWS[1:3], self.store.select(flags = 3))
+
+    def testSelectGames(self):
+        """Test selecting results by game name."""
+        self.assertEqual([TEST_ROWS[0], TEST_ROWS[2]], self.store.select(['Pig']))
+
+    def testSelectOptions(self):
+        """Test selecting results by options."""
+        self.assertEqual([TEST_ROWS[2]], self.store.select(options = 'score=75'))
+
+    def testSelectStart(self):
+        """Test selecting results after a starting point."""
+        self.assertEqual([TEST_ROWS[2]], self.store.select(['Pig'], start = 1))
+
+    def testSelectStartPast(self):
+        """Test selecting results after the end of the results."""
+        self.assertEqual([], self.store.select(start = 4))
+
+
+class TextStoreTest(unittest.TestCase):
+    """Tests of storing results in a text file. (unittest.TestCase)"""
+
+    def setUp(self):
+        self.folder_name = tempfile.mkdtemp()
+        self.store = storage.TextStore(self.folder_name)
+        self.store.extend(TEST_ROWS)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder_name)
+
+    def testAppend(self):
+        """Test adding a single result."""
+        self.store.append('Flip', [1, 0, 0, 5, 1, 0, ''])
+        self.assertEqual(['Flip', 1, 0, 0, 5, 1, 0, ''], self.store.load()[-1])
+
+    def testCreate(self):
+        """Test creating the text file."""
+        self.assertTrue(os.path.exists(os.path.join(self.folder_name, 'results.txt')))
+
+    def testFormat(self):
+        """Test the format of the text file."""
+        with open(os.path.join(self.folder_name, 'results.txt')) as results_file:
+            lines = results_file.readlines()
+        self.assertEqual('Sorter,1,0,0,8,8,0,a, b, c\n', lines[-1])
+
+    def testLoad(self):
+        """Test loading all of the results."""
+        self.assertEqual(TEST_ROWS, self.store.load())
+
+    def testSelectStart(self):
+        """Test selecting results after a starting point."""
+        self.assertEqual(TEST_ROWS[3:], self.store.select(start = 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,7 @@ NumberWordTests: Tests of converting numbers to words. (unittest.TestCase)
 OxfordTest: Tests of converting Python lists to English lists. (TestCase)
 PluralTest: Tests of getting the singular/plural form. (unittest.TestCase)
 PowTest: Tests of power calculations. (unittest.TestCase)
+RunningMedianTest: Tests of medians updated one value at a time. (TestCase)
 StreakTest: Tests of longest streak calculations. (unittest.TestCase)
 """
 
@@ -339,6 +340,36 @@ class PowTest(unittest.TestCase):
         self.assertEqual(81, utility.pow(3, 4))
 
 
+class RunningMedianTest(unittest.TestCase):
+    """Tests of medians updated one value at a time. (unittest.TestCase)"""
+
+    def testAdd(self):
+        """Test updating a median with a new value."""
+        median = utility.RunningMedian([3, 1, 6, 5, 7])
+        median.add(2)
+        self.assertEqual(4.0, median.median())
+
+    def testEvenList(self):
+        """Test a running median for an even number of values."""
+        self.assertEqual(3.5, utility.RunningMedian([6, 2, 4, 1, 3, 5]).median())
+
+    def testLen(self):
+        """Test counting the values in a running median."""
+        self.assertEqual(5, len(utility.RunningMedian([5, 3, 4, 9, 7])))
+
+    def testMatch(self):
+        """Test a running median matching the median function."""
+        values = [8, 1, 1, 9, 4, 4, 4, 12, -3, 0, 7]
+        median = utility.RunningMedian()
+        for index, value in enumerate(values):
+            median.add(value)
+            self.assertEqual(utility.median(values[:index + 1]), median.median())
+
+    def testOddList(self):
+        """Test a running median for an odd number of values."""
+        self.assertEqual(5, utility.RunningMedian([5, 3, 4, 9, 7]).median())
+
+
 class StreakTest(unittest.TestCase):
     """Tests of longest streak calculations. (unittest.TestCase)"""
 
@@ -64,7 +64,7 @@ class Test(object):
         """
         self.human.held_inputs = held_inputs
         self.menu.menu()
-        return self.human.results[self.human.session_index:]
+        return self.human.store.select(start = self.human.session_index)
 
 
 # Test some text games. (None)
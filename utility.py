@@ -16,6 +16,9 @@ TENS: English words for multiples of 10. (list of str)
 THOUSAND_UP: English words for powers of one thousand. (list of str)
 YES: Synonyms for 'yes'. (set of str)
 
+Classes:
+RunningMedian: A median that can be updated one value at a time. (object)
+
 Functions:
 choose: Combinations [n choose r]. (int)
 flip: Returns a random bit. (int)
@@ -36,6 +39,7 @@ thousand_word: Give the word form of a number less than 100. (str)
 
 
 import collections
+import heapq
 import math
 import os
 import random
@@ -87,6 +91,71 @@ YES = set(['yes', 'y', '1', 'yup', 'sure', 'affirmative', 'yeah', 'indubitably',
 YES.update(['okay', 'darn tootin', 'roger', 'da', 'si'])
 
 
+class RunningMedian(object):
+    """
+    A median that can be updated one value at a time. (object)
+
+    The values are split between two heaps, a max heap of the lower half and a
+    min heap of the upper half. The lower half is kept the same size or one
+    larger than the upper half, so the median is always at the top of the heaps.
+    The median matches that given by the median function.
+
+    Attributes:
+    lower: The lower half of the values, negated for a max heap. (list)
+    upper: The upper half of the values. (list)
+
+    Methods:
+    add: Add a value. (None)
+    median: Get the median of the values added so far. (float)
+
+    Overridden Methods:
+    __init__
+    __len__
+    __repr__
+    """
+
+    def __init__(self, values = ()):
+        """
+        Set up the heaps. (None)
+
+        Parameters:
+        values: The initial values. (seq of float)
+        """
+        self.lower = []
+        self.upper = []
+        for value in values:
+            self.add(value)
+
+    def __len__(self):
+        """The number of values added. (int)"""
+        return len(self.lower) + len(self.upper)
+
+    def __repr__(self):
+        """Generate a debugging text representation. (str)"""
+        return '<RunningMedian of {} values>'.format(len(self))
+
+    def add(self, value):
+        """
+        Add a value. (None)
+
+        Parameters:
+        value: The value to add. (float)
+        """
+        # Push through the lower half to keep the halves ordered.
+        value = -heapq.heappushpop(self.lower, -value)
+        heapq.heappush(self.upper, value)
+        # Rebalance the halves.
+        if len(self.upper) > len(self.lower):
+            heapq.heappush(self.lower, -heapq.heappop(self.upper))
+
+    def median(self):
+        """Get the median of the values added so far. (float)"""
+        if len(self.lower) > len(self.upper):
+            return -self.lower[0]
+        else:
+            return (-self.lower[0] + self.upper[0]) / 2.0
+
+
 def choose(n, r):
     """
     Combinations [n choose r]. (int)